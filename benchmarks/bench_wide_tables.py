@@ -0,0 +1,74 @@
+"""
+Benchmark of the header processing and the column passes of RDFData on very wide synthetic inputs.
+
+Run with:
+    python benchmarks/bench_wide_tables.py [--rows 20] [--columns 500 1000 2000 4000 8000]
+
+The time per column should stay about constant when the number of columns grows.
+"""
+from __future__ import annotations
+
+import argparse
+from time import perf_counter
+
+import pandas as pd
+
+from rdfier.data.header_schema import HeaderSchema, _compile_header
+from rdfier.data.rdf_data import RDFData
+
+
+def wide_table(n_rows: int, n_columns: int) -> pd.DataFrame:
+    """
+    Creates a pivoted table with one subject column, a nested subject column with certainties and
+    n_columns predicate columns.
+
+    Parameters
+    ----------
+    n_rows: int
+        Number of rows.
+    n_columns: int
+        Number of predicate columns.
+    """
+    data = {
+        "coin^^uri": [f"nm:coin{row}" for row in range(n_rows)],
+        "nmo:hasMaterial^^uri**1": ["nm:ar; nm:ae"] * n_rows,
+        "1__rdfs:comment@en": ["alloy"] * n_rows,
+        "1__material^^certainty": ["0.5; 0.5"] * n_rows,
+    }
+    for column in range(n_columns):
+        data[f"nmo:predicate{column}"] = [
+            f"{row * column}" if column % 2 else f"value {row}@en" for row in range(n_rows)
+        ]
+    return pd.DataFrame(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument(
+        "--columns", type=int, nargs="+", default=[500, 1000, 2000, 4000, 8000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'columns':>8} {'header [ms]':>12} {'RDFData [ms]':>13} {'per column [µs]':>16}")
+    for n_columns in args.columns:
+        dataframe = wide_table(args.rows, n_columns)
+
+        _compile_header.cache_clear()
+        start = perf_counter()
+        HeaderSchema.compile(dataframe.columns)
+        header_time = perf_counter() - start
+
+        _compile_header.cache_clear()
+        start = perf_counter()
+        RDFData(dataframe)
+        data_time = perf_counter() - start
+
+        print(
+            f"{n_columns:>8} {header_time * 1e3:>12.1f} {data_time * 1e3:>13.1f}"
+            f" {data_time / n_columns * 1e6:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
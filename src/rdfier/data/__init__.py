@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from .header_schema import HeaderSchema
 from .rdf_data import RDFData
+from .type_language_table import TypeLanguageTable
+from .uncertainty_table import UncertaintyTable
 
-__all__ = ["RDFData"]
+__all__ = ["HeaderSchema", "RDFData", "TypeLanguageTable", "UncertaintyTable"]
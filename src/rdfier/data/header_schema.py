@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Hashable, Iterable, Mapping
+from warnings import warn
+
+GREEK2LATIN = str.maketrans(
+    "ΑαΒβΓγΔδΕεΖζΗηΘθΙιΚκΛλΜμΝνΞξΟοΠπΡρΣσςΤτΥυΦφΧχΨψΩω・•",
+    "AaBbGgDdEeZzHhJjIiKkLlMmNnXxOoPpRrSssTtUuFfQqYyWw..",
+)
+
+
+@dataclass(frozen=True, eq=False)
+class HeaderSchema:
+    """
+        Class that represents the compiled header of an input table. Inputs with the same header share
+    the same HeaderSchema, so the header is only parsed once (see HeaderSchema.compile).
+
+    Attributes
+    ----------
+    header: tuple
+        Column names of the input table.
+    triple_plan: Mapping[str, Mapping[str, frozenset[int]]]
+        Read-only mapping, which saves which columns are interpreted as subjects and their corresponding
+        object and certainty columns.
+    column_names: tuple
+        Column names without subject/object reference markers and datatype/language.
+    column_types_languages: tuple[str, ...]
+        Datatype or language of each column header. Empty, if the header has none.
+    """
+
+    header: tuple
+    triple_plan: Mapping[str, Mapping[str, frozenset]]
+    column_names: tuple
+    column_types_languages: tuple
+
+    @classmethod
+    def compile(cls, header: Iterable[Hashable]) -> HeaderSchema:
+        """
+        Returns the compiled schema of a header. The schemas of the last used headers are cached.
+
+        Parameters
+        ----------
+        header: Iterable[Hashable]
+            Column names of the input table.
+        """
+        return _compile_header(tuple(header))
+
+    def __reduce__(self) -> tuple:
+        # Read-only mappings can't be pickled, so the schema is compiled again from the header:
+        return HeaderSchema.compile, (self.header,)
+
+
+@lru_cache(maxsize=128)
+def _compile_header(header: tuple) -> HeaderSchema:
+    """
+    Function which locates the subject columns and the corresponding objects and reads the datatype/language
+    of all column headers.
+
+    Parameters
+    ----------
+    header: tuple
+        Column names of the input table.
+    """
+    triple_plan: dict = {}
+    plan_ids: dict[str, str] = {}  # Subject reference of the first column is saved as "**"
+    reference_free_names = []
+
+    for index, column in enumerate(header):
+        new_column_name = column
+
+        splitlist = str(new_column_name).split("**")
+        if len(splitlist) == 2:
+            subject_id = splitlist[-1]
+            new_column_name = splitlist[0]
+
+            if index == 0:
+                plan_ids[subject_id] = "**"
+            plan_id = plan_ids.get(subject_id, subject_id)
+
+            if plan_id in triple_plan:
+                if len(triple_plan[plan_id]["subject"]) > 0:
+                    raise SyntaxError("Duplicate subject reference")
+                triple_plan[plan_id]["subject"] = {index}
+
+            else:
+                triple_plan[plan_id] = {
+                    "subject": {index},
+                    "objects": set(),
+                    "certainties": set(),
+                }
+
+        elif len(splitlist) > 2:
+            raise SyntaxError(
+                f"Column {str(column)} has more than one subject reference marker '**'."
+            )
+
+        splitlist = str(new_column_name).split("__")
+        if len(splitlist) == 2:
+            object_id = plan_ids.get(splitlist[0], splitlist[0])
+            new_column_name = splitlist[1]
+
+            if (
+                len(us := new_column_name.split("^^")) > 1
+                and us[-1][:11] == "certainty"
+            ):
+                triple_plan[object_id]["certainties"].add(index)
+            elif object_id in triple_plan:
+                triple_plan[object_id]["objects"].add(index)
+            else:
+                triple_plan[object_id] = {"objects": {index}, "subject": set()}
+
+        elif len(splitlist) > 2:
+            raise SyntaxError(
+                f"Column {str(column)} has more than one object reference marker '__'."
+            )
+
+        elif index != 0:
+            triple_plan["**"]["objects"].add(index)
+
+        if index == 0 and "**" not in triple_plan:
+            triple_plan["**"] = {"objects": set(), "subject": {0}}
+
+        reference_free_names.append(new_column_name)
+
+    column_names = []
+    column_types_languages = []
+    for column in reference_free_names:
+        column_type_language, column_name = get_datatype_language(str(column))
+        column_names.append(column_name if column_name != str(column) else column)
+        column_types_languages.append(column_type_language)
+
+    return HeaderSchema(
+        header=header,
+        triple_plan=MappingProxyType(
+            {
+                plan_id: MappingProxyType(
+                    {key: frozenset(indices) for key, indices in plan.items()}
+                )
+                for plan_id, plan in triple_plan.items()
+            }
+        ),
+        column_names=tuple(column_names),
+        column_types_languages=tuple(column_types_languages),
+    )
+
+
+def get_datatype_language(entry: str) -> tuple[str, str]:
+    """
+    Function which extracts the type/language of a string.
+
+    Parameters
+    ----------
+    entry: str
+        String of a cell entry or column name.
+    """
+    entry = entry.translate(GREEK2LATIN)
+    type_splitlist = entry.split("^^")
+
+    if len(type_splitlist) >= 2:
+        return "^^" + type_splitlist[-1], entry[: -len(type_splitlist[-1]) - 2]
+
+    language_splitlist = entry.split("@")
+
+    if len(language_splitlist) >= 2:
+        if 1 <= len(language_splitlist[-1]) <= 3:
+            return (
+                "@" + language_splitlist[-1],
+                entry[: -len(language_splitlist[-1]) - 1],
+            )
+        else:
+            warn(
+                f'\033[93mEntry "{language_splitlist[-1]}" is not a right language acronym.\033[0m'
+            )
+
+    return "", entry
@@ -1,10 +1,38 @@
 from __future__ import annotations
 
+import csv
+import re
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterator, Mapping, Sequence
 from warnings import warn
 
 import numpy as np
 import pandas as pd
 
+from rdfier.data.header_schema import GREEK2LATIN, HeaderSchema
+from rdfier.data.type_language_table import TypeLanguageTable
+from rdfier.data.uncertainty_table import UncertaintyTable
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Conservative ascii patterns of whole values, whose best fitting datatype is clear without int()/float() probing:
+LONG_PATTERN = r"[ \t\n\r\f\v]*[+-]?[0-9]+[ \t\n\r\f\v]*"
+DECIMAL_PATTERN = r"[ \t\n\r\f\v]*[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?[ \t\n\r\f\v]*"
+BOOLEAN_PATTERN = r"[Tt][Rr][Uu][Ee]|[Ff][Aa][Ll][Ss][Ee]"
+FITTING_DATATYPE_REGEX = re.compile(
+    f"(?P<long>{LONG_PATTERN})|(?P<decimal>{DECIMAL_PATTERN})|(?P<boolean>{BOOLEAN_PATTERN})"
+)
+# Values which don't match the patterns above can only be numbers, if they contain one of:
+NUMBER_CANDIDATE_PATTERN = r"[^\t\n\f\r\x20-\x7e]|_|(?i:inf|nan)"
+NUMBER_CANDIDATE_REGEX = re.compile(NUMBER_CANDIDATE_PATTERN)
+
+# Minimal number of distinct cells, which are parsed by one worker process:
+PARALLEL_MIN_CELLS = 20000
+
 
 class RDFData:
     """
@@ -14,30 +42,278 @@ class RDFData:
     ----------
     data : pd.DataFrame
         Pandas dataframe which includes the data in the defined input format.
-    triple_plan: dict
-        Dictionary to save which columns are interpreted as subjects and their corresponding object columns.
-    types_and_languages: dict
-        Dictionary to save the datatype or language of a value.
-    uncertainties: dict
-        Dictionary with (row, column) of an uncertain cell as key and the uncertainty as value.
+    schema: HeaderSchema
+        Compiled header of the data, which is shared by all inputs with the same header.
+    triple_plan: Mapping
+        Read-only mapping to save which columns are interpreted as subjects and their corresponding object columns.
+    types_and_languages: TypeLanguageTable
+        Columnar table to save the datatypes or languages of the values. Use types_and_languages[(row, column)]
+        to get the list of datatypes/languages of a cell.
+    uncertainties: UncertaintyTable
+        Columnar table to save the uncertainties. Use uncertainties[(row, column)] to get the uncertainty of an
+        uncertain cell.
+    value_codes: dict[int, np.ndarray]
+        Dictionary with the column index as key and a code for each row of the column as value. Cells with the
+        same code have the same cleaned value and datatypes/languages, empty cells have the code -1.
+    row_offset: int
+        Position of the first row in the whole input, if the input is read in chunks.
+    n_jobs: int
+        Number of worker processes, which parse the cells.
     """
 
-    def __init__(self, dataframe: pd.DataFrame) -> None:
+    def __init__(self, dataframe: pd.DataFrame, row_offset: int = 0, n_jobs: int = 1) -> None:
         """
         Parameters
         ----------
         dataframe : pd.DataFrame
             Dataframe of the data which gets pseudorandom uncertainty.
+        row_offset : int
+            Position of the first row of the dataframe in the whole input, if the input is read in chunks.
+        n_jobs : int
+            Number of worker processes, which parse the distinct cells of all columns. With n_jobs > 1 the
+            distinct cells are split into contiguous parts, so only these parts and no dataframe are sent
+            to the workers. The results are merged in the order of the parts.
         """
+        self.row_offset = row_offset
+        self.n_jobs = n_jobs
         self.data = self.data_optimize(dataframe)
-        self.triple_plan: dict = {}
-        self.types_and_languages: dict[tuple[int, int], list[str]] = {}
-        self.uncertainties: dict = {}
+        self.schema = HeaderSchema.compile(self.data.columns)
+        self.triple_plan = self.schema.triple_plan
+        self.types_and_languages = TypeLanguageTable(len(self.data))
+        self.uncertainties = UncertaintyTable(len(self.data))
+        self.value_codes: dict[int, np.ndarray] = {}
 
-        self._generate_triple_plan()
+        self.data.columns = self.schema.column_names  # Rename columns
         self._load_uncertainties()
         self._generate_type_and_language_plan()
 
+    @classmethod
+    def read_csv(
+        cls, path: str | Path, use_arrow: bool = False, n_jobs: int = 1, **kwargs
+    ) -> RDFData:
+        """
+        Reads a csv file into RDFData.
+
+        Parameters
+        ----------
+        path: str | Path
+            Path to the csv file.
+        use_arrow: bool
+            If true, the file is read with the pyarrow csv reader. All columns are kept as Arrow backed strings,
+            which are dictionary encoded, if less than half of the values are distinct. The cells are parsed with
+            pyarrow compute functions, so no Python string is created per cell.
+        n_jobs: int
+            Number of worker processes, which parse the cells (see RDFData).
+        kwargs:
+            Further arguments for pandas.read_csv or, if use_arrow, for pyarrow.csv.ParseOptions (like delimiter).
+        """
+        if not use_arrow:
+            return cls(pd.read_csv(path, **kwargs), n_jobs=n_jobs)
+
+        cls._check_pyarrow()
+        from pyarrow import csv as pa_csv
+
+        parse_options = pa_csv.ParseOptions(**kwargs)
+        table = pa_csv.read_csv(
+            path,
+            parse_options=parse_options,
+            convert_options=cls._get_arrow_convert_options(path, parse_options),
+        )
+        return cls(cls._arrow_to_pandas(table), n_jobs=n_jobs)
+
+    @classmethod
+    def read_csv_chunks(
+        cls,
+        path: str | Path,
+        chunksize: int = 100000,
+        use_arrow: bool = False,
+        n_jobs: int = 1,
+        **kwargs,
+    ) -> Iterator[RDFData]:
+        """
+        Reads a csv file in chunks of rows and yields the RDFData of each chunk, so files larger than
+        the memory can be converted. All columns are read as strings, so that every chunk is interpreted the same way.
+
+        Parameters
+        ----------
+        path: str | Path
+            Path to the csv file.
+        chunksize: int
+            Number of rows of each chunk.
+        use_arrow: bool
+            If true, the file is streamed with the pyarrow csv reader and the chunks are kept as Arrow backed strings
+            (see RDFData.read_csv).
+        n_jobs: int
+            Number of worker processes, which parse the cells of each chunk (see RDFData).
+        kwargs:
+            Further arguments for pandas.read_csv or, if use_arrow, for pyarrow.csv.ParseOptions.
+        """
+        row_offset = 0
+        if use_arrow:
+            cls._check_pyarrow()
+            for table in cls._read_arrow_chunks(path, chunksize, **kwargs):
+                yield cls(
+                    cls._arrow_to_pandas(table), row_offset=row_offset, n_jobs=n_jobs
+                )
+                row_offset += table.num_rows
+            return
+
+        kwargs.setdefault("dtype", str)
+        with pd.read_csv(path, chunksize=chunksize, **kwargs) as reader:
+            for chunk in reader:
+                yield cls(chunk, row_offset=row_offset, n_jobs=n_jobs)
+                row_offset += len(chunk)
+
+    def get_rows(self, start: int, stop: int) -> RDFData:
+        """
+        Returns the RDFData of the rows from start to stop without parsing them again, like the rows of a worker
+        process of the GraphGenerator. The row_offset of the rows is the position of start in the whole input.
+
+        Parameters
+        ----------
+        start: int
+            Position of the first row.
+        stop: int
+            Position after the last row.
+        """
+        rdfdata = copy(self)
+        rdfdata.data = self.data.iloc[start:stop].reset_index(drop=True)
+        rdfdata.row_offset = self.row_offset + start
+        rdfdata.types_and_languages = self.types_and_languages.get_rows(start, stop)
+        rdfdata.uncertainties = self.uncertainties.get_rows(start, stop)
+        rdfdata.value_codes = {col_index: codes[start:stop] for col_index, codes in self.value_codes.items()}
+        return rdfdata
+
+    @staticmethod
+    def get_changed_rows(
+        old_dataframe: pd.DataFrame, new_dataframe: pd.DataFrame
+    ) -> tuple[list[int], list[int]]:
+        """
+        Returns the positions of the changed or added rows and of the deleted rows of two versions of an input
+        (see GraphGenerator.update_rows). The rows are compared by their positions.
+
+        Parameters
+        ----------
+        old_dataframe: pd.DataFrame
+            Old version of the input.
+        new_dataframe: pd.DataFrame
+            New version of the input with the same header.
+        """
+        if not old_dataframe.columns.equals(new_dataframe.columns):
+            raise ValueError("The header of the input changed. The rows can't be compared.")
+
+        n_rows = min(len(old_dataframe), len(new_dataframe))
+        old_values = old_dataframe.iloc[:n_rows].reset_index(drop=True)
+        new_values = new_dataframe.iloc[:n_rows].reset_index(drop=True)
+        differences = (old_values != new_values) & ~(old_values.isna() & new_values.isna())
+
+        changed_rows = np.flatnonzero(differences.to_numpy().any(axis=1)).tolist()
+        changed_rows += list(range(n_rows, len(new_dataframe)))
+        return changed_rows, list(range(n_rows, len(old_dataframe)))
+
+    @staticmethod
+    def _check_pyarrow() -> None:
+        """
+        Raises an ImportError, which explains how to install pyarrow, if it isn't installed. pyarrow is the optional
+        dependency of the arrow extra of rdfier.
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as error:
+            raise ImportError(
+                'Reading csv files with use_arrow=True needs pyarrow. Install it with "poetry install --extras arrow" '
+                'or "pip install rdfier[arrow]".'
+            ) from error
+
+    @staticmethod
+    def _get_arrow_convert_options(path: str | Path, parse_options):
+        """
+        Returns the pyarrow convert options, which read all columns of the csv file as strings.
+
+        Parameters
+        ----------
+        path: str | Path
+            Path to the csv file.
+        parse_options: pyarrow.csv.ParseOptions
+            Options which are used to parse the csv file.
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        with open(path, newline="", encoding="utf-8") as file:
+            header = next(
+                csv.reader(
+                    file,
+                    delimiter=parse_options.delimiter,
+                    quotechar=parse_options.quote_char or '"',
+                ),
+                [],
+            )
+        return pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=True,
+        )
+
+    @classmethod
+    def _read_arrow_chunks(
+        cls, path: str | Path, chunksize: int, **kwargs
+    ) -> Iterator[pa.Table]:
+        """
+        Streams a csv file with the pyarrow csv reader and yields tables with chunksize rows.
+
+        Parameters
+        ----------
+        path: str | Path
+            Path to the csv file.
+        chunksize: int
+            Number of rows of each table.
+        kwargs:
+            Further arguments for pyarrow.csv.ParseOptions.
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        parse_options = pa_csv.ParseOptions(**kwargs)
+        with pa_csv.open_csv(
+            path,
+            parse_options=parse_options,
+            convert_options=cls._get_arrow_convert_options(path, parse_options),
+        ) as reader:
+            batches, n_rows = [], 0
+            for batch in reader:
+                batches.append(batch)
+                n_rows += batch.num_rows
+                while n_rows >= chunksize:
+                    table = pa.Table.from_batches(batches, reader.schema)
+                    yield table.slice(0, chunksize)
+                    batches = table.slice(chunksize).to_batches()
+                    n_rows -= chunksize
+            if n_rows > 0:
+                yield pa.Table.from_batches(batches, reader.schema)
+
+    @staticmethod
+    def _arrow_to_pandas(table: pa.Table) -> pd.DataFrame:
+        """
+        Converts a pyarrow table into a dataframe with Arrow backed columns. Columns with less than half
+        distinct values are dictionary encoded.
+
+        Parameters
+        ----------
+        table: pa.Table
+            Table with string columns.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        columns = []
+        for column in table.columns:
+            if pc.count_distinct(column).as_py() < 0.5 * table.num_rows:
+                column = column.dictionary_encode()
+            columns.append(column)
+        return pa.Table.from_arrays(columns, names=table.column_names).to_pandas(
+            types_mapper=pd.ArrowDtype
+        )
+
     def data_optimize(self, dataframe: pd.DataFrame, object_option=False):
         """
         Reduce the size of the input dataframe
@@ -50,7 +326,8 @@ class RDFData:
             If true, try to convert object to category.
         """
 
-        # loop columns in the dataframe to downcast the dtype
+        # loop columns in the dataframe to find the downcast dtypes
+        downcasts: dict = {}
         for col in dataframe.columns:
             # process the int columns
             if dataframe[col].dtype == "int":
@@ -59,32 +336,28 @@ class RDFData:
                 # if all are non-negative, change to uint
                 if col_min >= 0:
                     if col_max < np.iinfo(np.uint8).max:
-                        dataframe[col] = dataframe[col].astype(np.uint8)
+                        downcasts[col] = np.uint8
                     elif col_max < np.iinfo(np.uint16).max:
-                        dataframe[col] = dataframe[col].astype(np.uint16)
+                        downcasts[col] = np.uint16
                     elif col_max < np.iinfo(np.uint32).max:
-                        dataframe[col] = dataframe[col].astype(np.uint32)
-                    else:
-                        dataframe[col] = dataframe[col]
+                        downcasts[col] = np.uint32
                 else:
                     # if it has negative values, downcast based on the min and max
                     if (
                         col_max < np.iinfo(np.int8).max
                         and col_min > np.iinfo(np.int8).min
                     ):
-                        dataframe[col] = dataframe[col].astype(np.int8)
+                        downcasts[col] = np.int8
                     elif (
                         col_max < np.iinfo(np.int16).max
                         and col_min > np.iinfo(np.int16).min
                     ):
-                        dataframe[col] = dataframe[col].astype(np.int16)
+                        downcasts[col] = np.int16
                     elif (
                         col_max < np.iinfo(np.int32).max
                         and col_min > np.iinfo(np.int32).min
                     ):
-                        dataframe[col] = dataframe[col].astype(np.int32)
-                    else:
-                        dataframe[col] = dataframe[col]
+                        downcasts[col] = np.int32
 
             # process the float columns
             elif dataframe[col].dtype == "float":
@@ -95,253 +368,723 @@ class RDFData:
                     col_min > np.finfo(np.float32).min
                     and col_max < np.finfo(np.float32).max
                 ):
-                    dataframe[col] = dataframe[col].astype(np.float32)
-                else:
-                    dataframe[col] = dataframe[col]
+                    downcasts[col] = np.float32
 
             if object_option:
                 if dataframe[col].dtype == "object":
                     if len(dataframe[col].value_counts()) < 0.5 * dataframe.shape[0]:
-                        dataframe[col] = dataframe[col].astype("category")
-
-        return dataframe
-
-    def _generate_triple_plan(self):
-        """
-        Method which locates the subject columns and the corresponding objects and save them in the triple_plan.
-        """
-        first_col_has_ref = (False, "")
-        first_col_objects = set()
-
-        for index, column in enumerate(self.data):
-            new_column_name = column
-
-            splitlist = str(new_column_name).split("**")
-            if len(splitlist) == 2:
-                subject_id = splitlist[-1]
-                new_column_name = splitlist[0]
-
-                if index == 0:
-                    first_col_has_ref = (True, subject_id)
-
-                if subject_id in self.triple_plan:
-                    if len(self.triple_plan[subject_id]["subject"]) > 0:
-                        raise SyntaxError("Duplicate subject reference")
-                    self.triple_plan[subject_id]["subject"] = {index}
-
-                else:
-                    self.triple_plan[subject_id] = {
-                        "subject": {index},
-                        "objects": set(),
-                        "certainties": set(),
-                    }
-
-            elif len(splitlist) > 2:
-                raise SyntaxError(
-                    f"Column {str(column)} has more than one subject reference marker '**'."
-                )
-
-            splitlist = str(new_column_name).split("__")
-            if len(splitlist) == 2:
-                object_id = splitlist[0]
-                new_column_name = splitlist[1]
-
-                if (
-                    len(us := new_column_name.split("^^")) > 1
-                    and us[-1][:11] == "certainty"
-                ):
-                    self.triple_plan[object_id]["certainties"].add(index)
-                elif object_id in self.triple_plan:
-                    self.triple_plan[object_id]["objects"].add(index)
-                else:
-                    self.triple_plan[object_id] = {
-                        "objects": {index}, "subject": set()}
-
-            elif len(splitlist) > 2:
-                raise SyntaxError(
-                    f"Column {str(column)} has more than one object reference marker '__'."
-                )
+                        downcasts[col] = "category"
 
-            elif index != 0:
-                first_col_objects.add(index)
-
-            if first_col_has_ref[0]:
-                self.triple_plan[first_col_has_ref[1]]["objects"].update(
-                    first_col_objects
-                )
-                self.triple_plan["**"] = self.triple_plan.pop(
-                    first_col_has_ref[1])
-
-            else:
-                self.triple_plan["**"] = {"objects":
-                                          first_col_objects, "subject": {0}}
-
-            self.data.rename({column: new_column_name}, axis=1, inplace=True)
+        # downcast all columns at once
+        return dataframe.astype(downcasts) if downcasts else dataframe
 
     def _load_uncertainties(self) -> None:
         """
-        Takes all uncertainty columns from the triple_plan and load their uncertainties into th uncertainties dictionary.
+        Takes all uncertainty columns from the triple_plan and load their uncertainties into the uncertainties table.
         """
         for plan in self.triple_plan.values():
             if "certainties" in plan:
                 sub_column = next(iter(plan["subject"]))
                 if (lenght := len(plan["certainties"])) == 1:
                     unc_column = next(iter(plan["certainties"]))
-                    for row_index in range(len(self.data)):
-                        if pd.notna(self.data.iat[row_index, unc_column]):
-                            uncertainties = self._get_uncertainty_dict(
-                                str(self.data.iat[row_index, sub_column]),
-                                str(self.data.iat[row_index, unc_column]),
-                            )
-                            if uncertainties:
-                                self.uncertainties[
-                                    (row_index, sub_column)
-                                ] = uncertainties
+                    unc_cells = self.data.iloc[:, unc_column]
+                    rows = np.flatnonzero(unc_cells.notna().to_numpy())
+                    if len(rows) == 0:
+                        continue
+
+                    # Each distinct pair of number of subjects and uncertainty is parsed once:
+                    subjects = self._get_arrow_strings(self.data.iloc[:, sub_column])
+                    if subjects is None:
+                        arities = (
+                            self.data.iloc[rows, sub_column]
+                            .astype(object)
+                            .astype(str)
+                            .str.count(";")
+                            .to_numpy()
+                        )
+                    else:
+                        import pyarrow.compute as pc
+
+                        arities = (
+                            pc.count_substring(subjects.take(rows), ";")
+                            .fill_null(0)
+                            .to_numpy()
+                        )
+
+                    unc_strings = self._get_arrow_strings(unc_cells)
+                    if unc_strings is None:
+                        uncertainties = unc_cells.iloc[rows].astype(object).astype(str).to_numpy()
+                    else:
+                        encoded = unc_strings.take(rows).dictionary_encode()
+                        uncertainties = pd.Categorical.from_codes(
+                            encoded.indices.to_numpy(), encoded.dictionary.to_pylist()
+                        )
+
+                    codes, pairs = pd.MultiIndex.from_arrays(
+                        [arities + 1, uncertainties]
+                    ).factorize()
+
+                    self.uncertainties.add_column(
+                        sub_column,
+                        rows,
+                        codes,
+                        [
+                            self._get_uncertainty(arity, uncertainty)
+                            for arity, uncertainty in pairs
+                        ],
+                    )
                 elif lenght > 1:
                     raise SyntaxError(
                         f"Subject-column {self.data.columns[sub_column]} has more than one certainty-column."
                     )
 
-    def _get_uncertainty_dict(self, subjects: str, uncertainty: str) -> dict:
+    @staticmethod
+    def _get_uncertainty(arity: int, uncertainty: str) -> Mapping | None:
         """
-        Method to generate a dictionary with all important informations about a uncertain statement
-        like if it has alternatives and which weights.
+        Method to generate a read-only mapping with all important informations about a uncertain statement
+        like if it has alternatives and which weights. Each distinct uncertainty of a column is read once and
+        equal mappings are saved once by the UncertaintyTable.
 
         Parameters
         ----------
-        subjects: str
-            String of the subject(s) which get(s) the uncertainty. The uncertain statement is a nested statement and
+        arity: int
+            Number of subjects which get the uncertainty. The uncertain statement is a nested statement and
             refers to the statement which has the subject(s) as its object(s).
         uncertainty: str
             String of the uncertainty mode. Can be `u` for uncertain or `a` for alternatives. Will be removed in a future release.
+
+        Returns
+        -------
+        Mapping | None
+            The uncertainty or None, if the statement is certain or the uncertainty could not be read.
         """
         uncertainty = uncertainty.strip().lower()
-        sub_splitlist = subjects.split(";")
         unc_splitlist = uncertainty.split(";")
 
         if uncertainty == "c":
-            return dict()
-        elif uncertainty == "ou" and len(sub_splitlist) == 1:
-            return {"mode": "ou"}
-        elif uncertainty == "a" and len(sub_splitlist) > 1:
-            return {"mode": "a"}
+            return None
+        elif uncertainty == "ou" and arity == 1:
+            return MappingProxyType({"mode": "ou"})
+        elif uncertainty == "a" and arity > 1:
+            return MappingProxyType({"mode": "a"})
         elif uncertainty == "au":
-            return {"mode": "au"}
+            return MappingProxyType({"mode": "au"})
         elif uncertainty == "u":
-            return {"mode": "u"}
+            return MappingProxyType({"mode": "u"})
         elif len(unc_splitlist) == 1:
             try:
                 numb = float(uncertainty)
                 if 0 <= numb < 1:
-                    return {"mode": "ou", "weights": [numb]}
+                    return MappingProxyType({"mode": "ou", "weights": (numb,)})
                 elif numb == 1:
-                    return dict()
+                    return None
                 elif not pd.isna(numb):
                     warn(
                         f'\033[93mUncertainty "{uncertainty}" out of bounds. No uncertainty will be transmit.\033[0m'
                     )
-                    return dict()
+                return None
             except:
-                return dict()
-        elif len(sub_splitlist) == len(unc_splitlist):
+                return None
+        elif arity == len(unc_splitlist):
             try:
-                unc_splitlist = [float(elem) for elem in unc_splitlist]
+                weights = tuple(float(elem) for elem in unc_splitlist)
             except:
-                return dict()
-            if all(isinstance(n, float) for n in unc_splitlist):
-                if sum(unc_splitlist) == 1:
-                    return {"mode": "a", "weights": unc_splitlist}
-                elif 0 <= sum(unc_splitlist) < 1:
-                    return {"mode": "au", "weights": unc_splitlist}
+                return None
+            if sum(weights) == 1:
+                return MappingProxyType({"mode": "a", "weights": weights})
+            elif 0 <= sum(weights) < 1:
+                return MappingProxyType({"mode": "au", "weights": weights})
             warn(
                 f'\033[93mUnknown distribution "{uncertainty}". No uncertainties will be transmit.\033[0m'
             )
-            return dict()
-        elif len(sub_splitlist) != len(unc_splitlist):
-            warn(
-                f'\033[93mEntry "{subjects}" hasn\'t the correct number of uncertainties "{uncertainty}".'
-                f" No uncertainties will be transmit.\033[0m"
-            )
-            return dict()
+            return None
         else:
             warn(
-                f'\033[93mEntry "{subjects}" hasn\'t identiefiable uncertainties "{uncertainty}". '
-                f"No uncertainties will be transmit.\033[0m"
+                f'\033[93mEntry with {arity} values hasn\'t the correct number of uncertainties "{uncertainty}".'
+                f" No uncertainties will be transmit.\033[0m"
             )
-            return dict()
+            return None
 
     def _generate_type_and_language_plan(self) -> None:
         """
-        Method which read the datatype/language of all columns.
-        """
-        # Column type or language:
-        for col_index, column in enumerate(self.data):
-            column_type_language, column_name = self._get_datatype_language(
-                str(column))
-
-            # Entry type or language:
-            for cell_index, cell in enumerate(self.data.iloc[:, col_index]):
-                if pd.notnull(cell):
-                    splitlist = str(cell).split(";")
-                    cell_types_languages = splitlist.copy()
-                    for entry_index, entry in enumerate(splitlist):
-                        tl, entry_name = self._get_datatype_language(entry)
-                        splitlist[entry_index] = entry_name.strip()
-                        cell_types_languages[entry_index] = (
-                            tl.strip()
-                            if tl != ""
-                            else column_type_language
-                            if column_type_language != ""
-                            else self._get_fitting_datatype(entry)
-                        )
+        Method which read the datatype/language of all columns. The cells of all object columns and of all
+        Arrow backed columns are parsed at once.
+        """
+        n_columns = self.data.shape[1]
+        arrow_columns = {}
+        for col_index in range(n_columns):
+            strings = self._get_arrow_strings(self.data.iloc[:, col_index])
+            if strings is not None:
+                arrow_columns[col_index] = strings
 
-                    self.types_and_languages[
-                        (cell_index, col_index)
-                    ] = cell_types_languages
+        columns = self._parse_object_columns(
+            [col_index for col_index in range(n_columns) if col_index not in arrow_columns]
+        )
+        if arrow_columns:
+            columns.update(self._parse_arrow_columns(arrow_columns))
+
+        # Rename cells of all columns at once:
+        self.data = pd.DataFrame(
+            {col_index: columns[col_index] for col_index in range(n_columns)},
+            index=self.data.index,
+        )
+        self.data.columns = self.schema.column_names
 
-                    self.data.iat[cell_index, col_index] = "; ".join(
-                        splitlist
-                    )  # Rename cell
+    def _parse_object_columns(self, col_indices: list[int]) -> dict:
+        """
+        Method which reads the datatype/language of the given numpy backed columns. Each distinct pair of
+        cell value and column header datatype/language is parsed only once.
 
-            if column_name != str(column):
-                # Rename column
-                self.data.columns.values[col_index] = column_name
+        Parameters
+        ----------
+        col_indices: list[int]
+            Indices of the columns.
 
-    def _get_datatype_language(self, entry: str) -> tuple[str, str]:
+        Returns
+        -------
+        dict
+            The cleaned columns with the column index as key.
         """
-        Method which extracts the type/language of a string.
+        values = [
+            self.data.iloc[:, col_index].to_numpy(dtype=object)
+            for col_index in col_indices
+        ]
+        notna = [pd.notna(column_values) for column_values in values]
+
+        cell_columns = np.repeat(
+            np.arange(len(col_indices)), [np.count_nonzero(mask) for mask in notna]
+        )
+        cell_rows = np.concatenate(
+            [np.flatnonzero(mask) for mask in notna] + [np.zeros(0, dtype=np.int64)]
+        )
+        cells = (
+            pd.Series(
+                np.concatenate(
+                    [column_values[mask] for column_values, mask in zip(values, notna)]
+                    + [np.zeros(0, dtype=object)]
+                ),
+                dtype=object,
+            )
+            .astype(str)
+            .to_numpy()
+        )
+        tag_codes, tags = pd.factorize(np.array(self.schema.column_types_languages, dtype=object))
+        cell_codes, distinct_cells = pd.factorize(cells)
+        value_codes, distinct_cell_codes, distinct_tag_codes = self._intern_cells(
+            cell_codes, tag_codes[np.array(col_indices, dtype=np.int64)][cell_columns], len(tags)
+        )
+        cleaned, entry_counts, types_languages = self._parse_in_parts(
+            self._parse_cells,
+            np.asarray(distinct_cells, dtype=object)[distinct_cell_codes],
+            np.asarray(tags, dtype=object)[distinct_tag_codes],
+        )
+        entry_positions = self._get_entry_positions(value_codes, entry_counts)
+        cleaned, entry_counts, types_languages = (
+            cleaned[value_codes], entry_counts[value_codes], types_languages[entry_positions]
+        )
+
+        # Split the results into the columns:
+        cell_bounds = np.searchsorted(cell_columns, np.arange(len(col_indices) + 1))
+        entry_bounds = np.r_[0, np.cumsum(entry_counts)][cell_bounds]
+        columns = {}
+        for position, col_index in enumerate(col_indices):
+            start, end = cell_bounds[position], cell_bounds[position + 1]
+            if start == end:
+                columns[col_index] = self.data.iloc[:, col_index].array
+                continue
+
+            self.types_and_languages.add_column(
+                col_index,
+                cell_rows[start:end],
+                entry_counts[start:end],
+                types_languages[entry_bounds[position]: entry_bounds[position + 1]],
+            )
+            self._add_value_codes(col_index, cell_rows[start:end], value_codes[start:end])
+
+            values[position] = values[position].copy()
+            values[position][cell_rows[start:end]] = cleaned[start:end]
+            columns[col_index] = values[position]
+
+        return columns
+
+    def _parse_arrow_columns(self, arrays: dict[int, pa.Array]) -> dict:
+        """
+        Method which reads the datatype/language of the given Arrow backed columns. Each distinct pair of
+        cell value and column header datatype/language is parsed only once. The cleaned columns stay Arrow
+        backed and dictionary encoded columns are encoded again.
 
         Parameters
         ----------
-        entry: str
-            String of a cell entry.
+        arrays: dict[int, pa.Array]
+            Large string arrays of the columns with the column index as key.
+
+        Returns
+        -------
+        dict
+            The cleaned columns with the column index as key.
         """
-        greek2latin = str.maketrans(
-            "ΑαΒβΓγΔδΕεΖζΗηΘθΙιΚκΛλΜμΝνΞξΟοΠπΡρΣσςΤτΥυΦφΧχΨψΩω・•",
-            "AaBbGgDdEeZzHhJjIiKkLlMmNnXxOoPpRrSssTtUuFfQqYyWw..",
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        col_indices = list(arrays)
+        cell_counts = [
+            len(arrays[col_index]) - arrays[col_index].null_count
+            for col_index in col_indices
+        ]
+        cell_columns = np.repeat(np.array(col_indices, dtype=np.int64), cell_counts)
+        cells = pa.concat_arrays(
+            [arrays[col_index].drop_null() for col_index in col_indices]
+        ).dictionary_encode()
+        tag_codes, tags = pd.factorize(np.array(self.schema.column_types_languages, dtype=object))
+        value_codes, distinct_cell_codes, distinct_tag_codes = self._intern_cells(
+            cells.indices.to_numpy(), tag_codes[cell_columns], len(tags)
         )
-        entry = entry.translate(greek2latin)
-        type_splitlist = entry.split("^^")
+        cleaned, entry_counts, types_languages = self._parse_in_parts(
+            self._parse_arrow_cells,
+            cells.dictionary.take(pa.array(distinct_cell_codes)),
+            pa.array(list(tags), pa.large_string()).take(pa.array(distinct_tag_codes)),
+        )
+        entry_positions = self._get_entry_positions(value_codes, entry_counts)
+        cleaned, entry_counts, types_languages = (
+            cleaned.take(pa.array(value_codes)),
+            entry_counts[value_codes],
+            types_languages.take(pa.array(entry_positions)),
+        )
+
+        # Split the results into the columns:
+        cell_bounds = np.r_[0, np.cumsum(cell_counts)]
+        entry_bounds = np.r_[0, np.cumsum(entry_counts)][cell_bounds]
+        columns = {}
+        for position, col_index in enumerate(col_indices):
+            start, end = cell_bounds[position], cell_bounds[position + 1]
+            if start == end:
+                columns[col_index] = self.data.iloc[:, col_index].array
+                continue
+
+            array = arrays[col_index]
+            rows = np.flatnonzero(array.is_valid().to_numpy(zero_copy_only=False))
+            self.types_and_languages.add_column(
+                col_index,
+                rows,
+                entry_counts[start:end],
+                pd.arrays.ArrowExtensionArray(
+                    types_languages[entry_bounds[position]: entry_bounds[position + 1]]
+                ),
+            )
+            self._add_value_codes(col_index, rows, value_codes[start:end])
+
+            column = pc.replace_with_mask(
+                array, array.is_valid(), cleaned.slice(start, end - start)
+            )
+            dtype = self.data.dtypes.iloc[col_index]
+            if isinstance(dtype, pd.ArrowDtype) and pa.types.is_dictionary(dtype.pyarrow_dtype):
+                column = column.dictionary_encode()
+            columns[col_index] = pd.arrays.ArrowExtensionArray(column)
 
-        if len(type_splitlist) >= 2:
-            return "^^" + type_splitlist[-1], entry[: -len(type_splitlist[-1]) - 2]
+        return columns
 
-        language_splitlist = entry.split("@")
+    def _parse_in_parts(self, parse, cells, column_types_languages) -> tuple:
+        """
+        Runs the parse method on contiguous parts of the cells in a process pool, if n_jobs > 1 and there
+        are enough cells, and concatenates the results in the order of the parts.
+
+        Parameters
+        ----------
+        parse:
+            RDFData._parse_cells or RDFData._parse_arrow_cells.
+        cells: np.ndarray | pa.Array
+            Distinct cells.
+        column_types_languages: np.ndarray | pa.Array
+            Datatype or language of the column header of each cell.
+        """
+        n_parts = min(self.n_jobs, len(cells) // PARALLEL_MIN_CELLS)
+        if n_parts <= 1:
+            return parse(cells, column_types_languages)
 
-        if len(language_splitlist) >= 2:
-            if 1 <= len(language_splitlist[-1]) <= 3:
-                return (
-                    "@" + language_splitlist[-1],
-                    entry[: -len(language_splitlist[-1]) - 1],
+        bounds = np.linspace(0, len(cells), n_parts + 1).astype(int).tolist()
+        parts = list(zip(bounds[:-1], bounds[1:]))
+        with ProcessPoolExecutor(max_workers=n_parts) as executor:
+            results = list(
+                executor.map(
+                    parse,
+                    [self._get_part(cells, start, end) for start, end in parts],
+                    [
+                        self._get_part(column_types_languages, start, end)
+                        for start, end in parts
+                    ],
                 )
-            else:
+            )
+        return tuple(self._concatenate(parts) for parts in zip(*results))
+
+    @staticmethod
+    def _get_part(values: np.ndarray | pa.Array, start: int, end: int) -> np.ndarray | pa.Array:
+        """
+        Returns a compact copy of values[start:end], so only the part is sent to a worker process.
+        """
+        if isinstance(values, np.ndarray):
+            return values[start:end]
+
+        import pyarrow as pa
+
+        return pa.concat_arrays([values[start:end]])
+
+    @staticmethod
+    def _concatenate(parts: Sequence) -> np.ndarray | pa.Array:
+        """
+        Concatenates numpy or pyarrow arrays.
+        """
+        if isinstance(parts[0], np.ndarray):
+            return np.concatenate(parts)
+
+        import pyarrow as pa
+
+        return pa.concat_arrays(parts)
+
+    @staticmethod
+    def _intern_cells(
+        cell_codes: np.ndarray, tag_codes: np.ndarray, n_tags: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the distinct pairs of cell value and column header datatype/language.
+
+        Parameters
+        ----------
+        cell_codes: np.ndarray
+            Code of the value of each cell.
+        tag_codes: np.ndarray
+            Code of the column header datatype/language of each cell.
+        n_tags: int
+            Number of distinct column header datatypes/languages.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The code of the pair of each cell and the value and header codes of each distinct pair.
+        """
+        value_codes, keys = pd.factorize(
+            cell_codes.astype(np.int64) * max(n_tags, 1) + tag_codes
+        )
+        return value_codes, keys // max(n_tags, 1), keys % max(n_tags, 1)
+
+    @staticmethod
+    def _get_entry_positions(value_codes: np.ndarray, entry_counts: np.ndarray) -> np.ndarray:
+        """
+        Returns the positions of the entries of all cells in the entries of the distinct cells.
+
+        Parameters
+        ----------
+        value_codes: np.ndarray
+            Code of the distinct cell of each cell.
+        entry_counts: np.ndarray
+            Number of entries of each distinct cell.
+        """
+        counts = entry_counts[value_codes]
+        starts = np.r_[0, np.cumsum(entry_counts)][value_codes]
+        cell_starts = np.r_[0, np.cumsum(counts)][:-1]
+        return np.repeat(starts - cell_starts, counts) + np.arange(counts.sum())
+
+    def _add_value_codes(self, col_index: int, rows: np.ndarray, codes: np.ndarray) -> None:
+        """
+        Saves the codes of the non empty cells of a column in value_codes.
+
+        Parameters
+        ----------
+        col_index: int
+            Index of the column.
+        rows: np.ndarray
+            Row positions of the non empty cells.
+        codes: np.ndarray
+            Codes of the non empty cells.
+        """
+        column_codes = np.full(
+            len(self.data), -1, dtype=np.min_scalar_type(-(int(codes.max()) + 1))
+        )
+        column_codes[rows] = codes
+        self.value_codes[col_index] = column_codes
+
+    @classmethod
+    def _parse_cells(
+        cls, cells: np.ndarray, column_types_languages: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Method which splits the cells into their entries and reads the datatype/language of every entry at once.
+
+        Parameters
+        ----------
+        cells: np.ndarray
+            Non empty cells.
+        column_types_languages: np.ndarray
+            Datatype or language of the column header of each cell, which is used for entries without their own.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The cleaned cells, the number of entries of each cell and the datatypes/languages of all entries.
+        """
+        if len(cells) == 0:
+            return cells, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=object)
+
+        entries = pd.Series(cells, dtype=object).astype(str).str.split(";").explode()
+        rows = entries.index.to_numpy()
+        entries = entries.reset_index(drop=True)
+        translated = entries.str.translate(GREEK2LATIN)
+        names = translated.to_numpy(copy=True)
+        types_languages = np.full(len(entries), "", dtype=object)
+
+        # Datatypes:
+        typed = translated.str.contains("^^", regex=False).to_numpy()
+        if typed.any():
+            type_parts = translated[typed].str.rpartition("^^")
+            names[typed] = type_parts[0]
+            types_languages[typed] = ("^^" + type_parts[2]).str.strip()
+
+        # Languages:
+        has_language = ~typed & translated.str.contains("@", regex=False).to_numpy()
+        languaged = np.zeros(len(entries), dtype=bool)
+        if has_language.any():
+            language_parts = translated[has_language].str.rpartition("@")
+            length = language_parts[2].str.len()
+            valid = ((1 <= length) & (length <= 3)).to_numpy()
+            for acronym in language_parts[2][~valid].unique():
                 warn(
-                    f'\033[93mEntry "{language_splitlist[-1]}" is not a right language acronym.\033[0m'
-                )
+                    f'\033[93mEntry "{acronym}" is not a right language acronym.\033[0m')
+
+            languaged[np.flatnonzero(has_language)[valid]] = True
+            names[languaged] = language_parts[0][valid]
+            types_languages[languaged] = ("@" + language_parts[2][valid]).str.strip()
+
+        names = pd.Series(names, dtype=object).str.strip().tolist()
+
+        # Datatypes/languages of the column headers or best fitting datatypes:
+        untagged = ~(typed | languaged)
+        column_types_languages = column_types_languages[rows]
+        headed = untagged & (column_types_languages != "")
+        types_languages[headed] = column_types_languages[headed]
+        unheaded = untagged & ~headed
+        if unheaded.any():
+            types_languages[unheaded] = cls._get_fitting_datatypes(entries[unheaded])
+
+        # Merge the entries of each cell:
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        ends = np.r_[starts[1:], len(rows)]
+        cleaned = np.array(
+            [
+                names[start] if end - start == 1 else "; ".join(names[start:end])
+                for start, end in zip(starts.tolist(), ends.tolist())
+            ],
+            dtype=object,
+        )
+
+        return cleaned, ends - starts, types_languages
+
+    @classmethod
+    def _parse_arrow_cells(
+        cls, cells: pa.Array, column_types_languages: pa.Array
+    ) -> tuple[pa.Array, np.ndarray, pa.Array]:
+        """
+        Method which splits the cells into their entries and reads the datatype/language of every entry
+        with pyarrow compute functions. Python strings are only created for entries with non ascii characters
+        and for the distinct entries, whose datatype has to be guessed.
+
+        Parameters
+        ----------
+        cells: pa.Array
+            Large string array of the non empty cells.
+        column_types_languages: pa.Array
+            Datatype or language of the column header of each cell, which is used for entries without their own.
+
+        Returns
+        -------
+        tuple[pa.Array, np.ndarray, pa.Array]
+            The cleaned cells, the number of entries of each cell and the datatypes/languages of all entries.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        large_string = pa.large_string()
+        cell_entries = pc.split_pattern(cells, ";")
+        entries = pc.list_flatten(cell_entries)
+        entry_counts = np.diff(cell_entries.offsets.to_numpy())
+
+        # Translate greek letters:
+        translated = entries
+        non_ascii = pc.invert(pc.string_is_ascii(entries))
+        if pc.any(non_ascii).as_py():
+            translated = pc.replace_with_mask(
+                entries,
+                non_ascii,
+                pa.array(
+                    [
+                        entry.translate(GREEK2LATIN)
+                        for entry in entries.filter(non_ascii).to_pylist()
+                    ],
+                    large_string,
+                ),
+            )
+
+        # Datatypes:
+        type_parts = pc.extract_regex(translated, r"(?s)^(?P<name>.*)\^\^(?P<tag>.*)$")
+        typed = type_parts.is_valid()
+
+        # Languages:
+        language_parts = pc.extract_regex(translated, r"(?s)^(?P<name>.*)@(?P<tag>[^@]*)$")
+        has_language = pc.and_not(language_parts.is_valid(), typed)
+        length = pc.utf8_length(language_parts.field("tag"))
+        valid = pc.and_(pc.greater_equal(length, 1), pc.less_equal(length, 3))
+        for acronym in pc.unique(
+            language_parts.field("tag").filter(pc.and_not(has_language, valid))
+        ).to_pylist():
+            warn(f'\033[93mEntry "{acronym}" is not a right language acronym.\033[0m')
+        languaged = pc.and_(has_language, valid)
+
+        names = pc.utf8_trim_whitespace(
+            pc.if_else(
+                typed,
+                type_parts.field("name"),
+                pc.if_else(languaged, language_parts.field("name"), translated),
+            )
+        )
+        empty = pa.scalar("", large_string)
+        types_languages = pc.utf8_trim_whitespace(
+            pc.if_else(
+                typed,
+                pc.binary_join_element_wise(
+                    pa.scalar("^^", large_string), type_parts.field("tag"), empty
+                ),
+                pc.if_else(
+                    languaged,
+                    pc.binary_join_element_wise(
+                        pa.scalar("@", large_string), language_parts.field("tag"), empty
+                    ),
+                    empty,
+                ),
+            )
+        )
+
+        # Datatypes/languages of the column headers or best fitting datatypes:
+        untagged = pc.invert(pc.or_(typed, languaged))
+        column_types_languages = column_types_languages.take(
+            pc.list_parent_indices(cell_entries)
+        )
+        headed = pc.and_(untagged, pc.not_equal(column_types_languages, ""))
+        types_languages = pc.if_else(headed, column_types_languages, types_languages)
+        unheaded = pc.and_not(untagged, headed)
+        if pc.any(unheaded).as_py():
+            types_languages = pc.replace_with_mask(
+                types_languages,
+                unheaded,
+                cls._get_arrow_fitting_datatypes(entries.filter(unheaded)),
+            )
+
+        # Merge the entries of each cell:
+        cleaned = pc.binary_join(
+            pa.ListArray.from_arrays(cell_entries.offsets, names),
+            pa.scalar("; ", large_string),
+        )
+
+        return cleaned, entry_counts, types_languages
+
+    @staticmethod
+    def _get_arrow_strings(column: pd.Series) -> pa.Array | None:
+        """
+        Returns the values of an Arrow backed column as large string array or None, if the column isn't Arrow backed.
+
+        Parameters
+        ----------
+        column: pd.Series
+            Column of the data.
+        """
+        dtype = column.dtype
+        if not (
+            isinstance(dtype, pd.ArrowDtype)
+            or (isinstance(dtype, pd.StringDtype) and dtype.storage.startswith("pyarrow"))
+        ):
+            return None
+
+        import pyarrow as pa
+
+        strings = pa.array(column.array).cast(pa.large_string())
+        if isinstance(strings, pa.ChunkedArray):
+            strings = strings.combine_chunks()
+        return strings
+
+    @classmethod
+    def _get_fitting_datatypes(cls, entries: pd.Series) -> np.ndarray:
+        """
+        Method which finds the best fitting datatypes of many values at once. Values which match one of the
+        conservative datatype patterns or can't be a number are classified with a single regex match, only
+        the remaining values are probed with int()/float().
+
+        Parameters
+        ----------
+        entries : pd.Series
+            Values for which no datatype or language was specified.
+        """
+        datatypes = np.full(len(entries), "", dtype=object)
+        for index, entry in enumerate(entries.tolist()):
+            if match := FITTING_DATATYPE_REGEX.fullmatch(entry):
+                datatypes[index] = f"^^xsd:{match.lastgroup}"
+            elif NUMBER_CANDIDATE_REGEX.search(entry):
+                datatypes[index] = cls._get_fitting_datatype(entry)
+        return datatypes
 
-        return "", entry
+    @classmethod
+    def _get_arrow_fitting_datatypes(cls, entries: pa.Array) -> pa.Array:
+        """
+        Method which finds the best fitting datatypes of many values at once with pyarrow compute functions
+        (see RDFData._get_fitting_datatypes).
 
-    def _get_fitting_datatype(self, string: str) -> str:
+        Parameters
+        ----------
+        entries : pa.Array
+            Large string array of the values for which no datatype or language was specified.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        large_string = pa.large_string()
+        longs = pc.match_substring_regex(entries, f"^(?:{LONG_PATTERN})$")
+        decimals = pc.and_not(
+            pc.match_substring_regex(entries, f"^(?:{DECIMAL_PATTERN})$"), longs
+        )
+        booleans = pc.match_substring_regex(entries, f"^(?:{BOOLEAN_PATTERN})$")
+        datatypes = pc.if_else(
+            longs,
+            pa.scalar("^^xsd:long", large_string),
+            pc.if_else(
+                decimals,
+                pa.scalar("^^xsd:decimal", large_string),
+                pc.if_else(
+                    booleans,
+                    pa.scalar("^^xsd:boolean", large_string),
+                    pa.scalar("", large_string),
+                ),
+            ),
+        )
+
+        unclear = pc.and_not(
+            pc.match_substring_regex(entries, NUMBER_CANDIDATE_PATTERN),
+            pc.or_(pc.or_(longs, decimals), booleans),
+        )
+        if pc.any(unclear).as_py():
+            unclear_entries = entries.filter(unclear)
+            distinct_entries = pc.unique(unclear_entries)
+            fitting_datatypes = pa.array(
+                [
+                    cls._get_fitting_datatype(entry)
+                    for entry in distinct_entries.to_pylist()
+                ],
+                large_string,
+            )
+            datatypes = pc.replace_with_mask(
+                datatypes,
+                unclear,
+                fitting_datatypes.take(pc.index_in(unclear_entries, distinct_entries)),
+            )
+        return datatypes
+
+    @staticmethod
+    def _get_fitting_datatype(string: str) -> str:
         """
             Method which tries to find the best fitting datatype of a value.
 
@@ -366,3 +1109,13 @@ class RDFData:
             return "^^xsd:boolean"
         else:
             return ""
+
+    def __getstate__(self) -> dict:
+        # The triple plan is a read-only mapping of the schema and is restored from it after unpickling:
+        state = self.__dict__.copy()
+        del state["triple_plan"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.triple_plan = self.schema.triple_plan
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+
+class TypeLanguageTable:
+    """
+        Class which stores the datatypes and languages of all cell entries column by column.
+
+    Every distinct datatype or language is saved once in the tags list. For each column the
+    entries are saved as integer codes into this list, together with offsets which mark the
+    codes of each row. Multiple entries of a cell (separated by ";") have consecutive codes.
+
+    Attributes
+    ----------
+    n_rows: int
+        Number of rows of the data.
+    tags: list[str]
+        List of all distinct datatypes and languages.
+    columns: dict[int, tuple[np.ndarray, np.ndarray]]
+        Dictionary with the column index as key and the offsets and codes of the column as value.
+        The codes of row r are codes[offsets[r]:offsets[r + 1]].
+    """
+
+    def __init__(self, n_rows: int) -> None:
+        """
+        Parameters
+        ----------
+        n_rows: int
+            Number of rows of the data.
+        """
+        self.n_rows = n_rows
+        self.tags: list[str] = []
+        self.columns: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        self._tag_codes: dict[str, int] = {}
+
+    def add_column(
+        self,
+        col_index: int,
+        rows: np.ndarray,
+        entry_counts: np.ndarray,
+        types_languages: np.ndarray,
+    ) -> None:
+        """
+        Saves the datatypes and languages of all non empty cells of a column.
+
+        Parameters
+        ----------
+        col_index: int
+            Index of the column.
+        rows: np.ndarray
+            Row positions of the non empty cells in ascending order.
+        entry_counts: np.ndarray
+            Number of entries of each non empty cell.
+        types_languages: np.ndarray
+            Datatypes and languages of all entries in row order.
+        """
+        counts = np.zeros(self.n_rows, dtype=np.int64)
+        counts[rows] = entry_counts
+        offsets = np.zeros(self.n_rows + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        if offsets[-1] < np.iinfo(np.int32).max:
+            offsets = offsets.astype(np.int32)
+
+        column_codes, uniques = pd.factorize(types_languages)
+        table_codes = np.array(
+            [self._get_tag_code(tag) for tag in uniques], dtype=np.int64)
+        codes = table_codes[column_codes].astype(
+            np.min_scalar_type(max(len(self.tags) - 1, 0))
+        )
+
+        self.columns[col_index] = (offsets, codes)
+
+    def get(self, row_index: int, col_index: int) -> list[str]:
+        """
+        Returns the datatypes and languages of all entries of a cell.
+
+        Parameters
+        ----------
+        row_index: int
+            Row position of the cell.
+        col_index: int
+            Column index of the cell.
+        """
+        if col_index not in self.columns:
+            raise KeyError((row_index, col_index))
+        offsets, codes = self.columns[col_index]
+        start, end = offsets[row_index], offsets[row_index + 1]
+        if start == end:
+            raise KeyError((row_index, col_index))
+        return [self.tags[code] for code in codes[start:end]]
+
+    def get_rows(self, start: int, stop: int) -> TypeLanguageTable:
+        """
+        Returns a table of the rows from start to stop, which shares the tags of this table.
+
+        Parameters
+        ----------
+        start: int
+            Position of the first row.
+        stop: int
+            Position after the last row.
+        """
+        start, stop = min(start, self.n_rows), min(stop, self.n_rows)
+        table = TypeLanguageTable(stop - start)
+        table.tags, table._tag_codes = self.tags, self._tag_codes
+        for col_index, (offsets, codes) in self.columns.items():
+            table.columns[col_index] = (
+                offsets[start:stop + 1] - offsets[start],
+                codes[offsets[start]:offsets[stop]],
+            )
+        return table
+
+    def _get_tag_code(self, tag: str) -> int:
+        """
+        Returns the code of a datatype or language and adds it to the tags, if it's new.
+
+        Parameters
+        ----------
+        tag: str
+            Datatype or language.
+        """
+        if tag not in self._tag_codes:
+            self._tag_codes[tag] = len(self.tags)
+            self.tags.append(tag)
+        return self._tag_codes[tag]
+
+    def __getitem__(self, key: tuple[int, int]) -> list[str]:
+        return self.get(*key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or key[1] not in self.columns:
+            return False
+        offsets = self.columns[key[1]][0]
+        return bool(offsets[key[0]] != offsets[key[0] + 1])
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        for col_index, (offsets, _) in self.columns.items():
+            for row_index in np.flatnonzero(np.diff(offsets)).tolist():
+                yield (row_index, col_index)
+
+    def __len__(self) -> int:
+        return sum(
+            int(np.count_nonzero(np.diff(offsets))) for offsets, _ in self.columns.values()
+        )
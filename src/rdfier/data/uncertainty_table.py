@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Iterator, Mapping
+
+import numpy as np
+
+
+class UncertaintyTable:
+    """
+        Class which stores the uncertainties of all uncertain cells column by column.
+
+    Every distinct uncertainty is saved once in the values list. For each column with uncertainties
+    the rows are saved as integer codes into this list, where -1 marks a certain cell.
+
+    Attributes
+    ----------
+    n_rows: int
+        Number of rows of the data.
+    values: list[Mapping]
+        List of all distinct uncertainties. Each uncertainty is a read-only mapping with the key "mode" and
+        optionally the key "weights".
+    columns: dict[int, np.ndarray]
+        Dictionary with the column index as key and the codes of the rows of the column as value.
+    """
+
+    def __init__(self, n_rows: int) -> None:
+        """
+        Parameters
+        ----------
+        n_rows: int
+            Number of rows of the data.
+        """
+        self.n_rows = n_rows
+        self.values: list[Mapping] = []
+        self.columns: dict[int, np.ndarray] = {}
+        self._value_codes: dict[frozenset, int] = {}
+
+    def add_column(
+        self,
+        col_index: int,
+        rows: np.ndarray,
+        codes: np.ndarray,
+        uncertainties: list[Mapping | None],
+    ) -> None:
+        """
+        Saves the uncertainties of a column.
+
+        Parameters
+        ----------
+        col_index: int
+            Index of the column.
+        rows: np.ndarray
+            Row positions of the cells with an uncertainty entry.
+        codes: np.ndarray
+            Index into uncertainties for each of the rows.
+        uncertainties: list[Mapping | None]
+            Distinct uncertainties of the column. None marks an entry without uncertainty.
+        """
+        table_codes = np.array(
+            [
+                -1 if uncertainty is None else self._get_value_code(uncertainty)
+                for uncertainty in uncertainties
+            ],
+            dtype=np.int64,
+        )
+        column_codes = np.full(
+            self.n_rows, -1, dtype=np.min_scalar_type(-max(len(self.values), 1))
+        )
+        column_codes[rows] = table_codes[codes]
+
+        self.columns[col_index] = column_codes
+
+    def get(self, row_index: int, col_index: int, default: Mapping | None = None) -> Mapping | None:
+        """
+        Returns the uncertainty of a cell or default, if the cell is certain.
+
+        Parameters
+        ----------
+        row_index: int
+            Row position of the cell.
+        col_index: int
+            Column index of the cell.
+        default: Mapping | None
+            Value which is returned for certain cells.
+        """
+        if col_index not in self.columns:
+            return default
+        code = self.columns[col_index][row_index]
+        return default if code < 0 else self.values[code]
+
+    def get_rows(self, start: int, stop: int) -> UncertaintyTable:
+        """
+        Returns a table of the rows from start to stop, which shares the uncertainties of this table.
+
+        Parameters
+        ----------
+        start: int
+            Position of the first row.
+        stop: int
+            Position after the last row.
+        """
+        start, stop = min(start, self.n_rows), min(stop, self.n_rows)
+        table = UncertaintyTable(stop - start)
+        table.values, table._value_codes = self.values, self._value_codes
+        table.columns = {col_index: codes[start:stop] for col_index, codes in self.columns.items()}
+        return table
+
+    def _get_value_code(self, uncertainty: Mapping) -> int:
+        """
+        Returns the code of an uncertainty and adds it to the values, if no equal uncertainty was added before.
+
+        Parameters
+        ----------
+        uncertainty: Mapping
+            Read-only mapping of the uncertainty.
+        """
+        key = frozenset(uncertainty.items())
+        code = self._value_codes.get(key)
+        if code is None:
+            code = self._value_codes[key] = len(self.values)
+            self.values.append(uncertainty)
+        return code
+
+    def __getitem__(self, key: tuple[int, int]) -> Mapping:
+        uncertainty = self.get(*key)
+        if uncertainty is None:
+            raise KeyError(key)
+        return uncertainty
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, tuple) and self.get(*key) is not None
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        for col_index, column_codes in self.columns.items():
+            for row_index in np.flatnonzero(column_codes >= 0).tolist():
+                yield (row_index, col_index)
+
+    def __len__(self) -> int:
+        return sum(
+            int(np.count_nonzero(column_codes >= 0)) for column_codes in self.columns.values()
+        )
+
+    def __getstate__(self) -> dict:
+        # Read-only mappings can't be pickled, so the uncertainties are sent to worker processes as dicts:
+        state = self.__dict__.copy()
+        state["values"] = [dict(uncertainty) for uncertainty in self.values]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.values = [MappingProxyType(uncertainty) for uncertainty in self.values]
@@ -1,6 +1,41 @@
 from __future__ import annotations
 
-from .graph_generator import GraphGenerator
+from .conversion_cache import ConversionCache
+from .generation_job import GenerationJob
+from .graph_generator import GenerationCancelled, GraphGenerator
+from .graph_pager import GraphPager
 from .illustrator import Illustrator
+from .node_cache import NodeCache
+from .ntriples_writer import NTriplesWriter
+from .quoted_triple import QuotedTriple
+from .sqlite_store import SQLiteStore
+from .triple_sink import GraphSink, ListSink, TripleSink
+from .triple_table import TripleTable
+from .turtle_writer import TurtleWriter
+from .uncertainty_models import (UncertainStatement, UncertaintyModel,
+                                 get_uncertainty_model,
+                                 register_uncertainty_model,
+                                 uses_random_weights)
 
-__all__ = ["GraphGenerator", "Illustrator"]
+__all__ = [
+    "ConversionCache",
+    "GenerationCancelled",
+    "GenerationJob",
+    "GraphGenerator",
+    "GraphPager",
+    "GraphSink",
+    "Illustrator",
+    "ListSink",
+    "NodeCache",
+    "NTriplesWriter",
+    "QuotedTriple",
+    "SQLiteStore",
+    "TripleSink",
+    "TripleTable",
+    "TurtleWriter",
+    "UncertainStatement",
+    "UncertaintyModel",
+    "get_uncertainty_model",
+    "register_uncertainty_model",
+    "uses_random_weights",
+]
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from rdfier import RDFIER_PATH
+
+# Changes, if the output of equal inputs changes, so older entries aren't used anymore:
+CACHE_VERSION = "1"
+
+
+class ConversionCache:
+    """
+        Content addressed cache of serialized graphs on disk. The key of a conversion is the sha256 hash of the
+    input data, the prefixes, the model id, the rdf format and the seed of the random weights (see get_key), so
+    unchanged inputs return the saved graph instead of generating it again. Graphs of models with random weights
+    are only reproducible with a seed (see uses_random_weights and GraphGenerator.convert). Each graph is saved in a file named by its key. The cache is bounded by
+    max_size bytes and drops the least recently used graphs, if it's full. Entries are written to temporary files
+    and renamed, so processes can share the folder.
+
+    Attributes
+    ----------
+    folder: Path
+        Folder of the cached graphs.
+    max_size: int
+        Maximal number of bytes of all cached graphs.
+    hits: int
+        Number of lookups, which found a graph.
+    misses: int
+        Number of lookups, which found no graph.
+    """
+
+    def __init__(self, folder: str | Path | None = None, max_size: int = 512 * 2**20) -> None:
+        """
+        Parameters
+        ----------
+        folder: str | Path | None
+            Folder of the cached graphs, which is created if it doesn't exist. Defaults to data/cache.
+        max_size: int
+            Maximal number of bytes of all cached graphs.
+        """
+        self.folder = Path(RDFIER_PATH, "data/cache") if folder is None else Path(folder)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_key(
+        data: str | Path | bytes | pd.DataFrame,
+        prefixes: str | Path | bytes | pd.DataFrame | None,
+        model_id: int,
+        rdf_format: str,
+        seed: int | None = None,
+    ) -> str:
+        """
+        Returns the key of a conversion.
+
+        Parameters
+        ----------
+        data: str | Path | bytes | pd.DataFrame
+            Path or content of the input csv file or its DataFrame.
+        prefixes: str | Path | bytes | pd.DataFrame | None
+            Path or content of the csv file with the prefixes or its DataFrame. None if no prefixes are loaded.
+        model_id: int
+            Model ID, of the model which is used to create the uncertain statements.
+        rdf_format: str
+            Format of the graph, like "turtle".
+        seed: int | None
+            Seed of the random weights of the GraphGenerator. None, if every run draws new weights.
+        """
+        digest = hashlib.sha256(f"rdfier {CACHE_VERSION} {model_id} {rdf_format} {seed}\n".encode())
+        for content in (data, prefixes):
+            if content is None:
+                digest.update(b"none\n")
+                continue
+            if isinstance(content, pd.DataFrame):
+                content = content.to_csv(index=False).encode()
+            elif isinstance(content, (str, Path)):
+                content = Path(content).read_bytes()
+            digest.update(f"{len(content)}\n".encode())
+            digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns the cached graph of the key or None, if it isn't cached. The graph becomes the most recently used.
+
+        Parameters
+        ----------
+        key: str
+            Key of the conversion (see get_key).
+        """
+        path = Path(self.folder, key)
+        try:
+            graph = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except FileNotFoundError:  # Not cached or dropped by another process
+            self.misses += 1
+            return None
+        self.hits += 1
+        return graph
+
+    def get_file(self, key: str, path: str | Path) -> bool:
+        """
+        Copies the cached graph of the key to the path, without reading it into memory, and returns True. Returns
+        False, if it isn't cached. The graph becomes the most recently used.
+
+        Parameters
+        ----------
+        key: str
+            Key of the conversion (see get_key).
+        path: str | Path
+            Path of the file, to which the graph is copied.
+        """
+        cached_path = Path(self.folder, key)
+        try:
+            shutil.copyfile(cached_path, path)
+            os.utime(cached_path)
+        except FileNotFoundError:  # Not cached or dropped by another process
+            if Path(path).parent.is_dir():
+                self.misses += 1
+                return False
+            raise
+        self.hits += 1
+        return True
+
+    def put(self, key: str, graph: str) -> None:
+        """
+        Saves the graph of the key and drops the least recently used graphs, if the cache is full.
+
+        Parameters
+        ----------
+        key: str
+            Key of the conversion (see get_key).
+        graph: str
+            Serialized graph.
+        """
+        self._save(key, lambda temp_path: temp_path.write_text(graph, encoding="utf-8"))
+
+    def put_file(self, key: str, path: str | Path) -> None:
+        """
+        Saves a copy of the graph file of the key and drops the least recently used graphs, if the cache is full.
+
+        Parameters
+        ----------
+        key: str
+            Key of the conversion (see get_key).
+        path: str | Path
+            Path of the file of the serialized graph.
+        """
+        self._save(key, lambda temp_path: shutil.copyfile(path, temp_path))
+
+    def clear(self) -> None:
+        """
+        Removes all cached graphs.
+        """
+        for entry in self._get_entries():
+            Path(entry.path).unlink(missing_ok=True)
+
+    @property
+    def size(self) -> int:
+        """
+        Number of bytes of all cached graphs.
+        """
+        return sum(entry.stat().st_size for entry in self._get_entries())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and Path(self.folder, key).is_file()
+
+    def __len__(self) -> int:
+        return len(self._get_entries())
+
+    def _save(self, key: str, write: Callable[[Path], object]) -> None:
+        """
+        Writes the graph of the key to a temporary file, which replaces the entry of the key, and drops the least
+        recently used graphs, if the cache is full.
+
+        Parameters
+        ----------
+        key: str
+            Key of the conversion (see get_key).
+        write: Callable[[Path], object]
+            Function, which writes the graph to the path of the temporary file.
+        """
+        file, temp_name = tempfile.mkstemp(dir=self.folder, prefix=".", suffix=".tmp")
+        os.close(file)
+        temp_path = Path(temp_name)
+        try:
+            write(temp_path)
+            os.replace(temp_path, Path(self.folder, key))
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def _get_entries(self) -> list[os.DirEntry]:
+        """
+        Returns the files of the cached graphs without the temporary files.
+        """
+        return [
+            entry for entry in os.scandir(self.folder) if entry.is_file() and not entry.name.startswith(".")
+        ]
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used graphs, until all graphs have at most max_size bytes.
+        """
+        entries = []
+        for entry in self._get_entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # Dropped by another process
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            Path(path).unlink(missing_ok=True)
+            size -= entry_size
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import io
+from concurrent.futures import (CancelledError, Executor, Future,
+                                ThreadPoolExecutor)
+from pathlib import Path
+from threading import Event
+
+from rdfier.features.graph_generator import GenerationCancelled, GraphGenerator
+from rdfier.features.triple_table import TripleTable
+
+# Maximal number of jobs, which run at the same time. Further jobs wait until a job is done:
+MAX_RUNNING_JOBS = 4
+
+_executor: ThreadPoolExecutor | None = None
+
+
+class GenerationJob:
+    """
+        Generates and serializes the graph of a GraphGenerator in a background thread, so the caller, like a
+    session of the app, isn't blocked by large inputs. The job is started when it's created. progress is updated
+    by the generator while the statements are generated, cancel stops the generator at its next step (see
+    GraphGenerator.cancel_event) and result returns the serialized graph, when the job is done, unless the graph
+    is written to an output file. The graphs of
+    the rdf* models 9 and 10 are written from their TripleTable, which is kept in table, because the graph of the
+    generator can't hold them (see GraphGenerator.save_table).
+
+    Attributes
+    ----------
+    generator: GraphGenerator
+        Generator of the graph. It mustn't be used by others until the job is done.
+    model_id: int
+        Model ID, of the model which is used to create the uncertain statements.
+    rdf_format: str
+        Format of the graph: "turtle" or "xml". The rdf* models are always written as turtle.
+    index_rows: bool
+        If True, the triples of each row are saved, so the graph can be updated with
+        GraphGenerator.update_rows after the job is done.
+    output: Path | None
+        File, to which the graph is written. If None, the graph is returned by result.
+    progress: float
+        Fraction of the generated statements from 0 to 1. The graph is serialized after the progress reached 1.
+    table: TripleTable | None
+        Table of the statements of the rdf* models, when the job is done.
+    """
+
+    def __init__(
+        self,
+        generator: GraphGenerator,
+        model_id: int = 8,
+        rdf_format: str = "turtle",
+        index_rows: bool = False,
+        executor: Executor | None = None,
+        output: str | Path | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        generator: GraphGenerator
+            Generator of the graph, whose progress and cancel_event are set by the job.
+        model_id: int
+            Model ID, of the model which is used to create the uncertain statements.
+        rdf_format: str
+            Format of the graph: "turtle" or "xml".
+        index_rows: bool
+            If True, the triples of each row are saved (see GraphGenerator.generate_graph).
+        executor: Executor | None
+            Executor, which runs the job. If None, the job runs in a shared thread pool of MAX_RUNNING_JOBS
+            threads. Process pools can't be used, because the generator is changed by the job.
+        output: str | Path | None
+            Path of the file, to which the graph is written, so it's never held in memory as a string. If None,
+            the graph is serialized into a string, which is returned by result.
+        """
+        self.generator = generator
+        self.model_id = model_id
+        self.rdf_format = rdf_format
+        self.index_rows = index_rows
+        self.output = None if output is None else Path(output)
+        self.progress = 0.0
+        self.table: TripleTable | None = None
+        self._cancel_event = Event()
+        generator.progress = self._set_progress
+        generator.cancel_event = self._cancel_event
+        self._future: Future = (executor or _get_executor()).submit(self._run)
+
+    def cancel(self) -> None:
+        """
+        Cancels the job. A waiting job is never started and a running job stops at the next step of the
+        generator, but a graph, which is serialized already, is still returned.
+        """
+        self._cancel_event.set()
+        self._future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        True, if the job was cancelled.
+        """
+        return self._cancel_event.is_set()
+
+    def done(self) -> bool:
+        """
+        Returns True, if the job finished, failed or was cancelled.
+        """
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> str | None:
+        """
+        Returns the serialized graph or None, if it was written to the output file. Waits until the job is done
+        and raises the errors of the job.
+
+        Parameters
+        ----------
+        timeout: float | None
+            Maximal number of seconds to wait. If None, it waits until the job is done.
+        """
+        try:
+            return self._future.result(timeout)
+        except CancelledError:
+            raise GenerationCancelled("The generation of the graph was cancelled.") from None
+
+    def _run(self) -> str | None:
+        """
+        Generates and serializes the graph. Runs in a thread of the executor.
+        """
+        output: Path | io.StringIO = io.StringIO() if self.output is None else self.output
+        if self.model_id in (9, 10):
+            # rdflib can't hold quoted triples, so rdf* graphs are written and paged from their table:
+            self.table = self.generator.generate_table(self.model_id)
+            self.generator.save_table(self.table, output)
+        else:
+            self.generator.generate_graph(
+                model_id=self.model_id,
+                rdf_format=self.rdf_format,
+                output=output,
+                index_rows=self.index_rows,
+            )
+        return output.getvalue() if isinstance(output, io.StringIO) else None
+
+    def _set_progress(self, step: int, n_steps: int) -> None:
+        """
+        Saves the progress of the generator.
+
+        Parameters
+        ----------
+        step: int
+            Number of done steps.
+        n_steps: int
+            Number of all steps.
+        """
+        self.progress = step / n_steps if n_steps else 1.0
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the shared thread pool of the jobs, which is created by the first job.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(MAX_RUNNING_JOBS, thread_name_prefix="rdfier_job")
+    return _executor
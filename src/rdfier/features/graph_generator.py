@@ -1,39 +1,43 @@
 from __future__ import annotations
 
-from fileinput import input
+import hashlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from contextlib import nullcontext
 from pathlib import Path
-from random import random
+from random import Random, getrandbits
+from threading import Event
+from typing import Callable, ContextManager, Iterable, Mapping, TextIO
 
+import numpy as np
 import pandas as pd
 from rdflib import BNode, Graph, IdentifiedNode, Literal, Namespace, URIRef
+from rdflib.store import Store
 
 from rdfier import RDFIER_PATH
 from rdfier.data.rdf_data import RDFData
-
-# Standard Namespaces------------------------------------------------------------------------
-CRM = Namespace("http://www.cidoc-crm.org/cidoc-crm/")
-DCTERMS = Namespace("http://purl.org/dc/terms/")
-DCMITYPE = Namespace("http://purl.org/dc/dcmitype/")
-FOAF = Namespace("http://xmlns.com/foaf/0.1/")
-GEO = Namespace("http://www.w3.org/2003/01/geo/wgs84_pos#")
-NM = Namespace("http://nomisma.org/id/")
-NMO = Namespace("http://nomisma.org/ontology#")
-ORG = Namespace("http://www.w3.org/ns/org#")
-RDF = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
-RDFS = Namespace("http://www.w3.org/2000/01/rdf-schema#")
-SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
-XSD = Namespace("http://www.w3.org/2001/XMLSchema#")
-
-# Needed for uncertainty models:
-AMT = Namespace("http://academic-meta-tool.xyz/vocab#")
-BMO = Namespace("http://collection.britishmuseum.org/id/ontology/")
-CRMINF = Namespace(
-    "http://www.cidoc-crm.org/crminf/sites/default/files/CRMinf_v0.7_.rdfs#"
-)
-EDTFO = Namespace("http://periodo.github.io/edtf-ontology/edtfo.ttl#")
-UN = Namespace(
-    "http://www.w3.org/2005/Incubator/urw3/XGR-urw3-20080331/Uncertainty.owl#"
-)
+from rdfier.features.conversion_cache import ConversionCache
+from rdfier.features.namespaces import (AMT, BMO, CRM, CRMINF, DCMITYPE,
+                                        DCTERMS, EDTFO, FOAF, GEO, NM, NMO,
+                                        ORG, RDF, RDFS, SKOS, UN, XSD)
+from rdfier.features.node_cache import NodeCache
+from rdfier.features.ntriples_writer import NTriplesWriter
+from rdfier.features.quoted_triple import QuotedTriple
+from rdfier.features.triple_sink import GraphSink, ListSink, TripleSink
+from rdfier.features.triple_table import TripleTable
+from rdfier.features.turtle_writer import TurtleWriter
+from rdfier.features.uncertainty_models import (UncertainStatement,
+                                                get_uncertainty_model,
+                                                uses_random_weights)
+
+# Minimal number of rows, which are generated by one worker process:
+PARALLEL_MIN_ROWS = 5000
+
+
+class GenerationCancelled(Exception):
+    """
+    Raised by a GraphGenerator, whose cancel_event was set while it generated statements.
+    """
 
 
 class GraphGenerator:
@@ -43,25 +47,99 @@ class GraphGenerator:
     Attributes
     ----------
     rdfdata: RDFData
-        RDFData which contains the data of the rdf graph.
+        RDFData which contains the data of the rdf graph. After update_rows it's read from the new input, when
+        it's used the next time.
     graph: Graph
         RDF graph which will be created.
+    store: Store | None
+        rdflib store of the graph, like a SQLiteStore for graphs larger than the memory. If None, the graph is
+        held in memory.
     OUTPUT_FOLDER: Path
-        Constant which holds the output path.
+        Folder of the output files, which are written if no output is given. Generators, which run at the same
+        time, like the ones of different sessions of the app, need their own folders.
     prefixes: dict
         Dictionary which contains the prefixes and namespaces which binds to the graph.
+    node_cache: NodeCache
+        Cache of the last used nodes, which is cleared if the prefixes change.
+    sink: TripleSink
+        Destination of all generated triples. A GraphSink of the graph or, while the statements are streamed,
+        an NTriplesWriter or TurtleWriter.
+    row_triples: dict[int, list[tuple]] | None
+        Triples of each row, if the graph was generated with index_rows=True (see update_rows).
+    triple_counts: Counter | None
+        Number of times each triple of the graph was produced by the rows, if the graph was generated
+        with index_rows=True.
+    seed: int | None
+        Seed of the random weights of the uncertain cells without weights. If None, every run draws a new seed, so
+        the graphs of models with random weights differ between runs (see uses_random_weights).
+    rdf_star: bool
+        True, if the last graph holds quoted triples of the rdf* models 9 and 10. rdflib can't hold them, so the
+        graph stays empty and can't be queried.
+    progress: Callable[[int, int], None] | None
+        Function, which is called with the number of done and of all steps, while statements are generated.
+        The steps are the object columns of generate_table or the rows of the row by row generation.
+    cancel_event: Event | None
+        Event, which cancels the generation, if it's set. The generator raises GenerationCancelled at the next
+        step and the graph stays incomplete.
+    UNCERTAIN_BATCH_SIZE: int
+        Number of uncertain statements, which are translated by the uncertainty model at once.
+    PROGRESS_ROWS: int
+        Number of rows, after which the row by row generation reports its progress.
+    CANCEL_POLL_INTERVAL: float
+        Number of seconds between the checks of the cancel_event, while the parts of worker processes are awaited.
+    TABLE_ROWS: int
+        Number of rows, whose statements are built and added as one TripleTable, so streamed outputs only hold
+        the table of one block of rows in memory.
+    BATCH_SIZE: int
+        Number of triples, which are collected by the sink before they are added to the graph or written.
+    STREAM_FORMATS: dict[str, str]
+        Formats, which are streamed, and the names of their default output files.
     """
 
-    def __init__(self, rdfdata: RDFData) -> None:
+    UNCERTAIN_BATCH_SIZE = 10000
+    PROGRESS_ROWS = 1000
+    CANCEL_POLL_INTERVAL = 0.2
+    TABLE_ROWS = PARALLEL_MIN_ROWS
+    BATCH_SIZE = 10000
+    STREAM_FORMATS = {"nt": "graph.nt", "nquads": "graph.nq"}
+
+    def __init__(
+        self,
+        rdfdata: RDFData,
+        store: Store | None = None,
+        output_folder: str | Path | None = None,
+        seed: int | None = None,
+    ) -> None:
         """
         Parameters
         ----------
         rdfdata: RDFData
             Object which contains the data of the rdf graph.
+        store: Store | None
+            rdflib store of the graph, like a SQLiteStore. The store is cleared, when a graph is generated.
+            If None, the graph is held in memory.
+        output_folder: str | Path | None
+            Folder of the output files, which is created when the first file is written. Defaults to data/output.
+        seed: int | None
+            Seed of the random weights. If None, every run draws a new seed.
         """
-        self.rdfdata = rdfdata
-        self.graph = Graph()
-        self.OUTPUT_FOLDER = Path(RDFIER_PATH, "data/output")
+        self._rdfdata = rdfdata
+        # Input of the last update_rows, from which rdfdata is read on first use:
+        self._changed_dataframe: pd.DataFrame | None = None
+        self.store = store
+        self.graph = Graph() if store is None else Graph(store=store)
+        self.node_cache = NodeCache()
+        self.sink: TripleSink = GraphSink(self.graph, self.BATCH_SIZE)
+        self.row_triples: dict[int, list[tuple]] | None = None
+        self.triple_counts: Counter | None = None
+        self.rdf_star = False
+        self.progress: Callable[[int, int], None] | None = None
+        self.cancel_event: Event | None = None
+        self._row = 0
+        self.seed = seed
+        # Seed of the random weights of the cells of the current run (see _get_uncertain_statements):
+        self._seed = self._get_seed()
+        self.OUTPUT_FOLDER = Path(RDFIER_PATH, "data/output") if output_folder is None else Path(output_folder)
         self.prefixes: dict[str, Namespace] = {
             "crm": CRM,
             "dcterms": DCTERMS,
@@ -91,7 +169,7 @@ class GraphGenerator:
         path_data: str | DataFrame
             Path to the csv file with header: (prefix, namespace) or DataFrame of the file.
         """
-        if type(path_data) is pd.DataFrame:
+        if isinstance(path_data, pd.DataFrame):
             namespaces = path_data
         else:
             namespaces = pd.read_csv(path_data)
@@ -103,10 +181,37 @@ class GraphGenerator:
 
         for prefix in self.prefixes:
             self.graph.bind(prefix, self.prefixes[prefix])
+        self.node_cache.clear()  # Cached uri nodes could use old namespaces
 
         del namespaces
 
-    def generate_graph(self, model_id: int = 8, xml_format: bool = False) -> None:
+    @property
+    def rdfdata(self) -> RDFData:
+        """
+        RDFData which contains the data of the rdf graph. The input of the last update_rows is read on first use.
+        """
+        if self._changed_dataframe is not None:
+            # The input was changed by update_rows:
+            self._rdfdata = RDFData(self._changed_dataframe, n_jobs=self._rdfdata.n_jobs)
+            self._changed_dataframe = None
+        return self._rdfdata
+
+    @rdfdata.setter
+    def rdfdata(self, rdfdata: RDFData) -> None:
+        self._rdfdata = rdfdata
+        self._changed_dataframe = None
+
+    def generate_graph(
+        self,
+        model_id: int = 8,
+        xml_format: bool = False,
+        rdf_format: str | None = None,
+        output: str | Path | TextIO | None = None,
+        graph_name: str | None = None,
+        stream: bool = False,
+        n_jobs: int = 1,
+        index_rows: bool = False,
+    ) -> None:
         """
             Generates and saves the RDF graph.
 
@@ -115,37 +220,508 @@ class GraphGenerator:
         model_id: int
             Model ID, of the model which should be used to create the uncertain statements.
         xml_format: bool
-            If True, the generated graph will be saved in data/output/graph.ttl in turtle format.
-            Otherwise it will be saved in data/output/graph.rdf in xml format.
+            If True, the generated graph will be saved in graph.rdf in xml format.
+            Otherwise it will be saved in graph.ttl in turtle format.
+        rdf_format: str | None
+            Format of the graph: "turtle", "xml", "nt" or "nquads". Overwrites xml_format. N-Triples and N-Quads
+            are written from the TripleTable of the statements, so the rdflib graph is never built.
+        output: str | Path | TextIO | None
+            Path or text stream, like an io.StringIO, to which the graph is written. Defaults to graph.ttl,
+            graph.rdf, graph.nt or graph.nq in the OUTPUT_FOLDER.
+        graph_name: str | None
+            URI of the graph of the N-Quads. If None, the quads are written to the default graph.
+        stream: bool
+            If True, turtle is streamed to the output in subject blocks while the statements are generated,
+            instead of serializing the whole graph with rdflib. The rdf* models 9 and 10 are always streamed,
+            because rdflib can't hold quoted triples.
+        n_jobs: int
+            Number of worker processes, which generate the statements of contiguous parts of the rows.
+            The parts are merged in the order of the rows.
+        index_rows: bool
+            If True, the triples of each row are saved, so the graph can be updated with update_rows after
+            rows of the input changed. Only the graph of turtle and xml outputs, which aren't streamed, is
+            indexed and its statements are generated in this process.
         """
-        if model_id == 9 | 10 and xml_format:
-            print(
-                "Warning: XML format is currently not aviable for rdf* models. The format will be changed to turtle."
+        if rdf_format is None:
+            rdf_format = "xml" if xml_format else "turtle"
+        if rdf_format not in ("turtle", "xml") + tuple(self.STREAM_FORMATS):
+            raise ValueError(f'Unknown rdf format "{rdf_format}".')
+
+        if model_id in (9, 10):
+            if rdf_format == "xml":
+                print(
+                    "Warning: XML format is currently not aviable for rdf* models. The format will be changed to turtle."
+                )
+                rdf_format = "turtle"
+            stream = True
+
+        self.graph = self._new_graph()
+        self.sink = GraphSink(self.graph, self.BATCH_SIZE)
+        self.row_triples = self.triple_counts = None
+        self.rdf_star = model_id in (9, 10)
+        self._seed = self._get_seed()
+        if rdf_format in self.STREAM_FORMATS:
+            self._stream_statements(
+                model_id,
+                output or self._get_output_path(self.STREAM_FORMATS[rdf_format]),
+                lambda file: NTriplesWriter(
+                    file,
+                    URIRef(graph_name) if rdf_format == "nquads" and graph_name else None,
+                    self.BATCH_SIZE,
+                ),
+                n_jobs,
             )
-            xml_format = False
-        if model_id == 5:
-            crm_properties = self._get_crm_properties()
+            self._save_prefixes()
+            return
+        if rdf_format == "turtle" and stream:
+            self._stream_statements(
+                model_id,
+                output or self._get_output_path("graph.ttl"),
+                lambda file: TurtleWriter(file, self.prefixes, self.BATCH_SIZE),
+                n_jobs,
+            )
+            self._save_prefixes()
+            return
 
-        self.graph = Graph()
-        for prefix, nspaces in self.prefixes.items():
-            self.graph.bind(prefix, nspaces)
+        if index_rows:
+            self.row_triples, self.triple_counts = {}, Counter()
+            n_jobs = 1
+        self._add_prologue(model_id)
+        self._add_statements(model_id, n_jobs=n_jobs)
+        self.sink.flush()
+        self.graph.commit()
+        self._save_prefixes()
+        self.save_graph(rdf_format, output)
+
+    def save_graph(self, rdf_format: str = "turtle", output: str | Path | TextIO | None = None) -> None:
+        """
+        Saves the graph in graph.ttl or graph.rdf in the OUTPUT_FOLDER or writes it to the output.
+
+        Parameters
+        ----------
+        rdf_format: str
+            Format of the graph: "turtle" or "xml".
+        output: str | Path | TextIO | None
+            Path or text stream, to which the graph is written. If None, the file in the OUTPUT_FOLDER is used.
+        """
+        if rdf_format == "xml":
+            with self._open_output(output or self._get_output_path("graph.rdf")) as file:
+                file.write(self.graph.serialize(format="pretty-xml"))
+        else:
+            with self._open_output(output or self._get_output_path("graph.ttl")) as file:
+                file.write(self.graph.serialize(format="turtle"))
+
+    def save_table(self, table: TripleTable, output: str | Path | TextIO | None = None) -> None:
+        """
+            Replaces the graph by the triples of a TripleTable of generate_table and writes them as turtle to
+        graph.ttl in the OUTPUT_FOLDER or to the output. Tables with quoted triples of the rdf* models are only
+        written, because rdflib can't hold them, and rdf_star is set.
+
+        Parameters
+        ----------
+        table: TripleTable
+            Table of the triples of the graph.
+        output: str | Path | TextIO | None
+            Path or text stream, to which the graph is written. If None, the file in the OUTPUT_FOLDER is used.
+        """
+        self.graph = self._new_graph()
+        self.sink = GraphSink(self.graph, self.BATCH_SIZE)
+        self.row_triples = self.triple_counts = None
+        self.rdf_star = any(isinstance(term, QuotedTriple) for term in table.terms)
+        if not self.rdf_star:
+            table.to_graph(self.graph)
+            self.graph.commit()
+        with self._open_output(output or self._get_output_path("graph.ttl")) as file:
+            writer = TurtleWriter(file, self.prefixes, self.BATCH_SIZE)
+            writer.add_table(table)
+            writer.close()
+        self._save_prefixes()
+
+    def update_rows(
+        self,
+        dataframe: pd.DataFrame,
+        changed_rows: Iterable[int],
+        deleted_rows: Iterable[int] = (),
+        model_id: int = 8,
+    ) -> None:
+        """
+            Updates the graph after rows of the input were changed, added or deleted, without generating the
+        whole graph again. The triples of the changed and deleted rows are removed, if no other row produced them,
+        and the statements of the new versions of the changed rows are added. Only the changed rows are read into
+        RDFData objects now. rdfdata is read from the new input, when it's used the next time. The graph must be
+        generated with index_rows=True before.
+
+        Parameters
+        ----------
+        dataframe: pd.DataFrame
+            New version of the whole input with the same header (see RDFData.get_changed_rows).
+        changed_rows: Iterable[int]
+            Row positions of the changed and added rows.
+        deleted_rows: Iterable[int]
+            Row positions of the deleted rows.
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        """
+        if self.row_triples is None:
+            raise ValueError(
+                "The graph has no row index. Generate the graph with generate_graph(index_rows=True) first."
+            )
+
+        changed_rows = np.unique(np.fromiter(changed_rows, dtype=np.int64))
+        self.sink.flush()
+        for row in changed_rows.tolist() + list(deleted_rows):
+            self._remove_row(row)
+
+        # Read the consecutive changed rows together, so their blank nodes keep the labels of their positions:
+        rdfdata, changed_dataframe = self._rdfdata, self._changed_dataframe
+        self._changed_dataframe = None
+        try:
+            for block in np.split(changed_rows, np.flatnonzero(np.diff(changed_rows) != 1) + 1):
+                if len(block):
+                    self._rdfdata = RDFData(
+                        dataframe.iloc[block[0]:block[-1] + 1].reset_index(drop=True),
+                        row_offset=int(block[0]),
+                    )
+                    self._add_prologue(model_id)  # The graph holds each triple once
+                    self._add_statements(model_id)
+            # RDFData renames the columns of its dataframe, so it gets a copy:
+            changed_dataframe = dataframe.copy()
+        finally:
+            self._rdfdata, self._changed_dataframe = rdfdata, changed_dataframe
+            self.sink.flush()
+            self.graph.commit()
+
+    def _remove_row(self, row: int) -> None:
+        """
+        Removes the triples of a row from the graph, if no other row produced them.
+
+        Parameters
+        ----------
+        row: int
+            Row position in the whole input.
+        """
+        row_triples, triple_counts = self.row_triples, self.triple_counts
+        if row_triples is None or triple_counts is None:
+            return  # Without a row index the triples of the row aren't known
+        for triple in row_triples.pop(row, ()):
+            triple_counts[triple] -= 1
+            if not triple_counts[triple]:
+                del triple_counts[triple]
+                self.graph.remove(triple)
+
+    def _stream_statements(
+        self,
+        model_id: int,
+        output: str | Path | TextIO,
+        new_writer: Callable[[TextIO], NTriplesWriter | TurtleWriter],
+        n_jobs: int = 1,
+    ) -> None:
+        """
+        Writes the statements of all rows of the rdfdata to the output, while they are generated.
+
+        Parameters
+        ----------
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        output: str | Path | TextIO
+            Path or text stream, to which the statements are written.
+        new_writer: Callable[[TextIO], NTriplesWriter | TurtleWriter]
+            Function, which returns the writer of the opened text stream.
+        n_jobs: int
+            Number of worker processes, which generate the statements.
+        """
+        with self._open_output(output) as file:
+            sink, self.sink = self.sink, new_writer(file)
+            try:
+                self._add_prologue(model_id)
+                self._add_statements(model_id, n_jobs=n_jobs)
+                self.sink.close()
+            finally:
+                self.sink = sink
+
+    def generate_graph_from_chunks(
+        self,
+        chunks: Iterable[RDFData],
+        model_id: int = 8,
+        output: str | Path | TextIO | None = None,
+    ) -> None:
+        """
+            Generates and saves the RDF graph of data, which is read in chunks of rows (see RDFData.read_csv_chunks).
+        Only one chunk is held in memory at once. The statements are written as N-Triples lines after the turtle
+        prefixes while they are generated, so the output stays valid turtle.
+
+        Attributes
+        ----------
+        chunks: Iterable[RDFData]
+            RDFData objects of the consecutive chunks of the data.
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        output: str | Path | TextIO | None
+            Path or text stream, to which the graph is written. Defaults to graph.ttl in the OUTPUT_FOLDER.
+        """
+        with self._open_output(output or self._get_output_path("graph.ttl")) as file:
+            file.write(
+                "".join(
+                    f"@prefix {prefix}: <{namespace}> .\n"
+                    for prefix, namespace in self.prefixes.items()
+                )
+                + "\n"
+            )
+            self.graph = self._new_graph()
+            self.row_triples = self.triple_counts = None
+            self.rdf_star = model_id in (9, 10)
+            self._seed = self._get_seed()
+            self.sink = NTriplesWriter(file, batch_size=self.BATCH_SIZE)
+            try:
+                prologue_added = False
+                for chunk in chunks:
+                    self.rdfdata = chunk
+                    if not prologue_added:
+                        prologue_added = self._add_prologue(model_id)
+                    self._add_statements(model_id)
+                self.sink.close()
+            finally:
+                self.sink = GraphSink(self.graph, self.BATCH_SIZE)
+
+        self._save_prefixes()
+
+    @classmethod
+    def convert(
+        cls,
+        data: str | Path | pd.DataFrame,
+        prefixes: str | Path | pd.DataFrame | None = None,
+        model_id: int = 8,
+        rdf_format: str = "turtle",
+        output: str | Path | None = None,
+        cache: ConversionCache | None = None,
+        seed: int | None = None,
+        output_folder: str | Path | None = None,
+        n_jobs: int = 1,
+    ) -> Path:
+        """
+            Converts a csv file or its DataFrame into a graph file and returns the path of the file. With a cache,
+        the graph of an unchanged conversion is copied from the cache instead of being generated and new graphs
+        are saved in the cache. Graphs of models with random weights are only cached with a seed, because other
+        runs draw other weights (see uses_random_weights). The rdf* models 9 and 10 are always written as turtle.
+
+        Parameters
+        ----------
+        data: str | Path | pd.DataFrame
+            Path of the input csv file or its DataFrame.
+        prefixes: str | Path | pd.DataFrame | None
+            Path of the csv file with the prefixes or its DataFrame. If None, only the default prefixes are used.
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        rdf_format: str
+            Format of the graph: "turtle", "xml", "nt" or "nquads".
+        output: str | Path | None
+            Path of the graph file. Defaults to graph.ttl, graph.rdf, graph.nt or graph.nq in the output folder.
+        cache: ConversionCache | None
+            Cache of the converted graphs. If None, the graph is always generated.
+        seed: int | None
+            Seed of the random weights. If None, every run draws a new seed.
+        output_folder: str | Path | None
+            Folder of the output files (see OUTPUT_FOLDER). Defaults to data/output.
+        n_jobs: int
+            Number of worker processes, which generate the statements (see generate_graph).
+        """
+        if model_id in (9, 10):
+            rdf_format = "turtle"
+        if output is None:
+            folder = Path(RDFIER_PATH, "data/output") if output_folder is None else Path(output_folder)
+            folder.mkdir(parents=True, exist_ok=True)
+            output = Path(
+                folder, cls.STREAM_FORMATS.get(rdf_format, "graph.rdf" if rdf_format == "xml" else "graph.ttl")
+            )
+
+        key = None
+        if cache is not None and (seed is not None or not uses_random_weights(model_id)):
+            key = cache.get_key(data, prefixes, model_id, rdf_format, seed)
+            if cache.get_file(key, output):
+                return Path(output)
+
+        # RDFData renames the columns of its DataFrame, so it gets a copy:
+        rdfdata = RDFData(data.copy()) if isinstance(data, pd.DataFrame) else RDFData.read_csv(data)
+        generator = cls(rdfdata, output_folder=output_folder, seed=seed)
+        if prefixes is not None:
+            generator.load_prefixes(prefixes if isinstance(prefixes, pd.DataFrame) else str(prefixes))
+        generator.generate_graph(model_id, rdf_format=rdf_format, output=output, n_jobs=n_jobs)
+        if cache is not None and key is not None:
+            cache.put_file(key, output)
+        return Path(output)
+
+    def generate_table(
+        self,
+        model_id: int = 8,
+        rows: range | None = None,
+        cell_nodes: tuple[dict[int, dict], dict[int, dict]] | None = None,
+        prologue: bool = True,
+    ) -> TripleTable:
+        """
+            Returns the statements of the rows of the rdfdata as a dictionary encoded TripleTable. The statements
+        are built column by column: the nodes of each value code (see RDFData.value_codes) are interned once and the
+        ids of the certain cells are expanded with array operations. Only cells with blank nodes and uncertain
+        cells are translated row by row. The triples of each subject column are ordered by row.
+
+        Parameters
+        ----------
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        rows: range | None
+            Row positions, whose statements are returned. If None, the statements of all rows are returned.
+        cell_nodes: tuple[dict[int, dict], dict[int, dict]] | None
+            Nodes of the value codes of the subject and of the object columns (see _get_cell_nodes), which are
+            shared by the tables of consecutive blocks of rows. If None, the nodes are only kept for this table.
+        prologue: bool
+            If True, the triples which the model adds once per graph are added to the table, if the rows have
+            uncertain cells (see UncertaintyModel.prologue). The tables of the blocks of a graph leave them out.
+        """
+        if rows is None:
+            rows = range(len(self.rdfdata.data))
+        table = TripleTable(self.BATCH_SIZE)
+        model = get_uncertainty_model(model_id, self)
+        uncertain_statements: list[UncertainStatement] = []
+        subject_nodes, object_nodes = ({}, {}) if cell_nodes is None else cell_nodes
+        value_codes = self.rdfdata.value_codes
+        n_steps = sum(len(plan["objects"]) for plan in self.rdfdata.triple_plan.values())
+        step = 0
+        self._report_progress(step, n_steps)
 
         for plan in self.rdfdata.triple_plan.values():
-            if not plan["objects"]:
+            subject_colindex = next(iter(plan["subject"]))
+            if not plan["objects"] or subject_colindex not in value_codes:
+                step += len(plan["objects"])
+                self._report_progress(step, n_steps)
                 continue
-            subject_colindex = plan["subject"].copy().pop()
+
+            subject_rows, subject_ids = self._get_cell_ids(
+                table,
+                subject_colindex,
+                np.flatnonzero(value_codes[subject_colindex][rows.start:rows.stop] >= 0) + rows.start,
+                subject_nodes,
+                True,
+            )
+            # Subject ids of the rows, starting with rows.start:
+            row_subjects = np.full(len(rows), -1, dtype=np.int64)
+            row_subjects[subject_rows - rows.start] = subject_ids
+
+            triple_rows, subjects, predicates, objects = [], [], [], []
+            for column_index in plan["objects"]:
+                step += 1
+                self._report_progress(step, n_steps)
+                if column_index not in value_codes:
+                    continue
+                cells = (row_subjects >= 0) & (value_codes[column_index][rows.start:rows.stop] >= 0)
+                if not cells.any():
+                    continue
+                predicate = self._get_uri_node(str(self.rdfdata.data.columns[column_index]).strip())
+                uncertainty_codes = self.rdfdata.uncertainties.columns.get(column_index)
+                if uncertainty_codes is not None:
+                    uncertainty_codes = uncertainty_codes[rows.start:rows.stop]
+                    for position in np.flatnonzero(cells & (uncertainty_codes >= 0)).tolist():
+                        row_index = position + rows.start
+                        if str(self.rdfdata.data.iat[row_index, column_index]) == "":
+                            continue
+                        uncertain_statements.extend(
+                            self._get_uncertain_statements(
+                                table.terms[row_subjects[position]],
+                                predicate,
+                                self._get_cell_nodes(row_index, column_index, object_nodes),
+                                self.rdfdata.uncertainties[row_index, column_index],
+                                model.needs_weights,
+                                row_index,
+                                column_index,
+                            )
+                        )
+                        if len(uncertain_statements) >= self.UNCERTAIN_BATCH_SIZE:
+                            table.add_triples(model.emit(uncertain_statements))
+                            uncertain_statements.clear()
+                    cells &= uncertainty_codes < 0
+
+                object_rows, object_ids = self._get_cell_ids(
+                    table, column_index, np.flatnonzero(cells) + rows.start, object_nodes
+                )
+                triple_rows.append(object_rows)
+                subjects.append(row_subjects[object_rows - rows.start])
+                predicates.append(np.full(len(object_rows), table.intern(predicate), dtype=np.int64))
+                objects.append(object_ids)
+
+            if triple_rows:
+                order = np.argsort(np.concatenate(triple_rows), kind="stable")
+                table.add_ids(
+                    *(np.concatenate(ids)[order] for ids in (subjects, predicates, objects))
+                )
+
+        if prologue and len(self.rdfdata.uncertainties):
+            table.add_triples(model.prologue())
+        table.add_triples(model.emit(uncertain_statements))
+        table.flush()
+        return table
+
+    def _new_graph(self) -> Graph:
+        """
+        Returns a new empty graph, which has all prefixes bound.
+        """
+        if self.store is None:
+            graph = Graph()
+        else:
+            graph = Graph(store=self.store)
+            graph.remove((None, None, None))
+        for prefix, nspaces in self.prefixes.items():
+            graph.bind(prefix, nspaces)
+        return graph
+
+    def _add_statements(self, model_id: int, rows: range | None = None, n_jobs: int = 1) -> None:
+        """
+        Adds the statements of the rows of the rdfdata to the sink. Without a row index they are added as the
+        TripleTables of generate_table of blocks of TABLE_ROWS rows.
+
+        Parameters
+        ----------
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        rows: range | None
+            Row positions, whose statements are added. If None, the statements of all rows are added.
+        n_jobs: int
+            Number of worker processes, which generate the statements, if there are enough rows.
+        """
+        if rows is None:
+            rows = range(len(self.rdfdata.data))
+        n_parts = min(n_jobs, len(rows) // PARALLEL_MIN_ROWS)
+        if n_parts > 1:
+            self._add_statements_in_parts(model_id, rows, n_parts)
+            return
+
+        if self.row_triples is None:
+            # Without a row index the statements are built column by column in blocks of rows:
+            self._add_tables(model_id, rows)
+            return
+
+        # Indexed statements are generated row by row, so the triples of each row are saved for the row:
+        model = get_uncertainty_model(model_id, self)
+
+        # Nodes of the cells with the same value code are only built once:
+        subject_nodes: dict[int, dict] = {}
+        object_nodes: dict[int, dict] = {}
+        plans = [plan for plan in self.rdfdata.triple_plan.values() if plan["objects"]]
+        n_steps = len(plans) * len(rows)
+        step = 0
+        self._report_progress(step, n_steps)
+
+        for plan in plans:
+            subject_colindex = next(iter(plan["subject"]))
             object_colindices = plan["objects"].copy()
+            predicates: dict[int, URIRef] = {}  # Predicates are resolved once per column
 
-            for row_index in range(len(self.rdfdata.data)):
+            for row_index in rows:
+                step += 1
+                if not step % self.PROGRESS_ROWS:
+                    self._report_progress(step, n_steps)
+                self._row = row_index + self.rdfdata.row_offset
                 if pd.notnull(self.rdfdata.data.iat[row_index, subject_colindex]):
-                    subject = self._get_node(
-                        str(self.rdfdata.data.iat[row_index,
-                            subject_colindex]),
-                        self.rdfdata.types_and_languages[(row_index, subject_colindex)][
-                            0
-                        ],
-                        f"r{row_index}c{subject_colindex}",
-                    )
+                    subject = self._get_cell_nodes(
+                        row_index, subject_colindex, subject_nodes, subject=True
+                    )[0]
 
                     for column_index in object_colindices:
                         entry = self.rdfdata.data.iat[row_index, column_index]
@@ -154,539 +730,503 @@ class GraphGenerator:
                         ):  # Check if value isn't NaN
                             pred_name = str(
                                 self.rdfdata.data.columns[column_index])
-                            predicate = self._get_node(pred_name, "^^uri")
-
-                            obj_names = str(entry).split(";")
-                            objects = [
-                                self._get_node(
-                                    value,
-                                    self.rdfdata.types_and_languages[
-                                        (row_index, column_index)
-                                    ][i],
-                                    f"r{row_index}c{column_index}",
+                            predicate = predicates.get(column_index)
+                            if predicate is None:
+                                predicate = predicates[column_index] = self._get_uri_node(
+                                    pred_name.strip()
                                 )
-                                for i, value in enumerate(obj_names)
-                            ]
-
-                            for index, objekt in enumerate(objects):
-                                if (
-                                    row_index,
-                                    column_index,
-                                ) in self.rdfdata.uncertainties:
-                                    if model_id in [3, 4, 5, 10]:
-                                        if (
-                                            "weights"
-                                            in self.rdfdata.uncertainties[
-                                                (row_index, column_index)
-                                            ]
-                                        ):
-                                            if (
-                                                len(
-                                                    self.rdfdata.uncertainties[
-                                                        (row_index, column_index)
-                                                    ]["weights"]
-                                                )
-                                                <= index
-                                            ):
-                                                print(
-                                                    f"Coin {subject.n3()} Predicate {pred_name} has uncertainties {self.rdfdata.uncertainties[(row_index, column_index)]['weights']} and object {[ob.n3() for ob in objects]}"
-                                                )
-                                            weight = self.rdfdata.uncertainties[
-                                                (row_index, column_index)
-                                            ]["weights"][index]
-                                        else:
-                                            weight = float("%.2f" % random())
-                                    if model_id == 1:
-                                        self._generate_uncertain_statement_model_1(
-                                            subject, predicate, objekt
-                                        )
-                                    elif model_id == 2:
-                                        self._generate_uncertain_statement_model_2(
-                                            subject, predicate, objekt
-                                        )
-                                    elif model_id == 3:
-                                        self.graph.add(
-                                            (
-                                                BNode("A3"),
-                                                RDF["type"],
-                                                CRM["R1_Reliability_Assessment"],
-                                            )
-                                        )
-                                        self._generate_uncertain_statement_model_3(
-                                            subject, predicate, objekt, weight
-                                        )
-                                    elif model_id == 4:
-                                        self._generate_uncertain_statement_model_4(
-                                            subject,
-                                            predicate,
-                                            objekt,
-                                            weight,
-                                            index,
-                                        )
-                                    elif model_id == 5:
-                                        self._generate_uncertain_statement_model_5(
-                                            subject,
-                                            predicate,
-                                            objekt,
-                                            weight,
-                                            crm_properties,
-                                        )
-                                    elif model_id == 6:
-                                        self._generate_uncertain_statement_model_6(
-                                            subject, predicate, objekt
-                                        )
-                                    elif model_id == 7:
-                                        self._generate_uncertain_statement_model_7(
-                                            subject, predicate, objekt
-                                        )
-                                    elif model_id == 8:
-                                        self._generate_uncertain_statement_model_8(
-                                            subject, predicate, objekt
-                                        )
-                                    elif model_id == 9:
-                                        self._generate_uncertain_statement_model_9a(
-                                            subject, predicate, objekt
-                                        )
-                                    elif model_id == 10:
-                                        self._generate_uncertain_statement_model_9b(
-                                            subject, predicate, objekt, 1 - weight
-                                        )
-                                    else:
-                                        self.graph.add(
-                                            (subject, predicate, objekt))
-
-                                else:
-                                    self.graph.add(
-                                        (subject, predicate, objekt))
-
-        # Save sparql-prefix txt:
-        with open(Path(self.OUTPUT_FOLDER, "graph_prefixes.txt"), "w", encoding="utf-8") as file:
-            file.write(
-                "".join(
-                    "PREFIX " + prefix + ": <" +
-                    self.prefixes[prefix] + ">" + "\n"
-                    for prefix in self.prefixes
-                )
-            )
-
-        # Save RDF Graph:
-        if xml_format:
-            with open(Path(self.OUTPUT_FOLDER, "graph.rdf"), "w", encoding="utf-8") as file:
-                file.write(self.graph.serialize(format="pretty-xml"))
-        else:
-            with open(Path(self.OUTPUT_FOLDER, "graph.ttl"), "w", encoding="utf-8") as file:
-                file.write(self.graph.serialize(format="turtle"))
 
-            if model_id == 9:
-                self.change_to_model_9a()
-            elif model_id == 10:
-                self.change_to_model_9b()
+                            objects = self._get_cell_nodes(
+                                row_index, column_index, object_nodes
+                            )
+
+                            uncertainty = self.rdfdata.uncertainties.get(
+                                row_index, column_index
+                            )
+                            if uncertainty is None:
+                                for objekt in objects:
+                                    self._add_triple((subject, predicate, objekt))
+                                continue
+
+                            self._add_triples(
+                                model.emit(
+                                    self._get_uncertain_statements(
+                                        subject,
+                                        predicate,
+                                        objects,
+                                        uncertainty,
+                                        model.needs_weights,
+                                        row_index,
+                                        column_index,
+                                    )
+                                )
+                            )
+        self._report_progress(n_steps, n_steps)
 
-    def _get_node(
-        self, value: str, datatype: str, identification: str = ""
-    ) -> Literal | BNode | IdentifiedNode:
+    def _report_progress(self, step: int, n_steps: int) -> None:
         """
-        Method which returns the node of the given value and type.
+        Calls the progress function with the done steps or raises GenerationCancelled, if the cancel_event is set.
 
         Parameters
         ----------
-        value: str
-            String of the entry of the value of the node.
-        datatype: str
-            String of the type or the language of the node.
-        identification: str
-            String which includes the cell position to identify a blank node.
+        step: int
+            Number of done steps.
+        n_steps: int
+            Number of all steps.
         """
-        value = value.strip()
-        if not datatype:
-            return Literal(value)
-        elif datatype[0:2] == "^^":
-            if datatype == "^^blank":
-                return BNode(f"v{value}{identification}")
-            if datatype == "^^uri":
-                return self._get_uri_node(value)
-            else:
-                return Literal(value, datatype=self._get_uri_node(datatype[2:]))
-        elif datatype[0:1] == "@":
-            return Literal(value, lang=datatype[1:])
-        else:
-            raise ValueError(f'Could not translate type "{datatype}"')
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise GenerationCancelled("The generation of the graph was cancelled.")
+        if self.progress is not None:
+            self.progress(step, n_steps)
 
-    def _get_uri_node(self, uri: str) -> IdentifiedNode:
+    def _add_prologue(self, model_id: int) -> bool:
         """
-        Returns the node of the given URI.
+        Adds the triples, which the model adds once per graph (see UncertaintyModel.prologue), if the rdfdata has
+        uncertain cells. With a row index they are saved for every row with uncertain cells, so update_rows
+        removes them with the last of these rows. Returns True, if they were added.
 
         Parameters
         ----------
-        uri: str
-            String of the URI. Can be a URI in prefix shape or the complete URI with starting < and ending >.
+        model_id: int
+            Model ID, of the model which is used to create the uncertain statements.
         """
-        if uri[0] == "<" and uri[-1] == ">":
-            uri = uri[1:-1]
-            return URIRef(uri)
-        else:
-            splitlist = uri.split(":")
-            if len(splitlist) >= 2:
-                if splitlist[0] in self.prefixes:
-                    return self.prefixes[splitlist[0]][uri[len(splitlist[0]) + 1:]]
-                else:
-                    raise ValueError(
-                        f'Unknown prefix {splitlist[0]} in uri "{uri}". To add prefixes for namespaces use the method "load_prefixes".'
+        if not len(self.rdfdata.uncertainties):
+            return False
+        triples = list(get_uncertainty_model(model_id, self).prologue())
+        self.sink.add_triples(triples)
+        if self.row_triples is not None and self.triple_counts is not None:
+            for row in {row_index for row_index, _ in self.rdfdata.uncertainties}:
+                self.row_triples.setdefault(row + self.rdfdata.row_offset, []).extend(triples)
+                self.triple_counts.update(triples)
+        return True
+
+    def _add_tables(self, model_id: int, rows: range) -> None:
+        """
+        Adds the statements of blocks of TABLE_ROWS rows as TripleTables to the sink. Only the table of one block
+        is held in memory, so the turtle of the sink groups the subjects within each block.
+
+        Parameters
+        ----------
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        rows: range
+            Row positions, whose statements are added.
+        """
+        starts = range(rows.start, rows.stop, self.TABLE_ROWS)
+        cell_nodes: tuple[dict[int, dict], dict[int, dict]] = ({}, {})
+        progress = self.progress
+        try:
+            for block, start in enumerate(starts):
+                if progress is not None:
+                    # generate_table reports the steps of its block:
+                    self.progress = lambda step, n_steps, block=block: progress(
+                        block * n_steps + step, len(starts) * n_steps
                     )
-            else:
-                raise ValueError(f'Could not find prefix in uri "{uri}"')
+                self.sink.add_table(
+                    self.generate_table(
+                        model_id, range(start, min(start + self.TABLE_ROWS, rows.stop)), cell_nodes, False
+                    )
+                )
+        finally:
+            self.progress = progress
 
-    def _generate_uncertain_statement_model_1(
-        self, subject: URIRef, predicate: URIRef, objekt: URIRef | Literal
-    ) -> None:
+    def _get_seed(self) -> int:
+        """
+        Returns the seed of the random weights of a run: the seed of the generator or a new random seed.
+        """
+        return getrandbits(64) if self.seed is None else self.seed  # nosec B311
+
+    def _get_uncertain_statements(
+        self,
+        subject: IdentifiedNode | Literal,
+        predicate: URIRef,
+        objects: list[IdentifiedNode | Literal],
+        uncertainty: Mapping,
+        needs_weights: bool,
+        row_index: int,
+        column_index: int,
+    ) -> list[UncertainStatement]:
         """
-        Uses model 1 to add an uncertain statement to the rdf graph.
+        Returns the uncertain statements of the objects of an uncertain cell. The random weights of a cell are
+        drawn from the seed of the run and the position of the cell, so they don't depend on the order in which
+        the cells are translated, like in blocks or in worker processes.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
+        subject: IdentifiedNode | Literal
+            Node of the subject of the row.
         predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
-        """
-        node = BNode()
-        self.graph.add((subject, predicate, objekt))
-        self.graph.add((node, CRM["P141_assigned"], objekt))
-        self.graph.add((node, CRM["P140_assigned_attribute_to"], subject))
-        self.graph.add((node, BMO["PX_Property"], predicate))
-        self.graph.add((node, RDF["type"], CRM["E13_Attribute_Assignment"]))
-        self.graph.add((node, BMO["PX_likelihood"], NM["uncertain_value"]))
-
-    def _generate_uncertain_statement_model_2(
-        self, subject: URIRef, predicate: URIRef, objekt: URIRef | Literal
-    ) -> None:
+            Node of the predicate of the column.
+        objects: list[IdentifiedNode | Literal]
+            Nodes of the entries of the cell.
+        uncertainty: Mapping
+            Uncertainty of the cell (see RDFData.uncertainties).
+        needs_weights: bool
+            If True, every statement gets the weight of its entry or a random weight, if the cell has no weights.
+        row_index: int
+            Row position of the cell.
+        column_index: int
+            Column index of the cell.
         """
-        Uses model 2 to add an uncertain statement to the rdf graph.
+        weights = uncertainty.get("weights")
+        if needs_weights and weights is None:
+            cell_random = Random(f"{self._seed} {row_index + self.rdfdata.row_offset} {column_index}")  # nosec B311
+        statements = []
+        for index, objekt in enumerate(objects):
+            weight = None
+            if needs_weights:
+                if weights is None:
+                    weight = float("%.2f" % cell_random.random())
+                else:
+                    if len(weights) <= index:
+                        print(
+                            f"Coin {subject.n3()} Predicate {predicate.n3()} has uncertainties {weights} and object {[ob.n3() for ob in objects]}"
+                        )
+                    weight = weights[index]
+            statements.append(UncertainStatement(subject, predicate, objekt, weight, index))
+        return statements
+
+    def _add_statements_in_parts(self, model_id: int, rows: range, n_parts: int) -> None:
+        """
+        Generates the statements of contiguous parts of the rows in a process pool and adds them in the order
+        of the rows. Every worker only gets the RDFData of its part (see RDFData.get_rows). The labels of the blank
+        nodes of the cells only depend on the position and the value of the cell, the models derive their other
+        labels from the nodes or use unique labels and the random weights only depend on the seed of the run and
+        the position of the cell, so the merged graph is the same as the graph of a sequential run. If the
+        generation is cancelled, the parts, which aren't merged yet, are dropped without waiting for them.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        rows: range
+            Row positions, whose statements are added.
+        n_parts: int
+            Number of parts and worker processes.
         """
-        node = BNode()
-        self.graph.add((subject, predicate, node))
-        self.graph.add((node, UN["hasUncertainty"], NM["uncertain_value"]))
-        self.graph.add((node, RDF.value, objekt))
+        bounds = [rows[0] + len(rows) * part // n_parts for part in range(n_parts)] + [rows.stop]
+        parts = [range(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+        self._report_progress(0, len(rows))
+        executor = ProcessPoolExecutor(max_workers=n_parts)
+        cancelled = True
+        try:
+            futures = [
+                executor.submit(
+                    self._generate_part,
+                    self.rdfdata.get_rows(part.start, part.stop),
+                    self.prefixes,
+                    model_id,
+                    self._seed,
+                )
+                for part in parts
+            ]
+            for part, future in zip(parts, futures):
+                while True:
+                    try:
+                        triples = future.result(timeout=self.CANCEL_POLL_INTERVAL)
+                        break
+                    except TimeoutError:
+                        # Raises GenerationCancelled, if the generation was cancelled meanwhile:
+                        self._report_progress(part.start - rows.start, len(rows))
+                self._add_triples(triples)
+                # The parts are merged in order, so the rows until the end of the part are done:
+                self._report_progress(part.stop - rows.start, len(rows))
+            cancelled = False
+        finally:
+            executor.shutdown(wait=not cancelled, cancel_futures=True)
+
+    @classmethod
+    def _generate_part(
+        cls,
+        rdfdata: RDFData,
+        prefixes: dict[str, Namespace],
+        model_id: int,
+        random_seed: int,
+    ) -> list[tuple]:
+        """
+        Returns the statements of all rows of a part of the data. Runs in a worker process.
 
-    def _generate_uncertain_statement_model_3(
-        self,
-        subject: URIRef,
-        predicate: URIRef,
-        objekt: URIRef | Literal,
-        weight: float,
-    ) -> None:
+        Parameters
+        ----------
+        rdfdata: RDFData
+            RDFData of the rows of the part.
+        prefixes: dict[str, Namespace]
+            Prefixes and namespaces of the graph.
+        model_id: int
+            Model ID, of the model which should be used to create the uncertain statements.
+        random_seed: int
+            Seed of the random weights of the run.
         """
-        Uses model 3 to add an uncertain statement to the rdf graph.
+        generator = cls(rdfdata)
+        generator.prefixes = prefixes
+        generator.sink = ListSink(generator.BATCH_SIZE)
+        generator._seed = random_seed
+        generator._add_statements(model_id)
+        generator.sink.flush()
+        return generator.sink.triples
+
+    def _add_triple(self, triple: tuple) -> None:
+        """
+        Adds a triple to the sink.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
-        weight: float
-            Weight of the uncertain statement.
-        """
-        b = BNode()
-        c = BNode()
-
-        self.graph.add((BNode("A3"), CRM["T1_assessed_the_reliability_of"], b))
-
-        self.graph.add((b, RDF.type, CRM["E13_Attribute_Assignment"]))
-        self.graph.add((b, RDF.Property, predicate))
-        self.graph.add((b, CRM["T2_assessed_as_reliability"], c))
-        self.graph.add((b, CRM["P140_assigned_attribute_to"], subject))
-        self.graph.add((b, CRM["P141_assigned"], objekt))
-
-        # Weight:
-        self.graph.add(
-            (
-                c,
-                CRM["P90_has_value"],
-                Literal(weight, datatype=XSD["double"], normalize=True),
-            )
-        )
-        self.graph.add((c, RDF.type, CRM["R2_Reliability"]))
+        triple: tuple
+            Triple which is added.
+        """
+        self.sink.add(triple)
+        if self.row_triples is not None:
+            self._index_triples([triple])
 
-        self.graph.add((subject, predicate, objekt))
+    def _add_triples(self, triples: Iterable[tuple]) -> None:
+        """
+        Adds a batch of triples to the sink.
 
-    def _generate_uncertain_statement_model_4(
-        self,
-        subject: URIRef,
-        predicate: URIRef,
-        objekt: URIRef | Literal,
-        weight: float,
-        object_index: int,
-    ) -> None:
+        Parameters
+        ----------
+        triples: Iterable[tuple]
+            Triples which are added.
         """
-        Uses model 4 to add an uncertain statement to the rdf graph.
+        if self.row_triples is not None:
+            triples = list(triples)
+            self._index_triples(triples)
+        self.sink.add_triples(triples)
+
+    def _index_triples(self, triples: list[tuple]) -> None:
+        """
+        Saves the triples of the current row in the row index.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
-        weight: float
-            Weight of the uncertain statement.
-        object_index: int
-            Index of the object of its cell.
-        """
-        uncertainty_id = (subject.n3() + predicate.n3()).replace(":", "")
-        b = BNode(uncertainty_id)
-        c = BNode()
-
-        self.graph.add((subject, predicate, b))
-        self.graph.add((b, RDF.type, CRMINF["I5_Inference_Making"]))
-        self.graph.add((b, CRMINF["J2_concluded_that"], c))
-
-        if weight < 0.25:
-            level = "uncertain"
-        elif weight < 0.5:
-            level = "plausible"
-        elif weight < 0.75:
-            level = "likely"
-        else:
-            level = "very likely"
+        triples: list[tuple]
+            Triples which were added to the graph.
+        """
+        if self.row_triples is None or self.triple_counts is None:
+            return
+        self.row_triples.setdefault(self._row, []).extend(triples)
+        self.triple_counts.update(triples)
 
-        self.graph.add(
-            (c, CRMINF["I4_Proposition_Set"],
-             Literal(f"Proposetion_{object_index}"))
+    def get_sparql_prefixes(self) -> str:
+        """
+        Returns the prefixes as sparql prefixes, one per line.
+        """
+        return "".join(
+            "PREFIX " + prefix + ": <" + self.prefixes[prefix] + ">" + "\n"
+            for prefix in self.prefixes
         )
-        self.graph.add((c, CRMINF["J5_holds_to_be"], Literal(level)))
-        self.graph.add((c, CRMINF["J4_that"], objekt))
-        self.graph.add((c, RDF["type"], CRMINF["I2_Belief"]))
 
-    def _generate_uncertain_statement_model_5(
-        self,
-        subject: URIRef,
-        predicate: URIRef,
-        objekt: URIRef | Literal,
-        weight: float,
-        crm_properties: dict,
-    ) -> None:
+    def _save_prefixes(self) -> None:
+        """
+        Saves the prefixes in graph_prefixes.txt in the OUTPUT_FOLDER as sparql prefixes.
         """
-        Uses model 5 to add an uncertain statement to the rdf graph.
+        with self._open_output(self._get_output_path("graph_prefixes.txt")) as file:
+            file.write(self.get_sparql_prefixes())
+
+    def _get_output_path(self, file_name: str) -> Path:
+        """
+        Returns the path of an output file in the OUTPUT_FOLDER. The folder is created, if it doesn't exist.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
-        weight: float
-            Weight of the uncertain statement.
-        crm_properties: dict
-            Dictionary which contains the nomisma properties as keys and the corresponding .2 CRM properties as values.
-        """
-        node = BNode()
-        crm_property = (
-            "P3.2_uncertain_value"
-            if predicate.n3()[1:-1] not in crm_properties
-            else crm_properties[predicate.n3()[1:-1]]
-        )
+        file_name: str
+            Name of the file, like "graph.ttl".
+        """
+        Path(self.OUTPUT_FOLDER).mkdir(parents=True, exist_ok=True)
+        return Path(self.OUTPUT_FOLDER, file_name)
 
-        self.graph.add((subject, predicate, node))
+    @staticmethod
+    def _open_output(output: str | Path | TextIO) -> ContextManager[TextIO]:
+        """
+        Returns a context manager of the text stream of an output. Paths are opened for writing and closed at the
+        end. Text streams are returned as they are and stay open.
 
-        self.graph.add(
-            (
-                node,
-                AMT["weight"],
-                Literal(weight, datatype=XSD["double"], normalize=True),
-            )
-        )
-        self.graph.add((node, CRM[crm_property], objekt))
+        Parameters
+        ----------
+        output: str | Path | TextIO
+            Path or text stream.
+        """
+        if isinstance(output, (str, Path)):
+            return open(output, "w", encoding="utf-8")
+        return nullcontext(output)
 
-    def _generate_uncertain_statement_model_6(
-        self, subject: URIRef, predicate: URIRef, objekt: URIRef | Literal
-    ) -> None:
+    def _get_cell_nodes(
+        self, row_index: int, column_index: int, cell_nodes: dict[int, dict], subject: bool = False
+    ) -> list[Literal | BNode | IdentifiedNode]:
         """
-        Uses model 6 to add an uncertain statement to the rdf graph.
+        Returns the nodes of all entries of a cell. The nodes of cells with the same value code
+        (see RDFData.value_codes) are built once and saved in cell_nodes, if they contain no blank node.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
+        row_index: int
+            Row position of the cell.
+        column_index: int
+            Column index of the cell.
+        cell_nodes: dict[int, dict]
+            Dictionary with the column index as key and the nodes of each value code as value.
+        subject: bool
+            If True, the whole cell is one node with the first datatype/language of the cell.
         """
-        node = BNode()
+        code = int(self.rdfdata.value_codes[column_index][row_index])
+        column_nodes = cell_nodes.setdefault(column_index, {})
+        if code in column_nodes:
+            return column_nodes[code]
+
+        entry = str(self.rdfdata.data.iat[row_index, column_index])
+        types = self.rdfdata.types_and_languages.get(row_index, column_index)
+        identification = f"r{row_index + self.rdfdata.row_offset}c{column_index}"
+        if subject:
+            nodes = [self._get_node(entry, types[0], identification)]
+        else:
+            nodes = [
+                self._get_node(value, types[i], identification)
+                for i, value in enumerate(entry.split(";"))
+            ]
 
-        self.graph.add((subject, predicate, objekt))
-        self.graph.add((node, RDF["object"], objekt))
-        self.graph.add((node, RDF["subject"], subject))
-        self.graph.add((node, RDF["predicate"], predicate))
-        self.graph.add((node, RDF["type"], EDTFO["UncertainStatement"]))
+        if "^^blank" not in types:
+            column_nodes[code] = nodes
+        return nodes
 
-    def _generate_uncertain_statement_model_7(
-        self, subject: URIRef, predicate: URIRef, objekt: URIRef | Literal
-    ) -> None:
+    def _get_cell_ids(
+        self,
+        table: TripleTable,
+        column_index: int,
+        rows: np.ndarray,
+        cell_nodes: dict[int, dict],
+        subject: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Uses model 7 to add an uncertain statement to the rdf graph.
+        Returns the ids of the nodes of all entries of the cells of a column in the table. The nodes of each value
+        code are interned once and their ids are repeated for all cells with the code. Cells with blank nodes are
+        translated one by one. Empty object cells have no entries.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
+        table: TripleTable
+            Table in which the nodes are interned.
+        column_index: int
+            Column index of the cells.
+        rows: np.ndarray
+            Ascending row positions of the non empty cells.
+        cell_nodes: dict[int, dict]
+            Dictionary with the column index as key and the nodes of each value code as value.
+        subject: bool
+            If True, every cell is one node with the first datatype/language of the cell.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Row position of every entry and the id of its node, ordered by row.
         """
-        node = BNode()
+        codes, first_cells, cell_codes = np.unique(
+            self.rdfdata.value_codes[column_index][rows], return_index=True, return_inverse=True
+        )
+        code_ids: list[int] = []
+        code_counts = np.zeros(len(codes), dtype=np.int64)
+        blank_codes = np.zeros(len(codes), dtype=bool)
+        column_nodes = cell_nodes.setdefault(column_index, {})
+        for position, (code, row_index) in enumerate(zip(codes.tolist(), rows[first_cells].tolist())):
+            nodes = column_nodes.get(code)
+            if nodes is None:
+                # Nodes of the code weren't built by an earlier block:
+                if not subject and str(self.rdfdata.data.iat[row_index, column_index]) == "":
+                    continue
+                nodes = self._get_cell_nodes(row_index, column_index, cell_nodes, subject)
+            if code in column_nodes:
+                code_ids.extend(table.intern_all(nodes))
+                code_counts[position] = len(nodes)
+            else:
+                blank_codes[position] = True
 
-        self.graph.add((subject, predicate, node))
-        self.graph.add((node, RDF["type"], EDTFO["ApproximateStatement"]))
-        self.graph.add((node, RDF.value, objekt))
+        counts = code_counts[cell_codes]
+        entry_rows = [np.repeat(rows, counts)]
+        entry_starts = np.repeat((np.cumsum(code_counts) - code_counts)[cell_codes], counts)
+        entry_offsets = np.arange(len(entry_starts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        entry_ids = [np.array(code_ids, dtype=np.int64)[entry_starts + entry_offsets]]
 
-    def _generate_uncertain_statement_model_8(
-        self, subject: URIRef, predicate: URIRef, objekt: URIRef | Literal
-    ) -> None:
+        for row_index in rows[blank_codes[cell_codes]].tolist():
+            ids = table.intern_all(self._get_cell_nodes(row_index, column_index, cell_nodes, subject))
+            entry_rows.append(np.full(len(ids), row_index, dtype=np.int64))
+            entry_ids.append(np.array(ids, dtype=np.int64))
+
+        entry_rows, entry_ids = np.concatenate(entry_rows), np.concatenate(entry_ids)
+        order = np.argsort(entry_rows, kind="stable")
+        return entry_rows[order], entry_ids[order]
+
+    def _get_node(
+        self, value: str, datatype: str, identification: str = ""
+    ) -> Literal | BNode | IdentifiedNode:
         """
-        Uses model 8 to add an uncertain statement to the rdf graph.
+        Method which returns the node of the given value and type. All nodes except blank nodes are
+        saved in the node cache.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
+        value: str
+            String of the entry of the value of the node.
+        datatype: str
+            String of the type or the language of the node.
+        identification: str
+            String which includes the cell position to identify a blank node.
         """
-        node = BNode(subject.n3().replace(":", ""))
+        value = value.strip()
+        if datatype == "^^blank":
+            return BNode(f"v{value}{identification}")
 
-        self.graph.add((subject, UN["hasUncertainty"], node))
+        node = self.node_cache.get((value, datatype))
+        if node is not None:
+            return node
 
-        self.graph.add((node, predicate, objekt))
+        if not datatype:
+            node = Literal(value)
+        elif datatype[0:2] == "^^":
+            if datatype == "^^uri":
+                node = self._get_uri_node(value)
+            else:
+                node = Literal(value, datatype=self._get_uri_node(datatype[2:]))
+        elif datatype[0:1] == "@":
+            node = Literal(value, lang=datatype[1:])
+        else:
+            raise ValueError(f'Could not translate type "{datatype}"')
 
-    def _generate_uncertain_statement_model_9a(
-        self, subject: URIRef, predicate: URIRef, objekt: URIRef | Literal
-    ) -> None:
+        self.node_cache.put((value, datatype), node)
+        return node
+
+    def _get_uri_node(self, uri: str) -> URIRef:
         """
-        Creates a placeholder statement, which has to be replaced by change_to_model_9a() to create
-        the correct uncertain statement.
+        Returns the node of the given URI.
 
         Parameters
         ----------
-        subject: URIRef | Literal
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
-        """
-        node = BNode()
-
-        self.graph.add(
-            (
-                EDTFO[node.n3()[2:]],
-                RDF["star"],
-                Literal(
-                    f"{subject.n3(namespace_manager=self.graph.namespace_manager)}$${predicate.n3(namespace_manager=self.graph.namespace_manager)}$${objekt.n3(namespace_manager=self.graph.namespace_manager)}"
-                ),
-            )
-        )
+        uri: str
+            String of the URI. Can be a URI in prefix shape or the complete URI with starting < and ending >.
+        """
+        if uri[0] == "<" and uri[-1] == ">":
+            uri = uri[1:-1]
+            return URIRef(uri)
+        else:
+            splitlist = uri.split(":")
+            if len(splitlist) >= 2:
+                if splitlist[0] in self.prefixes:
+                    return self.prefixes[splitlist[0]][uri[len(splitlist[0]) + 1:]]
+                else:
+                    raise ValueError(
+                        f'Unknown prefix {splitlist[0]} in uri "{uri}". To add prefixes for namespaces use the method "load_prefixes".'
+                    )
+            else:
+                raise ValueError(f'Could not find prefix in uri "{uri}"')
 
-    def _generate_uncertain_statement_model_9b(
-        self,
-        subject: URIRef,
-        predicate: URIRef,
-        objekt: URIRef | Literal,
-        weight: float,
-    ) -> None:
+    def _get_node_id(self, *nodes: IdentifiedNode | Literal) -> str:
         """
-        Creates a placeholder statement, which has to be replaced by change_to_model_9b()
-        to create the correct uncertain statement.
+        Returns a blank node id, which is derived from the given nodes. The id is the hex digest of the nodes,
+        so different nodes get different ids, which are valid in all rdf formats and equal in all processes.
 
         Parameters
         ----------
-        subject: URIRef
-            Node of the subject of the uncertain statement.
-        predicate: URIRef
-            Node of the predicate of the uncertain statement.
-        objekt: URIRef | Literal
-            Node of the object of the uncertain statement.
-        weight: float
-            Weight of the uncertain statement.
-        """
-        node = BNode()
-
-        self.graph.add(
-            (
-                UN[node.n3()[2:]],
-                RDF["star"],
-                Literal(
-                    f"{subject.n3(namespace_manager=self.graph.namespace_manager)}$${predicate.n3(namespace_manager=self.graph.namespace_manager)}$${objekt.n3(namespace_manager=self.graph.namespace_manager)}$${weight}"
-                ),
-            )
-        )
-
-    def _get_crm_properties(self) -> dict:
-        """
-        Method which returns the dictionary for the .2 properties of solution 5.
-        """
-        nmo_prefix = "http://nomisma.org/ontology#"
-
-        crm_dict = {
-            nmo_prefix + "hasCollection": "P107.2_uncertain_member",
-            nmo_prefix + "hasTypeSeriesItem": "P107.2_uncertain_member",
-            nmo_prefix + "hasContemporaryName": "P102.2_uncertain_name_or_ethnic",
-            nmo_prefix + "hasScholarlyName": "P102.2_uncertain_name_or_ethnic",
-            nmo_prefix
-            + "hasDie": "P16.2_uncertain_technique_or_object_used_for_creation",
-            nmo_prefix
-            + "hasProductionObject": "P16.2_uncertain_technique_or_object_used_for_creation",
-            nmo_prefix
-            + "hasManufacture": "P16.2_uncertain_technique_or_object_used_for_creation",
-            nmo_prefix + "hasCountermark": "P103.2_uncertain_symbole_or_features",
-            nmo_prefix + "hasMintmark": "P103.2_uncertain_symbole_or_features",
-            nmo_prefix
-            + "hasSecondaryTreatment": "P103.2_uncertain_symbole_or_features",
-            nmo_prefix + "hasPeculiarity": "P103.2_uncertain_symbole_or_features",
-            nmo_prefix
-            + "hasPeculiarityOfProduction": "P103.2_uncertain_symbole_or_features",
-            nmo_prefix + "hasCorrosion": "P103.2_uncertain_symbole_or_features",
-            nmo_prefix + "hasWear": "P103.2_uncertain_symbole_or_features",
-            nmo_prefix + "hasObjectType": "P67.2_uncertain_type",
-            nmo_prefix + "representsObjectType": "P67.2_uncertain_type",
-            nmo_prefix + "hasAuthenticity": "P138.2_uncertain_authenticity",
-            nmo_prefix + "hasAuthority": "P14.2_uncertain_authority_or_issuer",
-            nmo_prefix + "hasIssuer": "P14.2_uncertain_authority_or_issuer",
-            nmo_prefix + "hasMint": "P189.2_uncertain_place",
-            nmo_prefix + "hasFindspot": "P189.2_uncertain_place",
-            nmo_prefix + "hasMaterial": "P137.2_uncertain_material",
-            nmo_prefix + "hasContext": "P136.2_uncertain_context_or_taxonomy",
-            nmo_prefix + "hasAppearance": "P139.2_uncertain_form",
-            nmo_prefix + "hasShape": "P139.2_uncertain_form",
-            nmo_prefix + "hasEdge": "P139.2_uncertain_form",
-            nmo_prefix + "hasFace": "P19.2_uncertain_mode",
-            nmo_prefix + "hasObverse": "P19.2_uncertain_mode",
-            nmo_prefix + "hasReverse": "P19.2_uncertain_mode",
-            nmo_prefix + "hasPortrait": "P62.2_uncertain_depiction",
-            nmo_prefix + "hasIconography": "P62.2_uncertain_depiction",
-            nmo_prefix + "hasLegend": "P62.2_uncertain_depiction",
-        }
-        return crm_dict
+        nodes: IdentifiedNode | Literal
+            Nodes from which the id is derived.
+        """
+        return "n" + hashlib.blake2b("\n".join(node.n3() for node in nodes).encode(), digest_size=16).hexdigest()
 
     def run_query(self, query: str, save_result: bool = True) -> pd.DataFrame | None:
         """
@@ -697,53 +1237,15 @@ class GraphGenerator:
         query: str
             String of the hole query.
         save_result: bool
-            If True, the method saves the result in data/output/query_results_fuseki.csv.
+            If True, the method saves the result in query_results_fuseki.csv in the OUTPUT_FOLDER.
         """
+        if self.rdf_star:
+            raise ValueError("Graphs of the rdf* models 9 and 10 can't be queried, because rdflib can't hold them.")
         result = self.graph.query(query)
 
         if save_result:
             dataframe = pd.DataFrame(result.bindings)
-            dataframe.to_csv(
-                str(Path(RDFIER_PATH, "data/output/query_results_fuseki.csv"))
-            )
+            dataframe.to_csv(str(self._get_output_path("query_results_fuseki.csv")))
             return dataframe
         else:
-            return
-
-    def change_to_model_9a(self) -> None:
-        """
-        Creates all rdf* uncertain statements of solution 9a.
-        """
-        for line in input(str(Path(self.OUTPUT_FOLDER, "graph.ttl")), inplace=True):
-            if "rdf:star" in line:
-                splitlist = line.split("rdf:star")
-                splitlist = splitlist[1][:-2].strip().split("$$")
-
-                # Delete ":
-                splitlist[0] = splitlist[0][1:]
-                splitlist[-1] = splitlist[-1][:-1]
-
-                line = f"<< {splitlist[0]} {splitlist[1]} {splitlist[2]} >> rdf:type edtfo:UncertainStatement .".replace(
-                    '\\"', '"'
-                )
-
-            print(line, end="")
-
-    def change_to_model_9b(self) -> None:
-        """
-        Creates all rdf* uncertain statements of solution 9b.
-        """
-        for line in input(str(Path(self.OUTPUT_FOLDER, "graph.ttl")), inplace=True):
-            if "rdf:star" in line:
-                splitlist = line.split("rdf:star")
-                splitlist = splitlist[1][:-2].strip().split("$$")
-
-                # Clean lineparts
-                splitlist[0] = splitlist[0][1:]
-                splitlist[-1] = splitlist[-1][:-1]
-
-                line = f"<< {splitlist[0]} {splitlist[1]} {splitlist[2]} >> un:hasUncertainty {splitlist[3]} .".replace(
-                    '\\"', '"'
-                )
-
-            print(line, end="")
+            return None
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import io
+from copy import copy
+from typing import Mapping
+
+import numpy as np
+from rdflib import Graph
+
+from rdfier.features.triple_table import TripleTable
+from rdfier.features.turtle_writer import TurtleWriter
+
+
+class GraphPager:
+    """
+        Splits the subjects of a TripleTable into pages, which are serialized one at a time, so a large graph can
+    be shown without serializing or sending the whole graph. The subjects keep the order in which they were added
+    to the table. search returns a pager of the subjects, whose subject or predicates contain a text. Pagers are
+    never changed, so one pager can be shared by several sessions.
+
+    Attributes
+    ----------
+    table: TripleTable
+        Table of the triples of the graph.
+    prefixes: dict[str, str]
+        Prefixes and their namespaces, which are used to compact the URIs.
+    page_size: int
+        Number of subjects of a page.
+    subjects: np.ndarray
+        Ids of the subjects of the pages.
+    """
+
+    def __init__(
+        self,
+        table: TripleTable,
+        prefixes: Mapping[str, str],
+        page_size: int = 25,
+        subjects: np.ndarray | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        table: TripleTable
+            Table of the triples of the graph. The pager doesn't change the table.
+        prefixes: Mapping[str, str]
+            Prefixes and their namespaces, which are used to compact the URIs.
+        page_size: int
+            Number of subjects of a page.
+        subjects: np.ndarray | None
+            Ids of the subjects of the pages. If None, all subjects of the table are paged.
+        """
+        self.table = table
+        self.prefixes = {prefix: str(namespace) for prefix, namespace in prefixes.items()}
+        self.page_size = page_size
+
+        # Positions of the triples ordered by subject, predicate and position:
+        self._order = np.lexsort((table.predicates, table.subjects))
+        self._sorted_subjects = table.subjects[self._order]
+        self.subjects = (
+            self._get_first_subjects() if subjects is None else np.asarray(subjects, dtype=np.int64)
+        )
+        self._texts: list[str] | None = None
+
+    @classmethod
+    def from_graph(cls, graph: Graph, page_size: int = 25) -> GraphPager:
+        """
+        Returns the pager of an rdflib graph with the prefixes of the graph.
+
+        Parameters
+        ----------
+        graph: Graph
+            Graph, whose subjects are paged.
+        page_size: int
+            Number of subjects of a page.
+        """
+        return cls(TripleTable.from_graph(graph), dict(graph.namespaces()), page_size)
+
+    @property
+    def n_pages(self) -> int:
+        """
+        Number of pages. An empty pager has one empty page.
+        """
+        return max(-(-len(self.subjects) // self.page_size), 1)
+
+    def search(self, text: str) -> GraphPager:
+        """
+        Returns a pager of the subjects, whose subject or one of its predicates contains the text. The text is
+        compared without case to the complete URI and the turtle representation of the terms. An empty text
+        returns this pager.
+
+        Parameters
+        ----------
+        text: str
+            Searched text.
+        """
+        text = text.strip().casefold()
+        if not text:
+            return self
+
+        if self._texts is None:
+            writer = TurtleWriter(io.StringIO(), self.prefixes)
+            self._texts = [f"{term} {writer.term(term)}".casefold() for term in self.table.terms]
+        matches = np.fromiter(
+            (text in term_text for term_text in self._texts), dtype=bool, count=len(self._texts)
+        )
+
+        found = matches[self.subjects]
+        found |= np.isin(self.subjects, self.table.subjects[matches[self.table.predicates]])
+        # The found pager shares the sorted triples and the texts of the terms:
+        pager = copy(self)
+        pager.subjects = self.subjects[found]
+        return pager
+
+    def get_page(self, page: int, rdf_format: str = "turtle") -> str:
+        """
+        Returns the serialized triples of the subjects of a page.
+
+        Parameters
+        ----------
+        page: int
+            Number of the page, starting with 0.
+        rdf_format: str
+            Format of the page: "turtle" or "xml". Turtle pages can hold quoted triples.
+        """
+        subjects = self.subjects[page * self.page_size:(page + 1) * self.page_size]
+        starts = np.searchsorted(self._sorted_subjects, subjects, side="left")
+        ends = np.searchsorted(self._sorted_subjects, subjects, side="right")
+        # The triples are sorted by subject, so np.searchsorted finds the triples of each subject:
+        positions = np.concatenate(
+            [self._order[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+            + [np.zeros(0, dtype=np.int64)]
+        )
+        page_table = self.table.select(positions)
+
+        if rdf_format == "xml":
+            graph = Graph()
+            for prefix, namespace in self.prefixes.items():
+                graph.bind(prefix, namespace)
+            return page_table.to_graph(graph).serialize(format="pretty-xml")
+        if rdf_format != "turtle":
+            raise ValueError(f'Unknown rdf format "{rdf_format}".')
+
+        stream = io.StringIO()
+        writer = TurtleWriter(stream, self.prefixes)
+        # The triples are already grouped by subject in the order of the page:
+        writer.write(list(page_table.triples()))
+        writer.close()
+        return stream.getvalue()
+
+    def _get_first_subjects(self) -> np.ndarray:
+        """
+        Returns the distinct subjects of the table in the order of their first triple.
+        """
+        subjects, first_positions = np.unique(self.table.subjects, return_index=True)
+        return subjects[np.argsort(first_positions)].astype(np.int64)
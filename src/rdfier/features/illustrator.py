@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import shutil
+from contextlib import nullcontext
 from pathlib import Path
+from typing import BinaryIO
 
 import requests
 
@@ -14,46 +16,81 @@ class Illustrator:
 
     Attributes
     ----------
-    path : Path
+    path : Path | None
         Path to the rdf data which should get a graphical version.
     """
 
-    def __init__(self, path: str | Path) -> None:
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        data: str | None = None,
+        rdf_format: str = "turtle",
+        output: str | Path | BinaryIO | None = None,
+    ) -> None:
         """
         Parameters
         ----------
-        path : str | Path
+        path : str | Path | None
             Path to the rdf file.
+        data : str | None
+            Serialized rdf graph, which is used instead of the file.
+        rdf_format : str
+            Format of the data: "turtle" or "xml".
+        output : str | Path | BinaryIO | None
+            Path or binary stream, like an io.BytesIO, to which the png is written.
+            Defaults to "data/output/downloaded_graph.png".
         """
         self.path = path
-        self.get_illustration(path)
+        self.get_illustration(path, data, rdf_format, output)
 
-    def get_illustration(self, path: str | Path):
+    def get_illustration(
+        self,
+        path: str | Path | None = None,
+        data: str | None = None,
+        rdf_format: str = "turtle",
+        output: str | Path | BinaryIO | None = None,
+    ):
         """
-        Method, which downloads the graphical version of the given rdf graph. Output will be saved in "data/output/downloaded_graph.png".
+        Method, which downloads the graphical version of the given rdf graph. Output will be saved in "data/output/downloaded_graph.png",
+        if no output is given.
 
         Attributes
         ----------
-        path : Path
-            Path to the rdf data which should get a graphical version.
+        path : Path | None
+            Path to the rdf data which should get a graphical version. The format is read from the file extension.
+        data : str | None
+            Serialized rdf graph, which is used instead of the file.
+        rdf_format : str
+            Format of the data: "turtle" or "xml".
+        output : str | Path | BinaryIO | None
+            Path or binary stream, to which the png is written.
         """
-        # data = open(str(path), 'r', encoding='utf-8').read()
-        data = Path(path).read_text()
-        params = {"rdf": data}
-        path = str(path)
+        params = {}
+        if data is None:
+            if path is None:
+                raise ValueError("The rdf graph needs a path or data.")
+            # data = open(str(path), 'r', encoding='utf-8').read()
+            data = Path(path).read_text()
+            path = str(path)
 
-        if path[-3:] == "rdf" or path[-3:] == "xml" or path[-3:] == "txt":
+            if path[-3:] == "rdf" or path[-3:] == "xml" or path[-3:] == "txt":
+                params["from"] = "xml"
+            elif path[-3:] != "ttl":
+                raise ValueError(
+                    'Unknown Datatyp. Please use ".rdf" or ".ttl" files as input.'
+                )
+        elif rdf_format == "xml":
             params["from"] = "xml"
-        elif path[-3:] != "ttl":
-            raise ValueError(
-                'Unknown Datatyp. Please use ".rdf" or ".ttl" files as input.'
-            )
+        elif rdf_format != "turtle":
+            raise ValueError(f'Unknown rdf format "{rdf_format}". Please use "turtle" or "xml".')
+        params["rdf"] = data
 
         response = requests.post(
             "https://www.ldf.fi/service/rdf-grapher", params=params, stream=True
         )
 
-        filename = str(Path(RDFIER_PATH, "data/output/downloaded_graph.png"))
+        if output is None:
+            output = str(Path(RDFIER_PATH, "data/output/downloaded_graph.png"))
         if response.status_code == 200:
-            with open(filename, "wb", encoding="utf-8") as f:
+            with open(output, "wb") if isinstance(output, (str, Path)) else nullcontext(output) as f:
                 shutil.copyfileobj(response.raw, f)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from rdflib import Namespace
+
+# Standard Namespaces------------------------------------------------------------------------
+CRM = Namespace("http://www.cidoc-crm.org/cidoc-crm/")
+DCTERMS = Namespace("http://purl.org/dc/terms/")
+DCMITYPE = Namespace("http://purl.org/dc/dcmitype/")
+FOAF = Namespace("http://xmlns.com/foaf/0.1/")
+GEO = Namespace("http://www.w3.org/2003/01/geo/wgs84_pos#")
+NM = Namespace("http://nomisma.org/id/")
+NMO = Namespace("http://nomisma.org/ontology#")
+ORG = Namespace("http://www.w3.org/ns/org#")
+RDF = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
+RDFS = Namespace("http://www.w3.org/2000/01/rdf-schema#")
+SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
+XSD = Namespace("http://www.w3.org/2001/XMLSchema#")
+
+# Needed for uncertainty models:
+AMT = Namespace("http://academic-meta-tool.xyz/vocab#")
+BMO = Namespace("http://collection.britishmuseum.org/id/ontology/")
+CRMINF = Namespace(
+    "http://www.cidoc-crm.org/crminf/sites/default/files/CRMinf_v0.7_.rdfs#"
+)
+EDTFO = Namespace("http://periodo.github.io/edtf-ontology/edtfo.ttl#")
+UN = Namespace(
+    "http://www.w3.org/2005/Incubator/urw3/XGR-urw3-20080331/Uncertainty.owl#"
+)
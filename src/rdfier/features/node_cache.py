@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Hashable
+
+from rdflib import IdentifiedNode, Literal
+
+
+class NodeCache:
+    """
+        Class which holds the last used rdf nodes of a GraphGenerator, so equal values are only
+    translated into nodes once. The cache is bounded and drops the least recently used node, if it is full.
+
+    Attributes
+    ----------
+    maxsize: int
+        Maximal number of nodes in the cache.
+    hits: int
+        Number of lookups, which found a node.
+    misses: int
+        Number of lookups, which found no node.
+    evictions: int
+        Number of nodes, which were dropped because the cache was full.
+    """
+
+    def __init__(self, maxsize: int = 100000) -> None:
+        """
+        Parameters
+        ----------
+        maxsize: int
+            Maximal number of nodes in the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._nodes: OrderedDict[Hashable, IdentifiedNode | Literal] = OrderedDict()
+
+    def get(self, key: Hashable) -> IdentifiedNode | Literal | None:
+        """
+        Returns the node of the key or None, if the node isn't cached.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key of the node, like a tuple of value and datatype/language.
+        """
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._nodes.move_to_end(key)
+        return node
+
+    def put(self, key: Hashable, node: IdentifiedNode | Literal) -> None:
+        """
+        Saves a node in the cache.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key of the node, like a tuple of value and datatype/language.
+        node: IdentifiedNode | Literal
+            Node which is saved.
+        """
+        self._nodes[key] = node
+        self._nodes.move_to_end(key)
+        if len(self._nodes) > self.maxsize:
+            self._nodes.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all nodes from the cache. The statistics are kept.
+        """
+        self._nodes.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the statistics of the cache.
+        """
+        return {
+            "size": len(self._nodes),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
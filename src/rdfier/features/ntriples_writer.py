@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, TextIO
+
+import numpy as np
+from rdflib import BNode, Literal, URIRef
+from rdflib.term import Node
+
+from rdfier.features.quoted_triple import QuotedTriple
+from rdfier.features.triple_sink import Triple, TripleSink
+
+if TYPE_CHECKING:
+    from rdfier.features.triple_table import TripleTable
+
+# Escapes of the literals. Control characters without a short escape are written as \uXXXX:
+LITERAL_ESCAPES = str.maketrans(
+    {chr(code): f"\\u{code:04X}" for code in [*range(0x20), 0x7F]}
+    | {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+)
+# Escapes of the characters, which IRIs of N-Triples and turtle can only hold as \uXXXX:
+IRI_ESCAPES = str.maketrans({char: f"\\u{ord(char):04X}" for char in [*map(chr, range(0x21)), *'<>"{}|^`\\']})
+# Blank node labels of N-Triples and turtle (see BLANK_NODE_LABEL of the grammar):
+_LABEL_START = (
+    "A-Za-z0-9_\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F"
+    "\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\U00010000-\U000EFFFF"
+)
+_LABEL_CHARS = _LABEL_START + "\\-\u00B7\u0300-\u036F\u203F-\u2040"
+BNODE_LABEL_REGEX = re.compile(f"[{_LABEL_START}]([{_LABEL_CHARS}.]*[{_LABEL_CHARS}])?")
+
+
+def escape_iri(iri: str) -> str:
+    """
+    Returns the IRI, whose spaces, quotes, angle brackets and other characters, which N-Triples and turtle can't
+    write, are escaped as \\uXXXX. Parsers read the escaped IRI as the original one.
+
+    Parameters
+    ----------
+    iri: str
+        String of the IRI.
+    """
+    return iri.translate(IRI_ESCAPES)
+
+
+def check_blank_node_label(label: str) -> str:
+    """
+    Returns the label of a blank node or raises a ValueError, if N-Triples and turtle can't write it.
+
+    Parameters
+    ----------
+    label: str
+        Label of the blank node.
+    """
+    if not BNODE_LABEL_REGEX.fullmatch(label):
+        raise ValueError(f'"{label}" is not a valid blank node label of N-Triples and turtle.')
+    return label
+
+
+class NTriplesWriter(TripleSink):
+    """
+        Sink which writes triples as N-Triples or N-Quads lines to a text stream in batches, so neither the graph
+    nor the serialized graph is held in memory. Unlike a Graph the writer doesn't remove duplicated triples.
+    Quoted triples are written as N-Triples-star.
+
+    Attributes
+    ----------
+    stream: TextIO
+        Text stream, to which the lines are written.
+    graph_name: URIRef | None
+        Name of the graph of the N-Quads lines. If None, N-Triples lines are written.
+    """
+
+    def __init__(
+        self, stream: TextIO, graph_name: URIRef | None = None, batch_size: int = 10000
+    ) -> None:
+        """
+        Parameters
+        ----------
+        stream: TextIO
+            Text stream, to which the lines are written.
+        graph_name: URIRef | None
+            Name of the graph of the N-Quads lines. If None, N-Triples lines are written.
+        batch_size: int
+            Number of triples, which are collected before their lines are written to the stream.
+        """
+        super().__init__(batch_size)
+        self.stream = stream
+        self.graph_name = graph_name
+        self._line_end = " .\n" if graph_name is None else f" {self.term(graph_name)} .\n"
+
+    def write(self, triples: list[Triple]) -> None:
+        term, line_end = self.term, self._line_end
+        self.stream.write(
+            "".join(
+                f"{term(subject)} {term(predicate)} {term(objekt)}{line_end}"
+                for subject, predicate, objekt in triples
+            )
+        )
+
+    def add_table(self, table: TripleTable) -> None:
+        """
+        Writes the triples of a TripleTable. Every term of the table is formatted once and the lines are joined
+        from the id arrays.
+
+        Parameters
+        ----------
+        table: TripleTable
+            Table whose triples are written.
+        """
+        self.flush()
+        texts = np.array([self.term(term) for term in table.terms], dtype=object)
+        subjects, predicates, objects = table.subjects, table.predicates, table.objects
+        for start in range(0, len(table), self.batch_size):
+            end = start + self.batch_size
+            self.stream.write(
+                "".join(
+                    texts[subjects[start:end]] + " " + texts[predicates[start:end]] + " "
+                    + texts[objects[start:end]] + self._line_end
+                )
+            )
+            self.count += len(subjects[start:end])
+
+    @staticmethod
+    def term(node: Node | QuotedTriple) -> str:
+        """
+        Returns the N-Triples representation of a node. Invalid characters of IRIs are escaped, invalid
+        blank node labels raise a ValueError (see escape_iri and check_blank_node_label).
+
+        Parameters
+        ----------
+        node: Node | QuotedTriple
+            URIRef, BNode, Literal or QuotedTriple.
+        """
+        if isinstance(node, QuotedTriple):
+            return f"<< {' '.join(NTriplesWriter.term(part) for part in node)} >>"
+        if isinstance(node, Literal):
+            lexical = f'"{str(node).translate(LITERAL_ESCAPES)}"'
+            if node.language:
+                return f"{lexical}@{node.language}"
+            if node.datatype:
+                return f"{lexical}^^<{escape_iri(node.datatype)}>"
+            return lexical
+        if isinstance(node, BNode):
+            return f"_:{check_blank_node_label(node)}"
+        return f"<{escape_iri(str(node))}>"
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from rdflib import IdentifiedNode, Literal, URIRef
+
+
+class QuotedTriple(NamedTuple):
+    """
+        Quoted triple of RDF-star, which can be the subject of a statement. rdflib can't hold quoted triples
+    in a graph, so they are only written by the NTriplesWriter and the TurtleWriter as "<< subject predicate object >>".
+
+    Attributes
+    ----------
+    subject: IdentifiedNode | Literal
+        Node of the subject of the quoted triple.
+    predicate: URIRef
+        Node of the predicate of the quoted triple.
+    objekt: IdentifiedNode | Literal
+        Node of the object of the quoted triple.
+    """
+
+    subject: IdentifiedNode | Literal
+    predicate: URIRef
+    objekt: IdentifiedNode | Literal
+
+    def n3(self) -> str:
+        """
+        Returns the N-Triples-star representation of the quoted triple.
+        """
+        return f"<< {self.subject.n3()} {self.predicate.n3()} {self.objekt.n3()} >>"
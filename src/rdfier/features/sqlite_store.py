@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Generator, Iterable, Iterator
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.store import NO_STORE, VALID_STORE, Store
+from rdflib.term import Node
+
+# Kinds of the terms in the terms table:
+URI, BLANK, PLAIN_LITERAL, LANGUAGE_LITERAL, TYPED_LITERAL = range(5)
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS terms ("
+    "id INTEGER PRIMARY KEY, kind INTEGER NOT NULL, value TEXT NOT NULL, extra TEXT NOT NULL, "
+    "UNIQUE (kind, value, extra))",
+    "CREATE TABLE IF NOT EXISTS triples ("
+    "s INTEGER NOT NULL, p INTEGER NOT NULL, o INTEGER NOT NULL, PRIMARY KEY (s, p, o)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS triples_pos ON triples (p, o, s)",
+    "CREATE INDEX IF NOT EXISTS triples_osp ON triples (o, s, p)",
+    "CREATE TABLE IF NOT EXISTS namespaces (prefix TEXT PRIMARY KEY, namespace TEXT NOT NULL UNIQUE)",
+)
+
+
+class SQLiteStore(Store):
+    """
+        rdflib store, which saves the triples of one graph in a SQLite database file instead of the memory, so graphs
+    larger than the memory can be generated and queried (see GraphGenerator). Every term is saved once in the terms
+    table and the triples table holds the term ids with the indexes SPO, POS and OSP, so every triple pattern is
+    answered by an index. The triples of Graph.addN are inserted in transactions of batch_size triples.
+
+    Attributes
+    ----------
+    path: str | None
+        Path of the database file or ":memory:".
+    batch_size: int
+        Number of triples, which are inserted in one transaction.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = True
+    graph_aware = False
+
+    def __init__(
+        self,
+        configuration: str | Path | None = None,
+        identifier: URIRef | None = None,
+        batch_size: int = 10000,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        configuration: str | Path | None
+            Path of the database file. If given, the database is opened and created if it doesn't exist.
+        identifier: URIRef | None
+            URI of the store.
+        batch_size: int
+            Number of triples, which are inserted in one transaction.
+        """
+        self.path: str | None = None
+        self.batch_size = batch_size
+        self._connection: sqlite3.Connection | None = None
+        self._pending = 0
+        self._term_ids: dict[Node, int] = {}
+        self._terms: dict[int, Node] = {}
+        super().__init__(None, identifier)
+        if configuration is not None:
+            self.open(str(configuration), create=True)
+
+    def open(self, configuration: str | tuple[str, str], create: bool = False) -> int:
+        """
+        Opens the database file.
+
+        Parameters
+        ----------
+        configuration: str | tuple[str, str]
+            Path of the database file or ":memory:".
+        create: bool
+            If True, the database is created, if it doesn't exist.
+        """
+        configuration = str(configuration)
+        if not create and configuration != ":memory:" and not Path(configuration).exists():
+            return NO_STORE
+
+        self.path = configuration
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self._connection.execute(statement)
+        self._connection.commit()
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = True) -> None:
+        """
+        Closes the database file.
+
+        Parameters
+        ----------
+        commit_pending_transaction: bool
+            If True, the inserted triples, which aren't committed yet, are saved. Otherwise they are discarded.
+        """
+        if self._connection is None:
+            return
+        if commit_pending_transaction:
+            self.commit()
+        else:
+            self.rollback()
+        self._connection.close()
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Connection of the opened database file.
+        """
+        if self._connection is None:
+            raise ValueError("The SQLiteStore isn't opened.")
+        return self._connection
+
+    def add(self, triple: tuple[Node, Node, Node], context=None, quoted: bool = False) -> None:
+        """
+        Adds a triple. The transaction is committed every batch_size triples.
+
+        Parameters
+        ----------
+        triple: tuple[Node, Node, Node]
+            Subject, predicate and object of the triple.
+        """
+        subject, predicate, objekt = triple
+        self._insert(
+            [(self._get_term_id(subject), self._get_term_id(predicate), self._get_term_id(objekt))]
+        )
+
+    def addN(self, quads: Iterable[tuple[Node, Node, Node, object]]) -> None:  # noqa: N802
+        """
+        Adds the triples of the quads in transactions of batch_size triples.
+
+        Parameters
+        ----------
+        quads: Iterable[tuple[Node, Node, Node, object]]
+            Subject, predicate, object and graph of each triple. The graph is ignored.
+        """
+        batch = []
+        for subject, predicate, objekt, _ in quads:
+            batch.append(
+                (self._get_term_id(subject), self._get_term_id(predicate), self._get_term_id(objekt))
+            )
+            if len(batch) >= self.batch_size:
+                self._insert(batch)
+                batch = []
+        self._insert(batch)
+
+    def remove(self, triple_pattern: tuple, context=None) -> None:
+        """
+        Removes all triples, which match the pattern. None matches every term.
+
+        Parameters
+        ----------
+        triple_pattern: tuple
+            Subject, predicate and object of the pattern.
+        """
+        if all(term is None for term in triple_pattern):
+            self.connection.execute("DELETE FROM triples")
+            self.connection.execute("DELETE FROM terms")
+            self._term_ids.clear()
+            self._terms.clear()
+            return
+
+        condition, parameters = self._get_condition(triple_pattern, "")
+        if condition is not None:
+            # The condition only holds column names and placeholders (see _get_condition):
+            self.connection.execute(f"DELETE FROM triples WHERE {condition}", parameters)  # nosec B608
+            self._pending += 1
+
+    def triples(self, triple_pattern: tuple, context=None) -> Iterator[tuple[tuple, Iterator]]:
+        """
+        Returns all triples, which match the pattern. None matches every term.
+
+        Parameters
+        ----------
+        triple_pattern: tuple
+            Subject, predicate and object of the pattern.
+        """
+        condition, parameters = self._get_condition(triple_pattern, "t.")
+        if condition is None:
+            return
+
+        # The condition only holds column names and placeholders (see _get_condition):
+        query = (
+            "SELECT t.s, s.kind, s.value, s.extra, t.p, p.kind, p.value, p.extra, "  # nosec B608
+            "t.o, o.kind, o.value, o.extra FROM triples AS t "
+            "JOIN terms AS s ON s.id = t.s JOIN terms AS p ON p.id = t.p "
+            f"JOIN terms AS o ON o.id = t.o WHERE {condition}"
+        )
+        cursor = self.connection.execute(query, parameters)
+        for row in cursor:
+            yield (
+                self._get_term(*row[0:4]),
+                self._get_term(*row[4:8]),
+                self._get_term(*row[8:12]),
+            ), iter(())
+
+    def __len__(self, context=None) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM triples").fetchone()[0]
+
+    def contexts(self, triple=None) -> Generator[Graph, None, None]:
+        yield from ()
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """
+        Binds a prefix to a namespace.
+
+        Parameters
+        ----------
+        prefix: str
+            Prefix of the namespace.
+        namespace: URIRef
+            URI of the namespace.
+        override: bool
+            If True, an existing binding of the prefix or the namespace is replaced.
+        """
+        if not override and (self.namespace(prefix) is not None or self.prefix(namespace) is not None):
+            return
+        self.connection.execute(
+            "DELETE FROM namespaces WHERE prefix = ? OR namespace = ?", (prefix, str(namespace))
+        )
+        self.connection.execute(
+            "INSERT INTO namespaces VALUES (?, ?)", (prefix, str(namespace))
+        )
+        self._pending += 1
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        row = self.connection.execute(
+            "SELECT prefix FROM namespaces WHERE namespace = ?", (str(namespace),)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        row = self.connection.execute(
+            "SELECT namespace FROM namespaces WHERE prefix = ?", (prefix,)
+        ).fetchone()
+        return None if row is None else URIRef(row[0])
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        for prefix, namespace in self.connection.execute("SELECT prefix, namespace FROM namespaces"):
+            yield prefix, URIRef(namespace)
+
+    def commit(self) -> None:
+        """
+        Saves all changes of the current transaction.
+        """
+        self.connection.commit()
+        self._pending = 0
+
+    def rollback(self) -> None:
+        """
+        Discards all changes of the current transaction.
+        """
+        self.connection.rollback()
+        self._pending = 0
+        self._term_ids.clear()
+        self._terms.clear()
+
+    def _insert(self, batch: list[tuple[int, int, int]]) -> None:
+        """
+        Inserts the term ids of triples and commits the transaction, if it holds batch_size changes.
+
+        Parameters
+        ----------
+        batch: list[tuple[int, int, int]]
+            Term ids of the subject, predicate and object of each triple.
+        """
+        if batch:
+            self.connection.executemany("INSERT OR IGNORE INTO triples VALUES (?, ?, ?)", batch)
+            self._pending += len(batch)
+        if self._pending >= self.batch_size:
+            self.commit()
+
+    def _get_condition(self, triple_pattern: tuple, alias: str) -> tuple[str | None, list[int]]:
+        """
+        Returns the SQL condition of a triple pattern and its parameters. The condition is None, if a term of
+        the pattern isn't in the store, so no triple matches.
+
+        Parameters
+        ----------
+        triple_pattern: tuple
+            Subject, predicate and object of the pattern.
+        alias: str
+            Prefix of the columns of the triples table, like "t.".
+        """
+        conditions, parameters = ["1"], []
+        for column, term in zip("spo", triple_pattern):
+            if term is None:
+                continue
+            term_id = self._find_term_id(term)
+            if term_id is None:
+                return None, []
+            conditions.append(f"{alias}{column} = ?")
+            parameters.append(term_id)
+        return " AND ".join(conditions), parameters
+
+    def _get_term_id(self, term: Node) -> int:
+        """
+        Returns the id of a term and inserts the term, if it isn't in the store.
+
+        Parameters
+        ----------
+        term: Node
+            URIRef, BNode or Literal.
+        """
+        term_id = self._find_term_id(term)
+        if term_id is None:
+            term_id = self.connection.execute(
+                "INSERT INTO terms (kind, value, extra) VALUES (?, ?, ?)", self._get_key(term)
+            ).lastrowid
+            assert term_id is not None  # Every insert sets the id of its row
+            self._cache_term_id(term, term_id)
+        return term_id
+
+    def _find_term_id(self, term: Node) -> int | None:
+        """
+        Returns the id of a term or None, if the term isn't in the store. The ids of the last used terms are cached.
+
+        Parameters
+        ----------
+        term: Node
+            URIRef, BNode or Literal.
+        """
+        term_id = self._term_ids.get(term)
+        if term_id is not None:
+            return term_id
+
+        row = self.connection.execute(
+            "SELECT id FROM terms WHERE kind = ? AND value = ? AND extra = ?", self._get_key(term)
+        ).fetchone()
+        if row is None:
+            return None
+        self._cache_term_id(term, row[0])
+        return row[0]
+
+    def _cache_term_id(self, term: Node, term_id: int) -> None:
+        """
+        Saves the id of a term in the cache of the last used terms.
+
+        Parameters
+        ----------
+        term: Node
+            URIRef, BNode or Literal.
+        term_id: int
+            Id of the term.
+        """
+        if len(self._term_ids) >= 100000:
+            self._term_ids.clear()
+        self._term_ids[term] = term_id
+
+    def _get_term(self, term_id: int, kind: int, value: str, extra: str) -> Node:
+        """
+        Returns the term of a row of the terms table. The last read terms are cached.
+
+        Parameters
+        ----------
+        term_id: int
+            Id of the term.
+        kind: int
+            Kind of the term, like URI or TYPED_LITERAL.
+        value: str
+            URI, blank node id or lexical form of the term.
+        extra: str
+            Language or datatype of a literal. Otherwise empty.
+        """
+        term = self._terms.get(term_id)
+        if term is not None:
+            return term
+
+        if kind == URI:
+            term = URIRef(value)
+        elif kind == BLANK:
+            term = BNode(value)
+        elif kind == PLAIN_LITERAL:
+            term = Literal(value)
+        elif kind == LANGUAGE_LITERAL:
+            term = Literal(value, lang=extra)
+        else:
+            term = Literal(value, datatype=URIRef(extra), normalize=False)
+
+        if len(self._terms) >= 100000:
+            self._terms.clear()
+        self._terms[term_id] = term
+        return term
+
+    @staticmethod
+    def _get_key(term: Node) -> tuple[int, str, str]:
+        """
+        Returns the kind, value and extra of a term, which identify the term in the terms table.
+
+        Parameters
+        ----------
+        term: Node
+            URIRef, BNode or Literal.
+        """
+        if isinstance(term, Literal):
+            if term.language:
+                return LANGUAGE_LITERAL, str(term), term.language
+            if term.datatype:
+                return TYPED_LITERAL, str(term), str(term.datatype)
+            return PLAIN_LITERAL, str(term), ""
+        if isinstance(term, BNode):
+            return BLANK, str(term), ""
+        if isinstance(term, URIRef):
+            return URI, str(term), ""
+        raise TypeError(f'Term "{term}" can\'t be saved in a SQLiteStore.')
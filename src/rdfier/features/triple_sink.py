@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterable, Union
+
+from rdflib import Graph
+from rdflib.term import Node
+
+from rdfier.features.quoted_triple import QuotedTriple
+
+if TYPE_CHECKING:
+    from rdfier.features.triple_table import TripleTable
+
+Triple = tuple[Union[Node, QuotedTriple], Node, Node]  # Subjects of the rdf* models are quoted triples
+
+
+class TripleSink(ABC):
+    """
+        Base class of the destinations of the generated triples. The triples are collected and written in batches,
+    so the GraphGenerator and the uncertainty models don't depend on the backend. Subclasses implement write.
+
+    Attributes
+    ----------
+    batch_size: int
+        Number of triples, which are collected before they are written.
+    count: int
+        Number of written triples.
+    """
+
+    def __init__(self, batch_size: int = 10000) -> None:
+        """
+        Parameters
+        ----------
+        batch_size: int
+            Number of triples, which are collected before they are written.
+        """
+        self.batch_size = batch_size
+        self.count = 0
+        self._batch: list[Triple] = []
+
+    def add(self, triple: Triple) -> None:
+        """
+        Adds a triple.
+
+        Parameters
+        ----------
+        triple: Triple
+            Subject, predicate and object of the triple.
+        """
+        self._batch.append(triple)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def add_triples(self, triples: Iterable[Triple]) -> None:
+        """
+        Adds a batch of triples.
+
+        Parameters
+        ----------
+        triples: Iterable[Triple]
+            Triples which are added.
+        """
+        self._batch.extend(triples)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def add_table(self, table: TripleTable) -> None:
+        """
+        Adds the triples of a TripleTable in batches. Writers override it to serialize the id arrays of the table.
+
+        Parameters
+        ----------
+        table: TripleTable
+            Table whose triples are added.
+        """
+        for start in range(0, len(table), self.batch_size):
+            self.add_triples(table.triples(start, start + self.batch_size))
+
+    def flush(self) -> None:
+        """
+        Writes the collected triples.
+        """
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self.write(batch)
+            self.count += len(batch)
+
+    def close(self) -> None:
+        """
+        Writes the remaining triples. Streams and graphs of the sink stay open.
+        """
+        self.flush()
+
+    @abstractmethod
+    def write(self, triples: list[Triple]) -> None:
+        """
+        Writes a batch of triples to the backend.
+
+        Parameters
+        ----------
+        triples: list[Triple]
+            Triples which are written.
+        """
+
+
+class GraphSink(TripleSink):
+    """
+        Sink which adds the triples to an rdflib graph with Graph.addN, so the store of the graph handles each
+    batch at once (see SQLiteStore).
+
+    Attributes
+    ----------
+    graph: Graph
+        Graph to which the triples are added.
+    """
+
+    def __init__(self, graph: Graph, batch_size: int = 10000) -> None:
+        """
+        Parameters
+        ----------
+        graph: Graph
+            Graph to which the triples are added.
+        batch_size: int
+            Number of triples, which are collected before they are added.
+        """
+        super().__init__(batch_size)
+        self.graph = graph
+
+    def write(self, triples: list[Triple]) -> None:
+        # Only the triples of the models 1 to 8 are added, because rdflib graphs can't hold quoted triples:
+        self.graph.addN((*triple, self.graph) for triple in triples)  # type: ignore[misc]
+
+
+class ListSink(TripleSink):
+    """
+        Sink which collects the triples in a list, like the triples of a part of the rows, which are sent from a
+    worker process to the GraphGenerator.
+
+    Attributes
+    ----------
+    triples: list[Triple]
+        Written triples.
+    """
+
+    def __init__(self, batch_size: int = 10000) -> None:
+        """
+        Parameters
+        ----------
+        batch_size: int
+            Number of triples, which are collected before they are appended to the list.
+        """
+        super().__init__(batch_size)
+        self.triples: list[Triple] = []
+
+    def write(self, triples: list[Triple]) -> None:
+        self.triples.extend(triples)
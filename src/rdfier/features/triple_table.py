@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from typing import Hashable, Iterable, Iterator
+
+import numpy as np
+from rdflib import Graph
+from rdflib.term import Node
+
+from rdfier.features.quoted_triple import QuotedTriple
+from rdfier.features.triple_sink import Triple, TripleSink
+
+
+class TripleTable(TripleSink):
+    """
+        Dictionary encoded table of triples. Every distinct term is saved once in the terms list and the triples
+    are saved as three integer arrays with the ids of their subjects, predicates and objects, which are indices
+    into the terms list. The GraphGenerator builds the table column by column (see GraphGenerator.generate_table),
+    the writers serialize it without building a node tuple per triple (see TripleSink.add_table) and to_graph and
+    from_graph convert it from and to an rdflib graph. Removing duplicates, sorting, sharding and statistics are
+    array operations. As a TripleSink the table interns the terms of added triples.
+
+    Attributes
+    ----------
+    terms: list[Node | QuotedTriple]
+        Distinct terms of the table. The id of a term is its index.
+    """
+
+    def __init__(self, batch_size: int = 10000) -> None:
+        """
+        Parameters
+        ----------
+        batch_size: int
+            Number of triples, which are collected before their terms are interned.
+        """
+        super().__init__(batch_size)
+        self.terms: list[Node | QuotedTriple] = []
+        self._term_ids: dict[Hashable, int] = {}
+        self._chunks: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._ids: tuple[np.ndarray, np.ndarray, np.ndarray] = (np.zeros(0, dtype=np.int32),) * 3
+
+    def intern(self, term: Node | QuotedTriple) -> int:
+        """
+        Returns the id of a term and adds the term, if it's new.
+
+        Parameters
+        ----------
+        term: Node | QuotedTriple
+            URIRef, BNode, Literal or QuotedTriple.
+        """
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = self._term_ids[term] = len(self.terms)
+            self.terms.append(term)
+        return term_id
+
+    def intern_all(self, terms: Iterable[Node | QuotedTriple]) -> list[int]:
+        """
+        Returns the ids of the terms and adds the new terms.
+
+        Parameters
+        ----------
+        terms: Iterable[Node | QuotedTriple]
+            URIRefs, BNodes, Literals or QuotedTriples.
+        """
+        return [self.intern(term) for term in terms]
+
+    def add_ids(self, subjects: np.ndarray, predicates: np.ndarray, objects: np.ndarray) -> None:
+        """
+        Adds triples, whose terms are already interned.
+
+        Parameters
+        ----------
+        subjects: np.ndarray
+            Ids of the subjects.
+        predicates: np.ndarray
+            Ids of the predicates.
+        objects: np.ndarray
+            Ids of the objects.
+        """
+        if len(subjects):
+            self._chunks.append((subjects, predicates, objects))
+            self.count += len(subjects)
+
+    def write(self, triples: list[Triple]) -> None:
+        ids = np.array([self.intern_all(triple) for triple in triples], dtype=np.int64).reshape(-1, 3)
+        self._chunks.append((ids[:, 0], ids[:, 1], ids[:, 2]))
+
+    @property
+    def subjects(self) -> np.ndarray:
+        """
+        Ids of the subjects of all triples.
+        """
+        return self._get_ids()[0]
+
+    @property
+    def predicates(self) -> np.ndarray:
+        """
+        Ids of the predicates of all triples.
+        """
+        return self._get_ids()[1]
+
+    @property
+    def objects(self) -> np.ndarray:
+        """
+        Ids of the objects of all triples.
+        """
+        return self._get_ids()[2]
+
+    def __len__(self) -> int:
+        return len(self._get_ids()[0])
+
+    def triples(self, start: int = 0, stop: int | None = None) -> Iterator[Triple]:
+        """
+        Returns the triples of the table as tuples of terms.
+
+        Parameters
+        ----------
+        start: int
+            Position of the first returned triple.
+        stop: int | None
+            Position after the last returned triple. If None, the triples until the end are returned.
+        """
+        terms = self.terms
+        subjects, predicates, objects = (ids[start:stop].tolist() for ids in self._get_ids())
+        for subject, predicate, objekt in zip(subjects, predicates, objects):
+            yield terms[subject], terms[predicate], terms[objekt]
+
+    def deduplicate(self) -> None:
+        """
+        Removes duplicated triples. The first occurrence of each triple keeps its position.
+        """
+        if len(self):
+            _, first_positions = np.unique(np.stack(self._get_ids(), axis=1), axis=0, return_index=True)
+            self._set_ids(np.sort(first_positions))
+
+    def sort(self, order: str = "spo") -> None:
+        """
+        Sorts the triples by the ids of their terms. Triples with equal ids keep their order.
+
+        Parameters
+        ----------
+        order: str
+            Permutation of "spo", which gives the sort keys, like "pos" to sort by predicate, object and subject.
+        """
+        if sorted(order) != ["o", "p", "s"]:
+            raise ValueError(f'Unknown sort order "{order}". Use a permutation of "spo".')
+        ids = dict(zip("spo", self._get_ids()))
+        self._set_ids(np.lexsort([ids[key] for key in reversed(order)]))
+
+    def shard(self, n_shards: int) -> list[TripleTable]:
+        """
+        Splits the triples into tables by the ids of their subjects, so all triples of a subject are in the same
+        shard and the shards can be serialized independently. The shards share the terms of this table.
+
+        Parameters
+        ----------
+        n_shards: int
+            Number of shards.
+        """
+        shard_ids = self.subjects % n_shards
+        return [self.select(np.flatnonzero(shard_ids == shard)) for shard in range(n_shards)]
+
+    def select(self, positions: np.ndarray) -> TripleTable:
+        """
+        Returns a table of the triples at the positions, which shares the terms of this table.
+
+        Parameters
+        ----------
+        positions: np.ndarray
+            Positions of the selected triples.
+        """
+        table = type(self)(self.batch_size)
+        table.terms, table._term_ids = self.terms, self._term_ids
+        table._ids = tuple(ids[positions] for ids in self._get_ids())
+        table.count = len(positions)
+        return table
+
+    def stats(self) -> dict:
+        """
+        Returns the number of triples, terms, distinct subjects, predicates and objects and the number of triples
+        of each predicate.
+        """
+        subjects, predicates, objects = self._get_ids()
+        predicate_ids, predicate_counts = np.unique(predicates, return_counts=True)
+        return {
+            "triples": len(subjects),
+            "terms": len(self.terms),
+            "subjects": len(np.unique(subjects)),
+            "predicates": len(predicate_ids),
+            "objects": len(np.unique(objects)),
+            "predicate_counts": {
+                self.terms[predicate]: count
+                for predicate, count in zip(predicate_ids.tolist(), predicate_counts.tolist())
+            },
+        }
+
+    def to_graph(self, graph: Graph | None = None) -> Graph:
+        """
+        Adds the triples to an rdflib graph in batches of batch_size triples and returns the graph. rdflib graphs
+        can't hold quoted triples, so the tables of the rdf* models are written with the writers instead.
+
+        Parameters
+        ----------
+        graph: Graph | None
+            Graph to which the triples are added. If None, a new graph is returned.
+        """
+        if graph is None:
+            graph = Graph()
+        for start in range(0, len(self), self.batch_size):
+            graph.addN(
+                (*triple, graph) for triple in self.triples(start, start + self.batch_size)  # type: ignore[misc]
+            )
+        return graph
+
+    @classmethod
+    def from_graph(cls, graph: Graph, batch_size: int = 10000) -> TripleTable:
+        """
+        Returns the table of the triples of an rdflib graph.
+
+        Parameters
+        ----------
+        graph: Graph
+            Graph whose triples are read.
+        batch_size: int
+            Number of triples, which are collected before their terms are interned.
+        """
+        table = cls(batch_size)
+        for triple in graph:
+            table.add(triple)
+        table.flush()
+        return table
+
+    def _get_ids(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the id arrays of all triples. The added chunks are concatenated into arrays of the smallest
+        integer type, which holds all ids.
+        """
+        self.flush()
+        if self._chunks:
+            dtype = np.int32 if len(self.terms) <= np.iinfo(np.int32).max else np.int64
+            self._ids = tuple(
+                np.concatenate([self._ids[position]] + [chunk[position] for chunk in self._chunks]).astype(
+                    dtype, copy=False
+                )
+                for position in range(3)
+            )
+            self._chunks.clear()
+        return self._ids
+
+    def _set_ids(self, positions: np.ndarray) -> None:
+        """
+        Keeps only the triples at the positions in the given order.
+
+        Parameters
+        ----------
+        positions: np.ndarray
+            Positions of the kept triples.
+        """
+        self._ids = tuple(ids[positions] for ids in self._get_ids())
+        self.count = len(positions)
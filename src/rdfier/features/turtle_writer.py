@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Mapping, TextIO
+
+import numpy as np
+from rdflib import BNode, Literal
+from rdflib.term import Node
+
+from rdfier.features.namespaces import RDF
+from rdfier.features.ntriples_writer import (LITERAL_ESCAPES,
+                                             check_blank_node_label,
+                                             escape_iri)
+from rdfier.features.quoted_triple import QuotedTriple
+from rdfier.features.triple_sink import Triple, TripleSink
+
+if TYPE_CHECKING:
+    from rdfier.features.triple_table import TripleTable
+
+# Conservative patterns of the prefixes and local names, which can be written in prefix shape:
+PREFIX_REGEX = re.compile(r"([A-Za-z]([A-Za-z0-9_.-]*[A-Za-z0-9_-])?)?")
+LOCAL_NAME_REGEX = re.compile(r"([A-Za-z0-9_]([A-Za-z0-9_.-]*[A-Za-z0-9_-])?)?")
+
+
+class TurtleWriter(TripleSink):
+    """
+        Sink which writes triples as turtle to a text stream in batches. Consecutive triples with the same subject
+    are written as one block "subject predicate object ; predicate object, object ." and URIs are compacted with
+    the prefixes. The triples of the GraphGenerator arrive row by row, so most subjects get one block without
+    holding the graph in memory. Unlike a Graph the writer doesn't remove duplicated triples. Quoted triples
+    are written as turtle-star.
+
+    Attributes
+    ----------
+    stream: TextIO
+        Text stream, to which the turtle is written.
+    prefixes: dict[str, str]
+        Prefixes and their namespaces.
+    """
+
+    def __init__(
+        self, stream: TextIO, prefixes: Mapping[str, str], batch_size: int = 10000
+    ) -> None:
+        """
+        Parameters
+        ----------
+        stream: TextIO
+            Text stream, to which the turtle is written.
+        prefixes: Mapping[str, str]
+            Prefixes and their namespaces, which are used to compact the URIs.
+        batch_size: int
+            Number of triples, which are collected before they are written to the stream.
+        """
+        super().__init__(batch_size)
+        self.stream = stream
+        self.prefixes = {
+            prefix: str(namespace)
+            for prefix, namespace in prefixes.items()
+            if PREFIX_REGEX.fullmatch(prefix)
+        }
+        self._namespaces = sorted(
+            ((namespace, prefix) for prefix, namespace in self.prefixes.items()),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._terms: dict[Node | QuotedTriple, str] = {}
+        self._subject: Node | QuotedTriple | None = None
+        self._predicate: Node | None = None
+        self.stream.write(
+            "".join(f"@prefix {prefix}: <{namespace}> .\n" for prefix, namespace in self.prefixes.items())
+        )
+
+    def write(self, triples: list[Triple]) -> None:
+        """
+        Writes a batch of triples. The block of the last subject stays open.
+
+        Parameters
+        ----------
+        triples: list[Triple]
+            Triples which are written.
+        """
+        parts = []
+        for subject, predicate, objekt in triples:
+            if subject == self._subject:
+                if predicate == self._predicate:
+                    parts.append(f" ,\n        {self.term(objekt)}")
+                else:
+                    parts.append(f" ;\n    {self._predicate_term(predicate)} {self.term(objekt)}")
+            else:
+                if self._subject is not None:
+                    parts.append(" .\n")
+                parts.append(
+                    f"\n{self.term(subject)} {self._predicate_term(predicate)} {self.term(objekt)}"
+                )
+                self._subject = subject
+            self._predicate = predicate
+        self.stream.write("".join(parts))
+
+    def add_table(self, table: TripleTable) -> None:
+        """
+        Writes the triples of a TripleTable ordered by subject and predicate, so every subject of the table gets
+        one block. The table itself isn't sorted.
+
+        Parameters
+        ----------
+        table: TripleTable
+            Table whose triples are written.
+        """
+        self.flush()
+        terms = table.terms
+        order = np.lexsort((table.predicates, table.subjects))
+        subjects, predicates, objects = table.subjects[order], table.predicates[order], table.objects[order]
+        for start in range(0, len(order), self.batch_size):
+            end = start + self.batch_size
+            self.write(
+                [
+                    (terms[subject], terms[predicate], terms[objekt])
+                    for subject, predicate, objekt in zip(
+                        subjects[start:end].tolist(), predicates[start:end].tolist(), objects[start:end].tolist()
+                    )
+                ]
+            )
+            self.count += len(order[start:end])
+
+    def close(self) -> None:
+        """
+        Writes the remaining triples and closes the block of the last subject. The stream itself stays open.
+        """
+        self.flush()
+        if self._subject is not None:
+            self.stream.write(" .\n")
+            self._subject = self._predicate = None
+
+    def term(self, node: Node | QuotedTriple) -> str:
+        """
+        Returns the turtle representation of a node. Invalid characters of IRIs are escaped, invalid
+        blank node labels raise a ValueError (see escape_iri and check_blank_node_label).
+
+        Parameters
+        ----------
+        node: Node | QuotedTriple
+            URIRef, BNode, Literal or QuotedTriple.
+        """
+        if isinstance(node, QuotedTriple):
+            return f"<< {' '.join(self.term(part) for part in node)} >>"
+        if node in self._terms:
+            return self._terms[node]
+
+        if isinstance(node, Literal):
+            text = f'"{str(node).translate(LITERAL_ESCAPES)}"'
+            if node.language:
+                text = f"{text}@{node.language}"
+            elif node.datatype:
+                text = f"{text}^^{self.term(node.datatype)}"
+        elif isinstance(node, BNode):
+            text = f"_:{check_blank_node_label(node)}"
+        else:
+            text = self._compact_uri(str(node))
+
+        if len(self._terms) >= 100000:
+            self._terms.clear()
+        self._terms[node] = text
+        return text
+
+    def _predicate_term(self, predicate: Node) -> str:
+        """
+        Returns the turtle representation of a predicate.
+
+        Parameters
+        ----------
+        predicate: Node
+            URIRef of the predicate.
+        """
+        return "a" if predicate == RDF["type"] else self.term(predicate)
+
+    def _compact_uri(self, uri: str) -> str:
+        """
+        Returns the URI in prefix shape, if it starts with a namespace of the prefixes and the rest is a
+        valid local name. Otherwise the complete, escaped URI is returned.
+
+        Parameters
+        ----------
+        uri: str
+            String of the URI.
+        """
+        for namespace, prefix in self._namespaces:
+            if uri.startswith(namespace) and LOCAL_NAME_REGEX.fullmatch(
+                local_name := uri[len(namespace):]
+            ):
+                return f"{prefix}:{local_name}"
+        return f"<{escape_iri(uri)}>"
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+from typing import (TYPE_CHECKING, Callable, Iterator, NamedTuple, Sequence,
+                    TypeVar, cast)
+
+from rdflib import BNode, IdentifiedNode, Literal, URIRef
+
+from rdfier.features.namespaces import (AMT, BMO, CRM, CRMINF, EDTFO, NM, RDF,
+                                        UN, XSD)
+from rdfier.features.quoted_triple import QuotedTriple
+from rdfier.features.triple_sink import Triple
+
+if TYPE_CHECKING:
+    from rdfier.features.graph_generator import GraphGenerator
+
+Model = TypeVar("Model", bound="type[UncertaintyModel]")
+
+
+class UncertainStatement(NamedTuple):
+    """
+        Statement with uncertainty, which is translated into rdf triples by an uncertainty model.
+
+    Attributes
+    ----------
+    subject: IdentifiedNode | Literal
+        Node of the subject of the uncertain statement.
+    predicate: URIRef
+        Node of the predicate of the uncertain statement.
+    objekt: IdentifiedNode | Literal
+        Node of the object of the uncertain statement.
+    weight: float | None
+        Weight of the uncertain statement. None, if the model doesn't need weights.
+    object_index: int
+        Index of the object of its cell.
+    """
+
+    subject: IdentifiedNode | Literal
+    predicate: URIRef
+    objekt: IdentifiedNode | Literal
+    weight: float | None
+    object_index: int
+
+
+class UncertaintyModel:
+    """
+        Base class of the uncertainty models. A model translates batches of uncertain statements into rdf triples.
+    A graph can be generated by several models, like one per block of rows or per worker process, so triples which
+    belong to the whole graph are returned by prologue, which is used once per graph. The base class adds the
+    statements without uncertainty.
+
+    Attributes
+    ----------
+    model_id: int
+        ID of the model in the registry (see register_uncertainty_model).
+    needs_weights: bool
+        If True, every uncertain statement gets a weight.
+    generator: GraphGenerator
+        GraphGenerator which uses the model.
+    """
+
+    model_id: int = 0
+    needs_weights: bool = False
+
+    def __init__(self, generator: GraphGenerator) -> None:
+        """
+        Parameters
+        ----------
+        generator: GraphGenerator
+            GraphGenerator which uses the model.
+        """
+        self.generator = generator
+
+    def prologue(self) -> Iterator[Triple]:
+        """
+        Returns the triples, which are added once per graph before the uncertain statements.
+        """
+        return iter(())
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        """
+        Returns the triples of a batch of uncertain statements.
+
+        Parameters
+        ----------
+        statements: Sequence[UncertainStatement]
+            Uncertain statements.
+        """
+        for subject, predicate, objekt, _, _ in statements:
+            yield subject, predicate, objekt
+
+
+UNCERTAINTY_MODELS: dict[int, type[UncertaintyModel]] = {}
+
+
+def register_uncertainty_model(model_id: int) -> Callable[[Model], Model]:
+    """
+    Class decorator, which registers an uncertainty model under the given model ID. A registered
+    model can be used with GraphGenerator.generate_graph(model_id=model_id).
+
+    Parameters
+    ----------
+    model_id: int
+        ID of the model.
+    """
+
+    def register(model: Model) -> Model:
+        model.model_id = model_id
+        UNCERTAINTY_MODELS[model_id] = model
+        return model
+
+    return register
+
+
+def get_uncertainty_model(model_id: int, generator: GraphGenerator) -> UncertaintyModel:
+    """
+    Returns the registered uncertainty model of the model ID. For unknown model IDs the uncertain statements
+    are added without uncertainty.
+
+    Parameters
+    ----------
+    model_id: int
+        ID of the model.
+    generator: GraphGenerator
+        GraphGenerator which uses the model.
+    """
+    return UNCERTAINTY_MODELS.get(model_id, UncertaintyModel)(generator)
+
+
+def uses_random_weights(model_id: int) -> bool:
+    """
+    Returns True, if the model of the model ID draws random weights for uncertain cells without weights. Graphs of
+    these models differ between runs, unless the GraphGenerator has a seed.
+
+    Parameters
+    ----------
+    model_id: int
+        ID of the model.
+    """
+    return UNCERTAINTY_MODELS.get(model_id, UncertaintyModel).needs_weights
+
+
+@register_uncertainty_model(1)
+class AttributeAssignmentModel(UncertaintyModel):
+    """
+        Model 1: The statement is added and described by an attribute assignment with an uncertain likelihood.
+    """
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, _, _ in statements:
+            node = BNode()
+            yield subject, predicate, objekt
+            yield node, CRM["P141_assigned"], objekt
+            yield node, CRM["P140_assigned_attribute_to"], subject
+            yield node, BMO["PX_Property"], predicate
+            yield node, RDF["type"], CRM["E13_Attribute_Assignment"]
+            yield node, BMO["PX_likelihood"], NM["uncertain_value"]
+
+
+@register_uncertainty_model(2)
+class UncertainValueModel(UncertaintyModel):
+    """
+        Model 2: The object is wrapped into a blank node with an uncertain value.
+    """
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, _, _ in statements:
+            node = BNode()
+            yield subject, predicate, node
+            yield node, UN["hasUncertainty"], NM["uncertain_value"]
+            yield node, RDF.value, objekt
+
+
+@register_uncertainty_model(3)
+class ReliabilityAssessmentModel(UncertaintyModel):
+    """
+        Model 3: The statement is added and assessed by the reliability assessment A3 with its weight.
+    """
+
+    needs_weights = True
+
+    def prologue(self) -> Iterator[Triple]:
+        yield BNode("A3"), RDF["type"], CRM["R1_Reliability_Assessment"]
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        assessment = BNode("A3")
+        for subject, predicate, objekt, weight, _ in statements:
+            b = BNode()
+            c = BNode()
+
+            yield assessment, CRM["T1_assessed_the_reliability_of"], b
+
+            yield b, RDF.type, CRM["E13_Attribute_Assignment"]
+            yield b, RDF.Property, predicate
+            yield b, CRM["T2_assessed_as_reliability"], c
+            yield b, CRM["P140_assigned_attribute_to"], subject
+            yield b, CRM["P141_assigned"], objekt
+
+            # Weight:
+            yield c, CRM["P90_has_value"], Literal(weight, datatype=XSD["double"], normalize=True)
+            yield c, RDF.type, CRM["R2_Reliability"]
+
+            yield subject, predicate, objekt
+
+
+@register_uncertainty_model(4)
+class InferenceMakingModel(UncertaintyModel):
+    """
+        Model 4: The object is the conclusion of an inference making, which holds the object to be on a
+    level between uncertain and very likely.
+    """
+
+    needs_weights = True
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, weight, object_index in statements:
+            b = BNode(self.generator._get_node_id(subject, predicate))
+            c = BNode()
+
+            yield subject, predicate, b
+            yield b, RDF.type, CRMINF["I5_Inference_Making"]
+            yield b, CRMINF["J2_concluded_that"], c
+
+            weight = cast(float, weight)  # The model needs weights, so every statement has one
+            if weight < 0.25:
+                level = "uncertain"
+            elif weight < 0.5:
+                level = "plausible"
+            elif weight < 0.75:
+                level = "likely"
+            else:
+                level = "very likely"
+
+            yield c, CRMINF["I4_Proposition_Set"], Literal(f"Proposetion_{object_index}")
+            yield c, CRMINF["J5_holds_to_be"], Literal(level)
+            yield c, CRMINF["J4_that"], objekt
+            yield c, RDF["type"], CRMINF["I2_Belief"]
+
+
+@register_uncertainty_model(5)
+class CRMPropertyModel(UncertaintyModel):
+    """
+        Model 5: The object is linked by the uncertain .2 CRM property of the predicate and gets a weight.
+    """
+
+    needs_weights = True
+    NMO_PREFIX = "http://nomisma.org/ontology#"
+    CRM_PROPERTIES = {
+        NMO_PREFIX + "hasCollection": "P107.2_uncertain_member",
+        NMO_PREFIX + "hasTypeSeriesItem": "P107.2_uncertain_member",
+        NMO_PREFIX + "hasContemporaryName": "P102.2_uncertain_name_or_ethnic",
+        NMO_PREFIX + "hasScholarlyName": "P102.2_uncertain_name_or_ethnic",
+        NMO_PREFIX + "hasDie": "P16.2_uncertain_technique_or_object_used_for_creation",
+        NMO_PREFIX
+        + "hasProductionObject": "P16.2_uncertain_technique_or_object_used_for_creation",
+        NMO_PREFIX
+        + "hasManufacture": "P16.2_uncertain_technique_or_object_used_for_creation",
+        NMO_PREFIX + "hasCountermark": "P103.2_uncertain_symbole_or_features",
+        NMO_PREFIX + "hasMintmark": "P103.2_uncertain_symbole_or_features",
+        NMO_PREFIX + "hasSecondaryTreatment": "P103.2_uncertain_symbole_or_features",
+        NMO_PREFIX + "hasPeculiarity": "P103.2_uncertain_symbole_or_features",
+        NMO_PREFIX + "hasPeculiarityOfProduction": "P103.2_uncertain_symbole_or_features",
+        NMO_PREFIX + "hasCorrosion": "P103.2_uncertain_symbole_or_features",
+        NMO_PREFIX + "hasWear": "P103.2_uncertain_symbole_or_features",
+        NMO_PREFIX + "hasObjectType": "P67.2_uncertain_type",
+        NMO_PREFIX + "representsObjectType": "P67.2_uncertain_type",
+        NMO_PREFIX + "hasAuthenticity": "P138.2_uncertain_authenticity",
+        NMO_PREFIX + "hasAuthority": "P14.2_uncertain_authority_or_issuer",
+        NMO_PREFIX + "hasIssuer": "P14.2_uncertain_authority_or_issuer",
+        NMO_PREFIX + "hasMint": "P189.2_uncertain_place",
+        NMO_PREFIX + "hasFindspot": "P189.2_uncertain_place",
+        NMO_PREFIX + "hasMaterial": "P137.2_uncertain_material",
+        NMO_PREFIX + "hasContext": "P136.2_uncertain_context_or_taxonomy",
+        NMO_PREFIX + "hasAppearance": "P139.2_uncertain_form",
+        NMO_PREFIX + "hasShape": "P139.2_uncertain_form",
+        NMO_PREFIX + "hasEdge": "P139.2_uncertain_form",
+        NMO_PREFIX + "hasFace": "P19.2_uncertain_mode",
+        NMO_PREFIX + "hasObverse": "P19.2_uncertain_mode",
+        NMO_PREFIX + "hasReverse": "P19.2_uncertain_mode",
+        NMO_PREFIX + "hasPortrait": "P62.2_uncertain_depiction",
+        NMO_PREFIX + "hasIconography": "P62.2_uncertain_depiction",
+        NMO_PREFIX + "hasLegend": "P62.2_uncertain_depiction",
+    }
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, weight, _ in statements:
+            node = BNode()
+            crm_property = self.CRM_PROPERTIES.get(str(predicate), "P3.2_uncertain_value")
+
+            yield subject, predicate, node
+            yield node, AMT["weight"], Literal(weight, datatype=XSD["double"], normalize=True)
+            yield node, CRM[crm_property], objekt
+
+
+@register_uncertainty_model(6)
+class ReificationModel(UncertaintyModel):
+    """
+        Model 6: The statement is added and reified as an uncertain statement.
+    """
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, _, _ in statements:
+            node = BNode()
+
+            yield subject, predicate, objekt
+            yield node, RDF["object"], objekt
+            yield node, RDF["subject"], subject
+            yield node, RDF["predicate"], predicate
+            yield node, RDF["type"], EDTFO["UncertainStatement"]
+
+
+@register_uncertainty_model(7)
+class ApproximateStatementModel(UncertaintyModel):
+    """
+        Model 7: The object is wrapped into a blank node of an approximate statement.
+    """
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, _, _ in statements:
+            node = BNode()
+
+            yield subject, predicate, node
+            yield node, RDF["type"], EDTFO["ApproximateStatement"]
+            yield node, RDF.value, objekt
+
+
+@register_uncertainty_model(8)
+class UncertaintyNodeModel(UncertaintyModel):
+    """
+        Model 8: The statement is moved to an uncertainty node of the subject.
+    """
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, _, _ in statements:
+            node = BNode(self.generator._get_node_id(subject))
+
+            yield subject, UN["hasUncertainty"], node
+            yield node, predicate, objekt
+
+
+@register_uncertainty_model(9)
+class UncertainStatementStarModel(UncertaintyModel):
+    """
+        Model 9a: The statement is quoted with rdf* and typed as uncertain statement.
+    """
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, _, _ in statements:
+            yield QuotedTriple(subject, predicate, objekt), RDF["type"], EDTFO["UncertainStatement"]
+
+
+@register_uncertainty_model(10)
+class UncertaintyStarModel(UncertaintyModel):
+    """
+        Model 9b: The statement is quoted with rdf* and gets the uncertainty 1 - weight.
+    """
+
+    needs_weights = True
+
+    def emit(self, statements: Sequence[UncertainStatement]) -> Iterator[Triple]:
+        for subject, predicate, objekt, weight, _ in statements:
+            yield (
+                QuotedTriple(subject, predicate, objekt),
+                UN["hasUncertainty"],
+                Literal(1 - cast(float, weight), datatype=XSD["double"], normalize=True),
+            )
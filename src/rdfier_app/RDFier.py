@@ -1,27 +1,180 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import tempfile
+import time
+from collections import OrderedDict
 from pathlib import Path
+from uuid import uuid4
 
 import pandas as pd
 import streamlit as st
 from PIL import Image
+from rdflib import Graph
 
-from rdfier import RDFIER_PATH
 from rdfier.data.rdf_data import RDFData
-from rdfier.features.graph_generator import GraphGenerator
+from rdfier.features.conversion_cache import ConversionCache
+from rdfier.features.generation_job import GenerationJob
+from rdfier.features.graph_generator import GenerationCancelled, GraphGenerator
+from rdfier.features.graph_pager import GraphPager
 from rdfier.features.illustrator import Illustrator
+from rdfier.features.triple_table import TripleTable
+from rdfier.features.uncertainty_models import uses_random_weights
 
 st.set_page_config(page_title="RDFier", layout="wide")
 
+# Every session writes its files to its own folder, so concurrent sessions don't overwrite each other.
+# The folder is removed with its files, when the state of the ended session is garbage collected:
+if "output_folder" not in st.session_state:
+    st.session_state.output_folder = tempfile.TemporaryDirectory(prefix="rdfier_")
+    # Running generation job of the session with its graph key and cache key:
+    st.session_state.job = None
+
+# Maximal number of generated graphs, which every session keeps to switch between models and formats:
+MAX_SESSION_GRAPHS = 4
+# Number of subjects of a page of the graph view:
+PAGE_SIZE = 25
+# Number of characters, which are shown of graphs without pages and next to the figure:
+MAX_SHOWN_CHARACTERS = 100000
+# Number of seconds between the checks of a running generation job:
+JOB_POLL_INTERVAL = 0.5
+
+
+@st.cache_resource
+def get_conversion_cache() -> ConversionCache:
+    # Graphs of unchanged inputs, prefixes, models and formats are loaded from the cache:
+    return ConversionCache()
+
+
+@st.cache_data(max_entries=4, ttl=3600, show_spinner=False)
+def read_upload(content: bytes) -> pd.DataFrame:
+    return pd.read_csv(io.BytesIO(content))
+
+
+@st.cache_resource(max_entries=4, ttl=3600, show_spinner=False)
+def load_rdf_data(data_version: str, _dataframe: pd.DataFrame) -> RDFData:
+    # The data version identifies the dataframe: the file hash or a new id after every edit.
+    return RDFData(_dataframe.copy())
+
+
+@st.cache_resource(max_entries=4, ttl=3600, show_spinner=False)
+def get_pager(
+    graph_key: tuple,
+    _generator: GraphGenerator | None,
+    _table: TripleTable | None,
+    _graph_path: Path,
+) -> GraphPager | None:
+    # The graph key identifies the graph: data version, prefixes, model and format.
+    if _table is not None and _generator is not None:
+        return GraphPager(_table, _generator.prefixes, PAGE_SIZE)
+    if _generator is not None and len(_generator.graph):
+        return GraphPager.from_graph(_generator.graph, PAGE_SIZE)
+    if graph_key[2] in (9, 10):  # rdflib can't read the quoted triples of cached rdf* graphs
+        return None
+    return GraphPager.from_graph(Graph().parse(_graph_path, format=graph_key[3]), PAGE_SIZE)
+
+
+@st.cache_data(max_entries=16, ttl=3600, show_spinner=False)
+def get_figure(graph_path: str) -> bytes:
+    # Every graph has its own file, so the path identifies the graph. The format is read from its extension:
+    figure = io.BytesIO()
+    Illustrator(path=graph_path, output=figure)
+    return figure.getvalue()
+
+
+def new_graph_path(rdf_format: str) -> Path:
+    # Graphs are kept in files of the session folder and only read in parts for the view and the download:
+    extension = "rdf" if rdf_format == "xml" else "ttl"
+    return Path(st.session_state.output_folder.name, f"graph_{uuid4().hex}.{extension}")
+
+
+def show_preview(container, graph_path: Path, language: str):
+    with open(graph_path, encoding="utf-8") as file:
+        text = file.read(MAX_SHOWN_CHARACTERS + 1)
+    if len(text) > MAX_SHOWN_CHARACTERS:
+        container.info(
+            f"Preview truncated: only the first {MAX_SHOWN_CHARACTERS:,} characters of the graph are shown. "
+            "Download the graph to see all of it."
+        )
+    container.code(text[:MAX_SHOWN_CHARACTERS], language=language)
+
 
 def update():
-    st.session_state.rdf_data = RDFData(st.session_state.df.copy())
+    st.session_state.rdf_data = load_rdf_data(
+        st.session_state.data_version, st.session_state.df
+    )
+
+
+def remember_graph(
+    key: tuple, generator: GraphGenerator | None, graph_path: Path, table: TripleTable | None
+):
+    graphs = st.session_state.graphs
+    graphs[key] = (generator, graph_path, table)
+    graphs.move_to_end(key)
+    while len(graphs) > MAX_SESSION_GRAPHS:
+        _, (_, old_path, _) = graphs.popitem(last=False)
+        old_path.unlink(missing_ok=True)
+
+
+def forget_graphs():
+    # The files of the graphs are removed with the graphs:
+    for _, graph_path, _ in st.session_state.get("graphs", {}).values():
+        graph_path.unlink(missing_ok=True)
+    st.session_state.graphs = OrderedDict()
+
+
+def show_graph(
+    key: tuple, generator: GraphGenerator | None, graph_path: Path, table: TripleTable | None
+):
+    # Without a generator the next edit generates the graph again:
+    remember_graph(key, generator, graph_path, table)
+    st.session_state.generator = generator
+    st.session_state.table = table
+    st.session_state.graph_path = graph_path
+    st.session_state.graph_key = key
+    st.session_state.generated_df = st.session_state.df.copy()
+
+
+def cancel_job():
+    # The job stops at the next step of its generator and is dropped, when it's done:
+    if st.session_state.get("job") is not None:
+        st.session_state.job[2].cancel()
 
 
 def activate_rerun():
     st.session_state.rerun = True
 
 
+def prepare_download():
+    st.session_state.download_key = st.session_state.graph_key
+
+
+def reset_download():
+    # Later reruns don't send the graph to the download button again:
+    st.session_state.download_key = None
+
+
+def activate_edit():
+    st.session_state.edited = True
+    st.session_state.data_version = uuid4().hex
+
+
+def update_rows(model_id: int, rdf_format: str):
+    generator = st.session_state.generator
+    changed_rows, deleted_rows = RDFData.get_changed_rows(
+        st.session_state.generated_df, st.session_state.df
+    )
+    generator.update_rows(
+        st.session_state.df, changed_rows, deleted_rows, model_id=model_id
+    )
+    # The updated graph gets a new file, because the figures are cached by the path of the graph file:
+    old_path, st.session_state.graph_path = st.session_state.graph_path, new_graph_path(rdf_format)
+    generator.save_graph(rdf_format, st.session_state.graph_path)
+    old_path.unlink(missing_ok=True)
+    st.session_state.generated_df = st.session_state.df.copy()
+
+
 # Begin webpage---------------------------------------------------------------------------
 
 st.title("RDFier")
@@ -41,13 +194,40 @@ if not uploaded_file:
     st.session_state.df = None
     st.session_state.generate = False
     st.session_state.rdf_data = None
+    st.session_state.generator = None
+    st.session_state.table = None
     st.session_state.rerun = True
+    st.session_state.edited = False
+    st.session_state.file_hash = None
+    forget_graphs()
+    st.session_state.graph_key = None
+    st.session_state.index_rows = False
+    cancel_job()
+    st.session_state.job = None
 else:
+    content = uploaded_file.getvalue()
+    file_hash = hashlib.sha256(content).hexdigest()
+    if file_hash != st.session_state.get("file_hash"):
+        st.session_state.file_hash = st.session_state.data_version = file_hash
+        forget_graphs()
+        st.session_state.generator = st.session_state.table = st.session_state.graph_key = None
+        # Rows are only indexed after the input was edited:
+        st.session_state.index_rows = False
+        cancel_job()
+        st.session_state.job = None
+        st.session_state.rerun = True
     st.session_state.df = st.data_editor(
-        pd.read_csv(uploaded_file), on_change=activate_rerun
+        read_upload(content), on_change=activate_edit
     )
-    if st.session_state.rerun:
-        update()
+    # Edits update the generated graph row by row. Without an indexed graph everything is generated again
+    # with a row index, so the next edits are updates:
+    if st.session_state.edited and (
+        st.session_state.generator is None
+        or st.session_state.generator.row_triples is None
+    ):
+        st.session_state.edited = False
+        st.session_state.rerun = True
+        st.session_state.index_rows = True
 
     with st.container():
         col1, col2 = st.columns(2)
@@ -80,22 +260,100 @@ else:
         st.session_state.rerun = True
 
     if st.session_state.generate:
-        if st.session_state.rerun:
+        rdf_format = "xml" if turtle_format == "XML" else "turtle"
+        prefixes = uploaded_prefixes.getvalue() if uploaded_prefixes else None
+        graph_key = (
+            st.session_state.data_version,
+            hashlib.sha256(prefixes).hexdigest() if prefixes else None,
+            solution,
+            rdf_format,
+        )
+        # Graphs of models with random weights differ between runs, so they aren't cached:
+        cache = None if uses_random_weights(solution) else get_conversion_cache()
+        if st.session_state.edited and graph_key[1:] == st.session_state.graph_key[1:]:
+            # The indexed graph is updated and kept under the new data version:
+            st.session_state.edited = False
+            st.session_state.graphs.pop(st.session_state.graph_key, None)
+            update_rows(solution, rdf_format)
+            if cache is not None:
+                cache.put_file(
+                    cache.get_key(st.session_state.df, prefixes, solution, rdf_format),
+                    st.session_state.graph_path,
+                )
+            remember_graph(graph_key, st.session_state.generator, st.session_state.graph_path, None)
+            st.session_state.table = None
+            st.session_state.graph_key = graph_key
+        elif st.session_state.job is None and (
+            st.session_state.rerun or graph_key != st.session_state.graph_key
+        ):
             st.session_state.rerun = False
-            generator = GraphGenerator(st.session_state.rdf_data)
-            if uploaded_prefixes:
-                generator.load_prefixes(pd.read_csv(uploaded_prefixes))
-            generator.generate_graph(
-                model_id=solution, xml_format=(turtle_format == "XML")
+            st.session_state.edited = False
+            generator, graph_path, table = st.session_state.graphs.get(
+                graph_key, (None, None, None)
             )
+            cache_key = None
+            if graph_path is None and cache is not None:
+                cache_key = cache.get_key(st.session_state.df, prefixes, solution, rdf_format)
+                cached_path = new_graph_path(rdf_format)
+                if cache.get_file(cache_key, cached_path):
+                    graph_path = cached_path
+            if graph_path is None:
+                update()
+                generator = GraphGenerator(
+                    st.session_state.rdf_data, output_folder=st.session_state.output_folder.name
+                )
+                if uploaded_prefixes:
+                    generator.load_prefixes(pd.read_csv(uploaded_prefixes))
+                # The graph is generated in the background, so the session stays responsive:
+                st.session_state.job = (
+                    graph_key,
+                    cache_key,
+                    GenerationJob(
+                        generator,
+                        solution,
+                        rdf_format,
+                        index_rows=st.session_state.index_rows,
+                        output=new_graph_path(rdf_format),
+                    ),
+                )
+            else:
+                show_graph(graph_key, generator, graph_path, table)
 
-        path = Path(
-            RDFIER_PATH,
-            "data/output/graph" +
-            (".ttl" if turtle_format == "Turtle" else ".rdf"),
-        )
+        if st.session_state.job is not None:
+            job_key, cache_key, job = st.session_state.job
+            if job_key != graph_key:
+                # The input, the prefixes, the model or the format changed while the graph was generated:
+                job.cancel()
+                st.session_state.job = None
+                st.session_state.rerun = True
+                st.rerun()
+            if not job.done():
+                progresscol, cancelcol = st.columns([4, 1])
+                progresscol.progress(job.progress, text="Generating RDF graph...")
+                cancelcol.button("Cancel", on_click=cancel_job, disabled=job.cancelled)
+                time.sleep(JOB_POLL_INTERVAL)
+                st.rerun()
 
-        if generator.rdfdata.data.shape[0] > 30:
+            st.session_state.job = None
+            try:
+                job.result()
+            except GenerationCancelled:
+                job.output.unlink(missing_ok=True)
+                st.session_state.generate = False
+                st.session_state.rerun = True
+                st.info("The generation of the RDF graph was cancelled.")
+                st.stop()
+            except Exception as error:
+                job.output.unlink(missing_ok=True)
+                st.session_state.generate = False
+                st.session_state.rerun = True
+                st.error(f"The RDF graph couldn't be generated: {error}")
+                st.stop()
+            if cache is not None and cache_key is not None:
+                cache.put_file(cache_key, job.output)
+            show_graph(graph_key, job.generator, job.output, job.table)
+
+        if st.session_state.df.shape[0] > 30:
             graphical_version = False
             st.warning(
                 "RDF Graph is to large to generate figure. Only inputs with <30 rows are currently showable.",
@@ -105,23 +363,63 @@ else:
         if graphical_version:
             codcol, graphcol = st.columns(2)
 
-            codcol.code(
-                path.read_text(),
+            show_preview(
+                codcol,
+                st.session_state.graph_path,
                 language="turtle" if turtle_format == "Turtle" else "xml",
             )
 
-            grapher = Illustrator(path)
+            figure = get_figure(str(st.session_state.graph_path))
 
-            image = Image.open(
-                str(Path(RDFIER_PATH, "data/output/downloaded_graph.png"))
-            )
+            if figure:
+                image = Image.open(io.BytesIO(figure))
 
-            graphcol.image(image, output_format="PNG", use_column_width="auto")
+                graphcol.image(image, output_format="PNG", use_column_width="auto")
         else:
-            st.code(
-                path.read_text(),
-                language="turtle" if turtle_format == "Turtle" else "xml",
+            # Large graphs are shown one page of subjects at a time:
+            pager = get_pager(
+                st.session_state.graph_key,
+                st.session_state.generator,
+                st.session_state.table,
+                st.session_state.graph_path,
             )
+            searchcol, pagecol = st.columns(2)
+            if pager is None:
+                st.info(
+                    "Search and pages aren't available for RDF* graphs, which were loaded from the cache, "
+                    "because their quoted triples can't be read again."
+                )
+                show_preview(
+                    st,
+                    st.session_state.graph_path,
+                    language="turtle" if turtle_format == "Turtle" else "xml",
+                )
+            else:
+                pager = pager.search(searchcol.text_input("Search subject or predicate"))
+                page = pagecol.number_input(
+                    f"Page of {pager.n_pages} ({len(pager.subjects)} subjects)",
+                    min_value=1,
+                    max_value=pager.n_pages,
+                    value=1,
+                )
+                st.code(
+                    pager.get_page(page - 1, rdf_format),
+                    language="turtle" if turtle_format == "Turtle" else "xml",
+                )
+
+        # The graph file is only read by the download button after it was requested, because the button
+        # hashes and stores its whole data on every rerun:
+        if st.session_state.get("download_key") != st.session_state.graph_key:
+            st.button("Prepare download", on_click=prepare_download)
+        else:
+            with open(st.session_state.graph_path, "rb") as graph_file:
+                st.download_button(
+                    "Download graph",
+                    graph_file,
+                    file_name="graph.ttl" if turtle_format == "Turtle" else "graph.rdf",
+                    mime="text/turtle" if turtle_format == "Turtle" else "application/rdf+xml",
+                    on_click=reset_download,
+                )
 
         if solution == 9 or solution == 10:
             st.warning(
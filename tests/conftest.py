@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from rdfier import RDFIER_PATH
+from rdfier.data.rdf_data import RDFData
+from rdfier.features.graph_generator import GraphGenerator
+
+NAMESPACES = Path(RDFIER_PATH, "data/input/namespaces.csv")
+
+
+def get_frame() -> pd.DataFrame:
+    """
+    Returns a small input with uris, blank nodes, several entries per cell, datatypes, languages and
+    uncertainties of the materials. RDFData renames the columns of its DataFrame, so every call returns a new one.
+    """
+    return pd.DataFrame(
+        {
+            "coin^^uri": ["afe:1", "afe:2", "afe:3", "afe:4", "afe:5"],
+            "nmo:hasMaterial^^uri**1": [
+                "nm:ar",
+                "nm:ae;nm:ar",
+                "kryptonite^^blank",
+                "<http://nomisma.org/id/au>",
+                "nm:ae",
+            ],
+            "nmo:hasWeight": ["5.24", "7", None, "true", "heavy"],
+            "nmo:hasDiameter^^xsd:decimal": ["20.5", None, "18", "19", "21"],
+            "1__rdfs:label": ["silver@en; Silber@de", None, "Kryptonit@de", None, "copper"],
+            "1__rdfs:comment": ["plain", None, "toolong@abcd", "7^^xsd:int", "μέταλλο"],
+            "1__unc^^certainty": [None, "0.3;0.7", "u", "0.6", None],
+        }
+    )
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return get_frame()
+
+
+@pytest.fixture
+def generator(tmp_path: Path) -> GraphGenerator:
+    generator = GraphGenerator(RDFData(get_frame()), output_folder=tmp_path)
+    generator.load_prefixes(str(NAMESPACES))
+    return generator
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from conftest import NAMESPACES, get_frame
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from rdfier.features.conversion_cache import ConversionCache
+from rdfier.features.graph_generator import GraphGenerator
+
+
+def test_key_depends_on_every_part_of_the_conversion(tmp_path, frame):
+    path = tmp_path / "input.csv"
+    frame.to_csv(path, index=False)
+    key = ConversionCache.get_key(path, NAMESPACES, 8, "turtle")
+
+    assert ConversionCache.get_key(str(path), str(NAMESPACES), 8, "turtle") == key
+    assert ConversionCache.get_key(path.read_bytes(), NAMESPACES.read_bytes(), 8, "turtle") == key
+    assert ConversionCache.get_key(frame, NAMESPACES, 8, "turtle") == key
+
+    other_keys = {
+        ConversionCache.get_key(path, NAMESPACES, 9, "turtle"),
+        ConversionCache.get_key(path, NAMESPACES, 8, "xml"),
+        ConversionCache.get_key(path, None, 8, "turtle"),
+        ConversionCache.get_key(path, NAMESPACES, 8, "turtle", seed=1),
+        ConversionCache.get_key(frame.iloc[:-1], NAMESPACES, 8, "turtle"),
+        # The parts are separated by their lengths:
+        ConversionCache.get_key(path.read_bytes() + NAMESPACES.read_bytes(), b"", 8, "turtle"),
+    }
+    assert key not in other_keys
+    assert len(other_keys) == 6
+
+
+def test_get_and_put(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+
+    assert cache.get("a") is None
+    cache.put("a", "graph a")
+    assert "a" in cache
+    assert cache.get("a") == "graph a"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.put("a", "new graph a")
+    assert cache.get("a") == "new graph a"
+    assert len(cache) == 1
+    assert cache.size == len("new graph a")
+    assert not [path for path in Path(tmp_path, "cache").iterdir() if path.name.startswith(".")]
+
+    cache.clear()
+    assert len(cache) == 0
+    assert "a" not in cache
+
+
+def test_get_and_put_files(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    graph_path, copy_path = tmp_path / "graph.ttl", tmp_path / "copy.ttl"
+    graph_path.write_text("graph b", encoding="utf-8")
+
+    assert not cache.get_file("b", copy_path)
+    cache.put_file("b", graph_path)
+    assert cache.get_file("b", copy_path)
+    assert copy_path.read_text(encoding="utf-8") == "graph b"
+    assert (cache.hits, cache.misses) == (1, 1)
+    with pytest.raises(FileNotFoundError):
+        cache.get_file("b", tmp_path / "missing" / "copy.ttl")
+
+
+def test_least_recently_used_graphs_are_evicted(tmp_path):
+    cache = ConversionCache(tmp_path, max_size=30)
+    for index, key in enumerate("abc"):
+        cache.put(key, key * 10)
+        os.utime(Path(tmp_path, key), ns=(index * 10**9, index * 10**9))
+
+    assert cache.get("a") == "a" * 10
+    cache.put("d", "d" * 10)
+    assert set(entry.name for entry in cache._get_entries()) == {"a", "c", "d"}
+    assert cache.size <= cache.max_size
+
+    cache.put("e", "e" * 40)
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("rdf_format", ("turtle", "nt"))
+def test_convert_uses_the_cache(tmp_path, rdf_format):
+    cache = ConversionCache(tmp_path / "cache")
+    first = GraphGenerator.convert(get_frame(), NAMESPACES, 8, rdf_format, tmp_path / "first", cache)
+    second = GraphGenerator.convert(get_frame(), NAMESPACES, 8, rdf_format, tmp_path / "second", cache)
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert first.read_text(encoding="utf-8") == second.read_text(encoding="utf-8")
+    assert len(Graph().parse(second, format=rdf_format)) > 0
+
+
+def test_convert_caches_random_weights_only_with_a_seed(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    GraphGenerator.convert(get_frame(), NAMESPACES, 3, output_folder=tmp_path, cache=cache)
+    assert len(cache) == 0
+
+    # Runs with the same seed draw the same weights:
+    graphs = [
+        Graph().parse(GraphGenerator.convert(get_frame(), NAMESPACES, 3, output=tmp_path / f"{index}.ttl", seed=5))
+        for index in range(2)
+    ]
+    assert isomorphic(*graphs)
+
+    path = GraphGenerator.convert(get_frame(), NAMESPACES, 3, output_folder=tmp_path, cache=cache, seed=5)
+    assert path == tmp_path / "graph.ttl"
+    assert len(cache) == 1
+    assert isomorphic(Graph().parse(path), graphs[0])
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+from rdflib import Graph
+
+from rdfier.features.generation_job import GenerationJob
+from rdfier.features.graph_generator import GenerationCancelled
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(1)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.mark.parametrize("model_id", (8, 9))
+def test_job_returns_the_graph(generator, executor, model_id):
+    job = GenerationJob(generator, model_id=model_id, executor=executor)
+    graph = job.result(timeout=30)
+
+    assert job.done()
+    assert not job.cancelled
+    assert job.progress == 1.0
+    if model_id == 9:
+        assert "<< " in graph
+        assert job.table is not None
+    else:
+        assert len(Graph().parse(data=graph, format="turtle")) > 0
+
+
+def test_waiting_job_is_never_started(generator, executor):
+    release = Event()
+    executor.submit(release.wait, 30)
+    job = GenerationJob(generator, executor=executor)
+
+    job.cancel()
+    release.set()
+    assert job.cancelled
+    with pytest.raises(GenerationCancelled):
+        job.result(timeout=30)
+    assert job.progress == 0.0
+
+
+def test_running_job_stops_at_the_next_step(generator, executor):
+    release = Event()
+    executor.submit(release.wait, 30)
+    job = GenerationJob(generator, executor=executor)
+
+    started, cancelled = Event(), Event()
+    set_progress = generator.progress
+
+    def wait_for_cancel(step: int, n_steps: int) -> None:
+        started.set()
+        cancelled.wait(30)
+        set_progress(step, n_steps)
+
+    generator.progress = wait_for_cancel
+    release.set()
+    assert started.wait(30)
+    job.cancel()
+    cancelled.set()
+
+    with pytest.raises(GenerationCancelled):
+        job.result(timeout=30)
+    assert job.done()
+    assert job.progress < 1.0
+
+
+@pytest.mark.parametrize("model_id", (9, 10))
+def test_rdf_star_job_replaces_the_graph(generator, executor, model_id):
+    generator.generate_graph(model_id=8, output=generator.OUTPUT_FOLDER / "old.ttl")
+    job = GenerationJob(generator, model_id=model_id, executor=executor)
+    job.result(timeout=30)
+
+    # The graph of the last run mustn't be paged or queried as the rdf* graph:
+    assert generator.rdf_star
+    assert len(generator.graph) == 0
+    with pytest.raises(ValueError):
+        generator.run_query("SELECT * WHERE { ?s ?p ?o }")
+    assert (generator.OUTPUT_FOLDER / "graph_prefixes.txt").exists()
+
+
+@pytest.mark.parametrize("model_id", (8, 9))
+def test_job_writes_the_graph_to_the_output(generator, executor, tmp_path, model_id):
+    output = tmp_path / "job_graph.ttl"
+    job = GenerationJob(generator, model_id=model_id, executor=executor, output=output)
+
+    assert job.result(timeout=30) is None
+    text = output.read_text(encoding="utf-8")
+    if model_id == 9:
+        assert "<< " in text
+    else:
+        assert len(Graph().parse(output, format="turtle")) == len(generator.graph) > 0
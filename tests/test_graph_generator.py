@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import io
+import warnings
+
+import pytest
+from conftest import NAMESPACES, get_frame
+from rdflib import BNode, Dataset, Graph, URIRef
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF
+from test_writers import replace_quoted_triples
+
+from rdfier.data.rdf_data import RDFData
+from rdfier.features.graph_generator import GraphGenerator
+from rdfier.features.namespaces import CRM, NM, NMO, UN
+
+# Models, whose graphs don't depend on random weights:
+DETERMINISTIC_MODELS = (1, 2, 6, 7, 8)
+
+
+def generate(generator: GraphGenerator, **kwargs) -> str:
+    output = io.StringIO()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        generator.generate_graph(output=output, **kwargs)
+    return output.getvalue()
+
+
+def get_generator(tmp_path, frame=None) -> GraphGenerator:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        generator = GraphGenerator(RDFData(get_frame() if frame is None else frame), output_folder=tmp_path)
+    generator.load_prefixes(str(NAMESPACES))
+    return generator
+
+
+@pytest.mark.parametrize("model_id", DETERMINISTIC_MODELS)
+def test_streamed_formats_equal_the_graph(tmp_path, model_id):
+    generator = get_generator(tmp_path)
+    generate(generator, model_id=model_id)
+    expected = generator.graph
+
+    assert isomorphic(
+        Graph().parse(data=generate(generator, model_id=model_id, rdf_format="nt"), format="nt"), expected
+    )
+    assert isomorphic(
+        Graph().parse(data=generate(generator, model_id=model_id, stream=True), format="turtle"), expected
+    )
+    assert isomorphic(
+        Graph().parse(data=generate(generator, model_id=model_id, rdf_format="xml"), format="xml"), expected
+    )
+
+    graph_name = "http://example.org/graph"
+    dataset = Dataset().parse(
+        data=generate(generator, model_id=model_id, rdf_format="nquads", graph_name=graph_name), format="nquads"
+    )
+    assert isomorphic(dataset.graph(URIRef(graph_name)), expected)
+
+
+@pytest.mark.parametrize("rdf_format", ("nt", "turtle"))
+def test_streamed_formats_escape_invalid_iris(tmp_path, rdf_format):
+    frame = get_frame()
+    frame.iloc[3, 1] = "<http://nomisma.org/id/a u>"
+    text = generate(get_generator(tmp_path, frame), rdf_format=rdf_format, stream=True)
+    assert "a u" not in text
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        graph = Graph().parse(data=text, format=rdf_format)
+    assert (None, NMO["hasMaterial"], URIRef("http://nomisma.org/id/a u")) in graph
+
+
+@pytest.mark.parametrize("model_id", DETERMINISTIC_MODELS)
+def test_blocks_of_rows_equal_one_table(tmp_path, model_id, monkeypatch):
+    generator = get_generator(tmp_path)
+    expected = Graph().parse(data=generate(generator, model_id=model_id, rdf_format="nt"), format="nt")
+
+    monkeypatch.setattr(GraphGenerator, "TABLE_ROWS", 2)
+    nt = generate(generator, model_id=model_id, rdf_format="nt")
+    turtle = generate(generator, model_id=model_id, stream=True)
+    assert isomorphic(Graph().parse(data=nt, format="nt"), expected)
+    assert isomorphic(Graph().parse(data=turtle, format="turtle"), expected)
+
+
+@pytest.mark.parametrize("model_id", (9, 10))
+@pytest.mark.parametrize("rdf_format", ("nt", "turtle"))
+def test_rdf_star_models(tmp_path, model_id, rdf_format):
+    text, quoted = replace_quoted_triples(generate(get_generator(tmp_path), model_id=model_id, rdf_format=rdf_format))
+    graph = Graph().parse(data=text, format=rdf_format)
+    assert len(set(quoted)) == 4
+    assert len(set(graph.subjects(UN["hasUncertainty"] if model_id == 10 else RDF.type))) == 4
+
+    prefix_lines = "".join(line + "\n" for line in text.splitlines() if line.startswith("@prefix"))
+    statements = set()
+    for quoted_triple in set(quoted):
+        ((subject, predicate, objekt),) = list(
+            Graph().parse(data=f"{prefix_lines}{quoted_triple} .\n", format=rdf_format)
+        )
+        assert predicate == NMO["hasMaterial"]
+        statements.add((subject, BNode if isinstance(objekt, BNode) else objekt))
+    assert statements == {
+        (URIRef("http://afe.dainst.org/coin?afeid=2"), NM["ae"]),
+        (URIRef("http://afe.dainst.org/coin?afeid=2"), NM["ar"]),
+        (URIRef("http://afe.dainst.org/coin?afeid=3"), BNode),
+        (URIRef("http://afe.dainst.org/coin?afeid=4"), URIRef("http://nomisma.org/id/au")),
+    }
+
+
+def test_reliability_assessment_is_added_once(tmp_path):
+    text = generate(get_generator(tmp_path), model_id=3, rdf_format="nt")
+    graph = Graph().parse(data=text, format="nt")
+    assert len(list(graph.subjects(RDF.type, CRM["R1_Reliability_Assessment"]))) == 1
+    assert sum(line.endswith(f"<{CRM['R1_Reliability_Assessment']}> .") for line in text.splitlines()) == 1
+
+
+def test_graph_without_uncertainties_has_no_reliability_assessment(tmp_path):
+    frame = get_frame().drop(columns="1__unc^^certainty")
+    text = generate(get_generator(tmp_path, frame), model_id=3, rdf_format="nt")
+    assert str(CRM["R1_Reliability_Assessment"]) not in text
+
+
+@pytest.mark.parametrize("model_id", (1, 8))
+def test_update_rows_equals_a_new_graph(tmp_path, model_id):
+    generator = get_generator(tmp_path)
+    generate(generator, model_id=model_id, index_rows=True)
+
+    changed = get_frame()
+    changed.iloc[0, 2] = "6.1"
+    changed.iloc[3, 1] = "nm:ar"
+    changed.iloc[3, 6] = None
+    changed.iloc[4, 4] = "bronze@en"
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        generator.update_rows(changed.copy(), [0, 3, 4], model_id=model_id)
+
+    expected = get_generator(tmp_path, changed)
+    generate(expected, model_id=model_id)
+    assert isomorphic(generator.graph, expected.graph)
+
+
+def test_update_rows_removes_deleted_rows(tmp_path):
+    generator = get_generator(tmp_path)
+    generate(generator, index_rows=True)
+    generator.update_rows(get_frame().drop(index=4), [], deleted_rows=[4])
+
+    expected = get_generator(tmp_path, get_frame().drop(index=4))
+    generate(expected)
+    assert isomorphic(generator.graph, expected.graph)
+    assert URIRef("http://afe.dainst.org/coin?afeid=5") not in set(generator.graph.subjects())
+
+    # The rdfdata holds the new input, so the next graph is generated from it:
+    assert len(generator.rdfdata.data) == 4
+    generate(generator)
+    assert isomorphic(generator.graph, expected.graph)
+
+
+def test_update_rows_removes_the_prologue_with_the_last_uncertain_row(tmp_path):
+    generator = get_generator(tmp_path)
+    generate(generator, model_id=3, index_rows=True)
+    assessment = (BNode("A3"), RDF.type, CRM["R1_Reliability_Assessment"])
+
+    changed = get_frame()
+    changed.iloc[[1, 2], 6] = None
+    generator.update_rows(changed.copy(), [1, 2], model_id=3)
+    assert assessment in generator.graph
+
+    changed.iloc[3, 6] = None
+    generator.update_rows(changed.copy(), [3], model_id=3)
+    assert assessment not in generator.graph
+    # Without uncertainties the graph of model 3 doesn't depend on random weights:
+    expected = get_generator(tmp_path, changed.copy())
+    generate(expected, model_id=3)
+    assert isomorphic(generator.graph, expected.graph)
+
+    changed.iloc[2, 6] = "u"
+    generator.update_rows(changed.copy(), [2], model_id=3)
+    assert assessment in generator.graph
+
+
+def test_update_rows_needs_a_row_index(tmp_path):
+    generator = get_generator(tmp_path)
+    generate(generator)
+    with pytest.raises(ValueError):
+        generator.update_rows(get_frame(), [0])
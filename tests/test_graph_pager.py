@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF, RDFS
+
+from rdfier.features.graph_pager import GraphPager
+from rdfier.features.namespaces import NMO
+
+
+def get_graph() -> Graph:
+    graph = Graph()
+    graph.bind("nmo", NMO)
+    graph.bind("ex", "http://example.org/")
+    for index in range(7):
+        coin = URIRef(f"http://example.org/coin{index}")
+        graph.add((coin, RDF.type, NMO["Coin"]))
+        graph.add((coin, RDFS.label, Literal(f"Coin {index}", lang="en")))
+        if index % 2:
+            graph.add((coin, NMO["hasWeight"], Literal(index)))
+    graph.add((URIRef("http://example.org/coin0"), NMO["hasMaterial"], BNode("kryptonite")))
+    graph.add((BNode("kryptonite"), RDFS.label, Literal("Kryptonit", lang="de")))
+    return graph
+
+
+def test_pages_hold_all_subjects():
+    graph = get_graph()
+    pager = GraphPager.from_graph(graph, page_size=3)
+    assert pager.n_pages == 3
+
+    pages = [pager.get_page(page) for page in range(pager.n_pages)]
+    for page, text in enumerate(pages):
+        assert len(set(Graph().parse(data=text, format="turtle").subjects())) == (3 if page < 2 else 2)
+    # The pages share the labels of the blank nodes:
+    assert isomorphic(Graph().parse(data="".join(pages), format="turtle"), graph)
+
+    xml_page = Graph().parse(data=pager.get_page(0, "xml"), format="xml")
+    assert isomorphic(xml_page, Graph().parse(data=pager.get_page(0), format="turtle"))
+    assert pager.get_page(3) == pager.get_page(4)
+
+
+def test_search_by_subject_and_predicate():
+    pager = GraphPager.from_graph(get_graph(), page_size=3)
+
+    found = pager.search(" EXAMPLE.org/COIN3 ")
+    assert found.n_pages == 1
+    page = Graph().parse(data=found.get_page(0), format="turtle")
+    assert set(page.subjects()) == {URIRef("http://example.org/coin3")}
+
+    found = pager.search("nmo:hasweight")
+    assert len(found.subjects) == 3
+    assert set(Graph().parse(data=found.get_page(0), format="turtle").subjects()) == {
+        URIRef(f"http://example.org/coin{index}") for index in (1, 3, 5)
+    }
+    # The found subjects are searched again:
+    assert len(found.search("coin5").subjects) == 1
+    assert len(pager.search("hasMaterial").subjects) == 1
+
+    assert pager.search("  ") is pager
+    empty = pager.search("nothing")
+    assert empty.n_pages == 1
+    assert len(Graph().parse(data=empty.get_page(0), format="turtle")) == 0
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import pickle
+import warnings
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import get_frame
+
+from rdfier.data.header_schema import GREEK2LATIN, HeaderSchema
+from rdfier.data.rdf_data import RDFData
+from rdfier.data.type_language_table import TypeLanguageTable
+from rdfier.data.uncertainty_table import UncertaintyTable
+
+
+def parse_per_cell(frame: pd.DataFrame) -> tuple[dict, dict]:
+    """
+    Reads the cleaned cells and the datatypes/languages cell by cell and entry by entry, like RDFData did before
+    the columns were parsed at once.
+    """
+    column_types_languages = HeaderSchema.compile(frame.columns).column_types_languages
+    cleaned, types_languages = {}, {}
+    for col_index in range(frame.shape[1]):
+        for row_index, cell in enumerate(frame.iloc[:, col_index]):
+            if pd.isnull(cell):
+                continue
+            names, tags = [], []
+            for entry in str(cell).split(";"):
+                translated = entry.translate(GREEK2LATIN)
+                tag, name = "", translated
+                if "^^" in translated:
+                    name, _, datatype = translated.rpartition("^^")
+                    tag = "^^" + datatype
+                elif "@" in translated and 1 <= len(translated.rpartition("@")[2]) <= 3:
+                    name, _, language = translated.rpartition("@")
+                    tag = "@" + language
+                names.append(name.strip())
+                tags.append(
+                    tag.strip()
+                    or column_types_languages[col_index]
+                    or RDFData._get_fitting_datatype(entry)
+                )
+            cleaned[row_index, col_index] = "; ".join(names)
+            types_languages[row_index, col_index] = tags
+    return cleaned, types_languages
+
+
+def assert_plan_equals_per_cell(rdfdata: RDFData, frame: pd.DataFrame) -> None:
+    cleaned, types_languages = parse_per_cell(frame)
+    assert dict(
+        (key, rdfdata.types_and_languages[key]) for key in rdfdata.types_and_languages
+    ) == types_languages
+    for (row_index, col_index), cell in cleaned.items():
+        assert rdfdata.data.iat[row_index, col_index] == cell
+
+
+def test_type_and_language_plan_equals_per_cell_parsing():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        rdfdata = RDFData(get_frame())
+    assert_plan_equals_per_cell(rdfdata, get_frame())
+    assert list(rdfdata.data.columns) == list(HeaderSchema.compile(get_frame().columns).column_names)
+
+
+def test_type_and_language_plan_of_arrow_columns_equals_per_cell_parsing(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "input.csv"
+    get_frame().to_csv(path, index=False)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        rdfdata = RDFData.read_csv(path, use_arrow=True)
+    assert_plan_equals_per_cell(rdfdata, pd.read_csv(path, dtype=str, keep_default_na=False).replace("", None))
+
+
+def test_unknown_language_acronym_warns():
+    with pytest.warns(UserWarning, match="abcd"):
+        RDFData(get_frame())
+
+
+def test_type_language_table_accessors():
+    table = TypeLanguageTable(4)
+    table.add_column(
+        2,
+        np.array([0, 2, 3]),
+        np.array([1, 2, 1]),
+        np.array(["@en", "@en", "@de", "^^xsd:long"], dtype=object),
+    )
+
+    assert table[0, 2] == ["@en"]
+    assert table.get(2, 2) == ["@en", "@de"]
+    assert table[3, 2] == ["^^xsd:long"]
+    assert (1, 2) not in table
+    assert (0, 1) not in table
+    assert (0, 2) in table
+    with pytest.raises(KeyError):
+        table[1, 2]
+    with pytest.raises(KeyError):
+        table[0, 5]
+    assert list(table) == [(0, 2), (2, 2), (3, 2)]
+    assert len(table) == 3
+    assert table.tags == ["@en", "@de", "^^xsd:long"]
+
+    rows = table.get_rows(2, 4)
+    assert rows.n_rows == 2
+    assert rows[0, 2] == ["@en", "@de"]
+    assert rows[1, 2] == ["^^xsd:long"]
+    assert rows.tags is table.tags
+
+
+def test_uncertainty_table_accessors():
+    table = UncertaintyTable(5)
+    uncertain = MappingProxyType({"mode": "u"})
+    alternatives = MappingProxyType({"mode": "a", "weights": (0.3, 0.7)})
+    table.add_column(1, np.array([0, 2, 3]), np.array([0, 1, 2]), [uncertain, None, alternatives])
+
+    assert table[0, 1] == {"mode": "u"}
+    assert table.get(2, 1) is None
+    assert table.get(2, 1, uncertain) is uncertain
+    assert table.get(0, 4) is None
+    assert table[3, 1]["weights"] == (0.3, 0.7)
+    with pytest.raises(KeyError):
+        table[2, 1]
+    assert (0, 1) in table
+    assert (1, 1) not in table
+    assert list(table) == [(0, 1), (3, 1)]
+    assert len(table) == 2
+
+    rows = table.get_rows(3, 5)
+    assert list(rows) == [(0, 1)]
+    assert rows[0, 1] is table[3, 1]
+
+
+def test_uncertainty_table_saves_equal_uncertainties_once():
+    table = UncertaintyTable(3)
+    table.add_column(0, np.array([0, 1]), np.array([0, 1]), [{"mode": "u"}, {"mode": "u"}])
+    table.add_column(1, np.array([2]), np.array([0]), [MappingProxyType({"mode": "u"})])
+    assert len(table.values) == 1
+
+    # The codes stay valid for uncertainties, which are added after pickling:
+    copied = pickle.loads(pickle.dumps(table))
+    assert isinstance(copied.values[0], MappingProxyType)
+    copied.add_column(2, np.array([0, 1]), np.array([0, 1]), [{"mode": "u"}, {"mode": "a"}])
+    assert len(copied.values) == 2
+    assert copied[0, 2] == copied[0, 0]
+
+
+def test_uncertainties_of_the_input():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        rdfdata = RDFData(get_frame())
+    assert list(rdfdata.uncertainties) == [(1, 1), (2, 1), (3, 1)]
+    assert rdfdata.uncertainties[1, 1] == {"mode": "a", "weights": (0.3, 0.7)}
+    assert rdfdata.uncertainties[2, 1] == {"mode": "u"}
+    assert rdfdata.uncertainties[3, 1] == {"mode": "ou", "weights": (0.6,)}
+
+
+def test_malformed_uncertainty_warns_for_every_input():
+    for _ in range(2):
+        frame = get_frame()
+        frame.iloc[0, 6] = "1.5"
+        frame.iloc[2, 5] = "plain"
+        with pytest.warns(UserWarning, match='Uncertainty "1.5" out of bounds'):
+            RDFData(frame)
+
+
+def test_header_schema_is_cached():
+    header = get_frame().columns
+    schema = HeaderSchema.compile(header)
+
+    assert HeaderSchema.compile(list(header)) is schema
+    assert HeaderSchema.compile(tuple(header)[:-1]) is not schema
+    assert pickle.loads(pickle.dumps(schema)) is schema
+    assert schema.triple_plan["**"]["objects"] == frozenset({1, 2, 3})
+    assert schema.triple_plan["1"] == {
+        "subject": frozenset({1}),
+        "objects": frozenset({4, 5}),
+        "certainties": frozenset({6}),
+    }
+    with pytest.raises(TypeError):
+        schema.triple_plan["1"]["objects"] = frozenset()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert RDFData(get_frame()).schema is schema
+
+
+def test_get_rows_keeps_the_cells_of_the_rows():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        rdfdata = RDFData(get_frame())
+    rows = rdfdata.get_rows(1, 4)
+
+    assert rows.row_offset == 1
+    assert len(rows.data) == 3
+    assert rows.data.iat[0, 1] == rdfdata.data.iat[1, 1]
+    assert rows.types_and_languages[1, 4] == ["@de"]
+    assert list(rows.uncertainties) == [(0, 1), (1, 1), (2, 1)]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from conftest import NAMESPACES, get_frame
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF, RDFS, XSD
+from rdflib.store import NO_STORE
+
+from rdfier.data.rdf_data import RDFData
+from rdfier.features.graph_generator import GraphGenerator
+from rdfier.features.namespaces import NMO
+from rdfier.features.sqlite_store import SQLiteStore
+
+COIN = URIRef("http://example.org/coin1")
+TRIPLES = [
+    (COIN, RDF.type, NMO["Coin"]),
+    (COIN, NMO["hasMaterial"], BNode("kryptonite")),
+    (COIN, NMO["hasWeight"], Literal("5.24", datatype=XSD.decimal)),
+    (COIN, RDFS.label, Literal("Münze", lang="de")),
+    (COIN, RDFS.label, Literal("coin")),
+    (BNode("kryptonite"), RDFS.label, Literal("Kryptonit", lang="de")),
+    (URIRef("http://example.org/coin2"), RDF.type, NMO["Coin"]),
+]
+
+
+def get_graph(path) -> Graph:
+    graph = Graph(store=SQLiteStore(path, batch_size=2))
+    graph.addN((*triple, graph) for triple in TRIPLES)
+    return graph
+
+
+def test_triples_of_patterns(tmp_path):
+    graph = get_graph(tmp_path / "graph.db")
+
+    assert len(graph) == len(TRIPLES)
+    assert set(graph) == set(TRIPLES)
+    assert set(graph.subjects(RDF.type, NMO["Coin"])) == {COIN, URIRef("http://example.org/coin2")}
+    assert set(graph.objects(COIN, RDFS.label)) == {Literal("Münze", lang="de"), Literal("coin")}
+    assert list(graph.objects(COIN, NMO["hasWeight"])) == [Literal("5.24", datatype=XSD.decimal)]
+    assert (BNode("kryptonite"), RDFS.label, Literal("Kryptonit", lang="de")) in graph
+    assert (COIN, RDFS.label, Literal("Münze", lang="en")) not in graph
+    # Terms, which aren't saved, match no triple:
+    assert list(graph.triples((URIRef("http://example.org/unknown"), None, None))) == []
+
+
+def test_add_is_idempotent(tmp_path):
+    graph = get_graph(tmp_path / "graph.db")
+    graph.add(TRIPLES[0])
+    graph.addN((*triple, graph) for triple in TRIPLES)
+    assert len(graph) == len(TRIPLES)
+
+
+def test_remove(tmp_path):
+    graph = get_graph(tmp_path / "graph.db")
+
+    graph.remove((COIN, RDFS.label, None))
+    assert len(graph) == len(TRIPLES) - 2
+    assert list(graph.objects(COIN, RDFS.label)) == []
+
+    graph.remove((None, RDF.type, NMO["Coin"]))
+    assert len(graph) == len(TRIPLES) - 4
+
+    graph.remove((None, None, None))
+    assert len(graph) == 0
+    graph.add(TRIPLES[0])
+    assert list(graph) == [TRIPLES[0]]
+
+
+def test_triples_persist_after_reopening(tmp_path):
+    path = tmp_path / "graph.db"
+    graph = get_graph(path)
+    graph.bind("nmo", NMO)
+    graph.close(commit_pending_transaction=True)
+
+    reopened = Graph(store=SQLiteStore(path))
+    assert set(reopened) == set(TRIPLES)
+    assert reopened.store.namespace("nmo") == URIRef(NMO)
+
+    store = SQLiteStore()
+    assert store.open(str(tmp_path / "missing.db")) == NO_STORE
+
+
+def test_generator_with_store_equals_memory_graph(tmp_path, frame):
+    generator = GraphGenerator(RDFData(frame), store=SQLiteStore(tmp_path / "graph.db"), output_folder=tmp_path)
+    generator.load_prefixes(str(NAMESPACES))
+    generator.generate_graph(output=tmp_path / "graph.ttl")
+    memory = GraphGenerator(RDFData(get_frame()), output_folder=tmp_path)
+    memory.load_prefixes(str(NAMESPACES))
+    memory.generate_graph(output=tmp_path / "memory.ttl")
+
+    assert len(generator.graph) == len(memory.graph)
+    assert isomorphic(generator.graph, memory.graph)
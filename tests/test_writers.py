@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import io
+import re
+import warnings
+
+import pytest
+from rdflib import BNode, Dataset, Graph, Literal, Namespace, URIRef
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF, XSD
+
+from rdfier.features.namespaces import EDTFO, NMO, UN
+from rdfier.features.ntriples_writer import NTriplesWriter
+from rdfier.features.quoted_triple import QuotedTriple
+from rdfier.features.triple_table import TripleTable
+from rdfier.features.turtle_writer import TurtleWriter
+
+EX = Namespace("http://example.org/")
+PREFIXES = {"nmo": str(NMO), "ex": str(EX)}
+QUOTED_TRIPLE_REGEX = re.compile(r"<< (.+?) >>")
+
+TRIPLES = [
+    (URIRef("http://example.org/coin1"), NMO["hasMaterial"], URIRef("http://example.org/silver")),
+    (URIRef("http://example.org/coin1"), NMO["hasMaterial"], BNode("kryptonite")),
+    (URIRef("http://example.org/coin1"), NMO["hasWeight"], Literal("5.24", datatype=XSD.decimal)),
+    (URIRef("http://example.org/coin1"), NMO["hasWeight"], Literal('a "quoted"\\ value\nin\rlines')),
+    (URIRef("http://example.org/coin1"), NMO["hasWeight"], Literal("tab\tand\x01control\x7fcharacters")),
+    (BNode("kryptonite"), NMO["hasName"], Literal("Kryptonit", lang="de")),
+    (URIRef("http://example.org/a(b)"), NMO["hasName"], Literal("true", datatype=XSD.boolean)),
+    (URIRef("http://other.org/coin#1"), RDF.type, NMO["Coin"]),
+]
+
+
+def write(writer_class, triples: list, table: bool = False) -> str:
+    stream = io.StringIO()
+    writer = NTriplesWriter(stream) if writer_class is NTriplesWriter else TurtleWriter(stream, PREFIXES)
+    if table:
+        triple_table = TripleTable()
+        triple_table.add_triples(triples)
+        triple_table.flush()
+        writer.add_table(triple_table)
+    else:
+        writer.add_triples(triples)
+    writer.close()
+    return stream.getvalue()
+
+
+def replace_quoted_triples(text: str) -> tuple[str, list[str]]:
+    """
+    Replaces the quoted triples of RDF-star by blank nodes, so rdflib can parse the text, and returns the texts of
+    the quoted triples.
+    """
+    quoted = QUOTED_TRIPLE_REGEX.findall(text)
+    return QUOTED_TRIPLE_REGEX.sub(lambda match: f"_:quoted{quoted.index(match.group(1))}", text), quoted
+
+
+@pytest.mark.parametrize("writer_class", [NTriplesWriter, TurtleWriter])
+@pytest.mark.parametrize("table", [False, True])
+def test_writers_produce_parseable_graphs(writer_class, table):
+    text = write(writer_class, TRIPLES, table)
+    graph = Graph().parse(data=text, format="nt" if writer_class is NTriplesWriter else "turtle")
+
+    expected = Graph()
+    for triple in TRIPLES:
+        expected.add(triple)
+    assert isomorphic(graph, expected)
+
+
+def test_ntriples_writer_writes_nquads_of_the_graph_name():
+    stream = io.StringIO()
+    writer = NTriplesWriter(stream, URIRef("http://example.org/graph"))
+    writer.add_triples(TRIPLES)
+    writer.close()
+
+    dataset = Dataset().parse(data=stream.getvalue(), format="nquads")
+    assert len(dataset.graph(URIRef("http://example.org/graph"))) == len(TRIPLES)
+
+
+@pytest.mark.parametrize("writer_class", [NTriplesWriter, TurtleWriter])
+def test_writers_escape_invalid_iris(writer_class):
+    triple = (EX["coin 2"], URIRef('http://example.org/<"weight">\\'), Literal("5", datatype=EX["{a|b}"]))
+    text = write(writer_class, [triple])
+    assert "coin 2" not in text and "<\"" not in text
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        graph = Graph().parse(data=text, format="nt" if writer_class is NTriplesWriter else "turtle")
+    assert list(graph) == [triple]
+
+
+@pytest.mark.parametrize("writer_class", [NTriplesWriter, TurtleWriter])
+@pytest.mark.parametrize("label", ["my stone", "stone.", "-stone", "stone<1>"])
+def test_writers_reject_invalid_blank_node_labels(writer_class, label):
+    with pytest.raises(ValueError, match="is not a valid blank node label"):
+        write(writer_class, [(BNode(label), RDF.type, NMO["Coin"])])
+
+
+@pytest.mark.parametrize("table", [False, True])
+def test_turtle_writer_groups_the_triples_by_subject(table):
+    text = write(TurtleWriter, TRIPLES, table)
+    subject_lines = [line for line in text.splitlines() if line and not line.startswith((" ", "@"))]
+    assert len(subject_lines) == len({subject for subject, _, _ in TRIPLES})
+
+
+@pytest.mark.parametrize("writer_class", [NTriplesWriter, TurtleWriter])
+def test_writers_produce_rdf_star(writer_class):
+    statement = QuotedTriple(URIRef("http://example.org/coin1"), NMO["hasMaterial"], BNode("kryptonite"))
+    triples = [
+        (statement, RDF.type, EDTFO["UncertainStatement"]),
+        (statement, UN["hasUncertainty"], Literal(0.25, datatype=XSD.double)),
+    ]
+    rdf_format = "nt" if writer_class is NTriplesWriter else "turtle"
+    text, quoted = replace_quoted_triples(write(writer_class, triples))
+
+    graph = Graph().parse(data=text, format=rdf_format)
+    assert set(graph.predicates()) == {RDF.type, UN["hasUncertainty"]}
+    assert len(set(graph.subjects())) == 1
+
+    prefix_lines = "".join(line + "\n" for line in text.splitlines() if line.startswith("@prefix"))
+    for quoted_triple in quoted:
+        quoted_graph = Graph().parse(data=f"{prefix_lines}{quoted_triple} .\n", format=rdf_format)
+        ((subject, predicate, objekt),) = list(quoted_graph)
+        assert (subject, predicate) == (statement.subject, statement.predicate)
+        assert isinstance(objekt, BNode)